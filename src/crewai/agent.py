@@ -1,13 +1,19 @@
 import shutil
 import subprocess
-from typing import Any, Dict, List, Literal, Optional, Sequence, Type, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.crew_agent_executor import CrewAgentExecutor
+from crewai.agents.loop_detector import (
+    AgentLoopDetectedException,
+    LoopDetector,
+    LoopIntervention,
+)
 from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.retrieval import KnowledgeRetriever
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.utils.knowledge_utils import extract_knowledge_context
 from crewai.lite_agent import LiteAgent, LiteAgentOutput
@@ -17,13 +23,19 @@ from crewai.security import Fingerprint
 from crewai.task import Task
 from crewai.tools import BaseTool
 from crewai.tools.agent_tools.agent_tools import AgentTools
+from crewai.tools.tool_index import ToolIndex
 from crewai.utilities import Converter, Prompts
 from crewai.utilities.agent_utils import (
+    ExecutorArtifacts,
     get_tool_names,
     parse_tools,
     render_text_description_and_args,
 )
-from crewai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
+from crewai.utilities.constants import (
+    EXECUTOR_ARTIFACTS_CACHE_SIZE,
+    TRAINED_AGENTS_DATA_FILE,
+    TRAINING_DATA_FILE,
+)
 from crewai.utilities.converter import generate_model_description
 from crewai.utilities.events.agent_events import (
     AgentExecutionCompletedEvent,
@@ -52,6 +64,7 @@ class Agent(BaseAgent):
             llm: The language model that will run the agent.
             function_calling_llm: The language model that will handle the tool calling for this agent, it overrides the crew function_calling_llm.
             max_iter: Maximum number of iterations for an agent to execute a task.
+            loop_intervention: What to do when the agent repeats its own tool calls: "nudge", "force_final_answer" or "abort". Loop detection is off by default (None).
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
             verbose: Whether the agent execution should be in verbose mode.
             allow_delegation: Whether the agent is allowed to delegate tasks to other agents.
@@ -62,6 +75,9 @@ class Agent(BaseAgent):
     """
 
     _times_executed: int = PrivateAttr(default=0)
+    _executor_artifacts: Dict[Tuple[Any, ...], ExecutorArtifacts] = PrivateAttr(
+        default_factory=dict
+    )
     max_execution_time: Optional[int] = Field(
         default=None,
         description="Maximum execution time for an agent to execute a task",
@@ -102,6 +118,10 @@ class Agent(BaseAgent):
         default=2,
         description="Maximum number of retries for an agent to execute a task when an error occurs.",
     )
+    loop_intervention: Optional[LoopIntervention] = Field(
+        default=None,
+        description="What to do when the agent repeats its own tool calls: 'nudge' (remind it to change approach), 'force_final_answer' or 'abort'. None, the default, disables loop detection.",
+    )
     multimodal: bool = Field(
         default=False,
         description="Whether the agent is multimodal.",
@@ -193,6 +213,7 @@ class Agent(BaseAgent):
             self.tools_handler.last_used_tool = {}  # type: ignore # Incompatible types in assignment (expression has type "dict[Never, Never]", variable has type "ToolCalling")
 
         task_prompt = task.prompt()
+        knowledge_query = task_prompt
 
         # If the task requires output in JSON or Pydantic format,
         # append specific instructions to the task prompt to ensure
@@ -230,21 +251,19 @@ class Agent(BaseAgent):
             if memory.strip() != "":
                 task_prompt += self.i18n.slice("memory").format(memory=memory)
 
-        if self.knowledge:
-            agent_knowledge_snippets = self.knowledge.query([task.prompt()])
-            if agent_knowledge_snippets:
-                agent_knowledge_context = extract_knowledge_context(
-                    agent_knowledge_snippets
-                )
-                if agent_knowledge_context:
-                    task_prompt += agent_knowledge_context
-
-        if self.crew:
-            knowledge_snippets = self.crew.query_knowledge([task.prompt()])
+        crew_knowledge = self.crew.knowledge if self.crew else None
+        if self.knowledge or crew_knowledge:
+            # The crew's retriever memoizes results for the whole kickoff
+            retriever = (
+                self.crew._knowledge_retriever if self.crew else KnowledgeRetriever()
+            )
+            knowledge_snippets = retriever.retrieve(
+                knowledge_query, [self.knowledge, crew_knowledge]
+            )
             if knowledge_snippets:
-                crew_knowledge_context = extract_knowledge_context(knowledge_snippets)
-                if crew_knowledge_context:
-                    task_prompt += crew_knowledge_context
+                knowledge_context = extract_knowledge_context(knowledge_snippets)
+                if knowledge_context:
+                    task_prompt += knowledge_context
 
         tools = tools or self.tools or []
         self.create_agent_executor(tools=tools, task=task)
@@ -273,8 +292,10 @@ class Agent(BaseAgent):
                 }
             )["output"]
         except Exception as e:
-            if e.__class__.__module__.startswith("litellm"):
-                # Do not retry on litellm errors
+            if e.__class__.__module__.startswith("litellm") or isinstance(
+                e, AgentLoopDetectedException
+            ):
+                # Do not retry on litellm errors or on a looping agent
                 crewai_event_bus.emit(
                     self,
                     event=AgentExecutionErrorEvent(
@@ -317,10 +338,60 @@ class Agent(BaseAgent):
     ) -> None:
         """Create an agent executor for the agent.
 
+        Parsed tools, prompts and tool descriptions are cached per tool set and
+        prompt configuration, so only the per-task state of the executor
+        (messages, iterations) is built from scratch on every call.
+
         Returns:
             An instance of the CrewAgentExecutor class.
         """
         raw_tools: List[BaseTool] = tools or self.tools or []
+        artifacts = self._get_executor_artifacts(raw_tools)
+
+        self.agent_executor = CrewAgentExecutor(
+            llm=self.llm,
+            task=task,
+            agent=self,
+            crew=self.crew,
+            tools=artifacts.parsed_tools,
+            prompt=artifacts.prompt,
+            original_tools=raw_tools,
+            stop_words=artifacts.stop_words,
+            max_iter=self.max_iter,
+            tools_handler=self.tools_handler,
+            tools_names=artifacts.tools_names,
+            tools_description=artifacts.tools_description,
+            step_callback=self.step_callback,
+            function_calling_llm=self.function_calling_llm,
+            respect_context_window=self.respect_context_window,
+            request_within_rpm_limit=(
+                self._rpm_controller.check_or_wait if self._rpm_controller else None
+            ),
+            callbacks=[TokenCalcHandler(self._token_process)],
+            tool_index=artifacts.tool_index,
+            loop_detector=(
+                LoopDetector(intervention=self.loop_intervention)
+                if self.loop_intervention
+                else None
+            ),
+        )
+
+    def _get_executor_artifacts(self, raw_tools: List[BaseTool]) -> ExecutorArtifacts:
+        """Return the cached executor artifacts for a tool set, building them if needed."""
+        key = (
+            tuple((id(tool), tool.name, tool.description) for tool in raw_tools),
+            self.role,
+            self.goal,
+            self.backstory,
+            self.use_system_prompt,
+            self.system_template,
+            self.prompt_template,
+            self.response_template,
+            self.i18n.prompt_file,
+        )
+        if artifacts := self._executor_artifacts.get(key):
+            return artifacts
+
         parsed_tools = parse_tools(raw_tools)
 
         prompt = Prompts(
@@ -340,28 +411,22 @@ class Agent(BaseAgent):
                 self.response_template.split("{{ .Response }}")[1].strip()
             )
 
-        self.agent_executor = CrewAgentExecutor(
-            llm=self.llm,
-            task=task,
-            agent=self,
-            crew=self.crew,
-            tools=parsed_tools,
+        artifacts = ExecutorArtifacts(
+            raw_tools=list(raw_tools),
+            parsed_tools=parsed_tools,
             prompt=prompt,
-            original_tools=raw_tools,
             stop_words=stop_words,
-            max_iter=self.max_iter,
-            tools_handler=self.tools_handler,
             tools_names=get_tool_names(parsed_tools),
             tools_description=render_text_description_and_args(parsed_tools),
-            step_callback=self.step_callback,
-            function_calling_llm=self.function_calling_llm,
-            respect_context_window=self.respect_context_window,
-            request_within_rpm_limit=(
-                self._rpm_controller.check_or_wait if self._rpm_controller else None
-            ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            tool_index=ToolIndex(parsed_tools),
         )
 
+        # Keep the cache small: each kickoff or delegation may bring a new tool set.
+        if len(self._executor_artifacts) >= EXECUTOR_ARTIFACTS_CACHE_SIZE:
+            self._executor_artifacts.pop(next(iter(self._executor_artifacts)))
+        self._executor_artifacts[key] = artifacts
+        return artifacts
+
     def get_delegation_tools(self, agents: List[BaseAgent]):
         agent_tools = AgentTools(agents=agents)
         tools = agent_tools.tools()
@@ -1,5 +1,6 @@
 from .cache.cache_handler import CacheHandler
+from .cache.sqlite_cache_handler import SQLiteCacheHandler
 from .parser import CrewAgentParser
 from .tools_handler import ToolsHandler
 
-__all__ = ["CacheHandler", "CrewAgentParser", "ToolsHandler"]
+__all__ = ["CacheHandler", "CrewAgentParser", "SQLiteCacheHandler", "ToolsHandler"]
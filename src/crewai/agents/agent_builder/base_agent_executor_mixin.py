@@ -1,8 +1,10 @@
 import time
+from functools import partial
 from typing import TYPE_CHECKING
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.memory_pipeline import MemoryPipeline
 from crewai.utilities import I18N
 from crewai.utilities.converter import ConverterError
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -69,7 +71,11 @@ class CrewAgentExecutorMixin:
                 pass
 
     def _create_long_term_memory(self, output) -> None:
-        """Create and save long-term and entity memory items based on evaluation."""
+        """Create and save long-term and entity memory items based on evaluation.
+
+        The evaluation runs on the crew's memory pipeline when it has one, so
+        the agent does not wait for it.
+        """
         if (
             self.crew
             and self.crew._long_term_memory
@@ -77,36 +83,19 @@ class CrewAgentExecutorMixin:
             and self.task
             and self.agent
         ):
+            job = partial(
+                self._save_long_term_memory,
+                self.crew,
+                self.task,
+                self.agent,
+                output.text,
+            )
+            pipeline = getattr(self.crew, "memory_pipeline", None)
+            if isinstance(pipeline, MemoryPipeline):
+                pipeline.submit(job, name="long term memory evaluation")
+                return
             try:
-                ltm_agent = TaskEvaluator(self.agent)
-                evaluation = ltm_agent.evaluate(self.task, output.text)
-
-                if isinstance(evaluation, ConverterError):
-                    return
-
-                long_term_memory = LongTermMemoryItem(
-                    task=self.task.description,
-                    agent=self.agent.role,
-                    quality=evaluation.quality,
-                    datetime=str(time.time()),
-                    expected_output=self.task.expected_output,
-                    metadata={
-                        "suggestions": evaluation.suggestions,
-                        "quality": evaluation.quality,
-                    },
-                )
-                self.crew._long_term_memory.save(long_term_memory)
-
-                for entity in evaluation.entities:
-                    entity_memory = EntityMemoryItem(
-                        name=entity.name,
-                        type=entity.type,
-                        description=entity.description,
-                        relationships="\n".join(
-                            [f"- {r}" for r in entity.relationships]
-                        ),
-                    )
-                    self.crew._entity_memory.save(entity_memory)
+                job()
             except AttributeError as e:
                 print(f"Missing attributes for long term memory: {e}")
                 pass
@@ -123,6 +112,38 @@ class CrewAgentExecutorMixin:
                 color="bold_yellow",
             )
 
+    @staticmethod
+    def _save_long_term_memory(
+        crew: "Crew", task: "Task", agent: "BaseAgent", output: str
+    ) -> None:
+        ltm_agent = TaskEvaluator(agent)
+        evaluation = ltm_agent.evaluate(task, output)
+
+        if isinstance(evaluation, ConverterError):
+            return
+
+        long_term_memory = LongTermMemoryItem(
+            task=task.description,
+            agent=agent.role,
+            quality=evaluation.quality,
+            datetime=str(time.time()),
+            expected_output=task.expected_output,
+            metadata={
+                "suggestions": evaluation.suggestions,
+                "quality": evaluation.quality,
+            },
+        )
+        crew._long_term_memory.save(long_term_memory)
+
+        for entity in evaluation.entities:
+            entity_memory = EntityMemoryItem(
+                name=entity.name,
+                type=entity.type,
+                description=entity.description,
+                relationships="\n".join([f"- {r}" for r in entity.relationships]),
+            )
+            crew._entity_memory.save(entity_memory)
+
     def _ask_human_input(self, final_answer: str) -> str:
         """Prompt human input with mode-appropriate messaging."""
         self._printer.print(
@@ -1,3 +1,4 @@
 from .cache_handler import CacheHandler
+from .sqlite_cache_handler import SQLiteCacheHandler
 
-__all__ = ["CacheHandler"]
+__all__ = ["CacheHandler", "SQLiteCacheHandler"]
@@ -1,15 +1,141 @@
-from typing import Any, Dict, Optional
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Tuple
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
+
+from crewai.utilities.constants import TOOL_CACHE_MAX_SIZE
+from crewai.utilities.tolerant_json import TolerantJSONParseError, parse_tolerant_json
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a tool cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    output: Any
+    expires_at: Optional[float]
+
+
+def canonical_tool_input(input: Any) -> str:
+    """Return a canonical JSON representation of tool arguments.
+
+    Arguments that only differ in key order, whitespace or quoting style map
+    to the same string. Strings are parsed leniently first so that Python
+    reprs (as produced by the cache tool) match the original dictionaries.
+    """
+    if isinstance(input, str):
+        try:
+            input = parse_tolerant_json(input).value
+        except TolerantJSONParseError:
+            input = input.strip()
+    try:
+        return json.dumps(
+            input,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+    except (TypeError, ValueError):
+        return repr(input)
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """Bounded, thread-safe cache for tool results.
+
+    Entries are keyed by tool name and canonicalized arguments, evicted in
+    least-recently-used order once `max_size` is reached, and dropped on read
+    once their time-to-live has elapsed.
+    """
+
+    max_size: Optional[int] = Field(
+        default=TOOL_CACHE_MAX_SIZE,
+        description="Maximum number of cached results, None for no limit.",
+    )
+    default_ttl: Optional[float] = Field(
+        default=None,
+        description="Seconds a result stays valid when the tool sets no TTL, None to never expire.",
+    )
+
+    _cache: "OrderedDict[CacheKey, _CacheEntry]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _stats: CacheStats = PrivateAttr(default_factory=CacheStats)
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the hit, miss, eviction and expiration counters."""
+        with self._lock:
+            return replace(self._stats)
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    @property
+    def size(self) -> int:
+        """Number of results currently cached."""
+        with self._lock:
+            return len(self._cache)
 
-    def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+    def add(self, tool, input, output, ttl: Optional[float] = None):
+        """Store a tool result.
+
+        Args:
+            tool: Name of the tool.
+            input: Arguments the tool was called with.
+            output: The tool result.
+            ttl: Seconds the result stays valid. Falls back to `default_ttl`.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        key = (tool, canonical_tool_input(input))
+
+        with self._lock:
+            self._cache[key] = _CacheEntry(output=output, expires_at=expires_at)
+            self._cache.move_to_end(key)
+            while self.max_size is not None and len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._stats.evictions += 1
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        """Return the cached result for a tool call, or None on a miss."""
+        key = (tool, canonical_tool_input(input))
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and (
+                entry.expires_at is not None and entry.expires_at <= time.monotonic()
+            ):
+                del self._cache[key]
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._stats.hits += 1
+            return entry.output
+
+    def clear(self) -> None:
+        """Remove every cached result and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._stats = CacheStats()
@@ -0,0 +1,230 @@
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from pydantic import Field, PrivateAttr
+
+from crewai.agents.cache.cache_handler import (
+    CacheHandler,
+    CacheStats,
+    canonical_tool_input,
+)
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS tool_cache (
+        namespace TEXT NOT NULL,
+        tool TEXT NOT NULL,
+        input TEXT NOT NULL,
+        output TEXT NOT NULL,
+        expires_at REAL,
+        last_access REAL NOT NULL,
+        PRIMARY KEY (namespace, tool, input)
+    );
+    CREATE INDEX IF NOT EXISTS idx_tool_cache_last_access
+    ON tool_cache (namespace, last_access);
+    """,
+]
+
+_EntryKey = Tuple[str, str]
+
+
+class SQLiteCacheHandler(CacheHandler):
+    """Tool result cache persisted in a SQLite database.
+
+    Results survive across kickoffs and are shared by every crew and process
+    pointing at the same database file. Connections come from the shared
+    SQLite pool of the file, which runs in WAL mode so readers never block
+    the writer. Entries are scoped by `namespace`, so unrelated crews
+    sharing a file do not see each other's results.
+
+    Reads never write: the last access of the results read, used to evict
+    the least recently used results, and the removal of expired results
+    are deferred to the next `add` transaction.
+
+    Outputs are stored as JSON; results that are not JSON serializable are
+    stored as their string representation. Storage errors are logged and
+    treated as cache misses, so a broken cache never fails a tool call.
+    """
+
+    db_path: Optional[str] = Field(
+        default=None,
+        description="Path of the SQLite database, defaults to tool_cache.db in the CrewAI data directory.",
+    )
+    namespace: str = Field(
+        default="default",
+        description="Namespace isolating this cache's entries from other users of the same database.",
+    )
+    busy_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for another process to release a database lock, "
+        "for the first user of the database file in this process.",
+    )
+
+    _pool: Optional[SQLiteConnectionPool] = PrivateAttr(default=None)
+    _accessed: Dict[_EntryKey, float] = PrivateAttr(default_factory=dict)
+    _expired: Set[_EntryKey] = PrivateAttr(default_factory=set)
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.db_path is None:
+            self.db_path = str(Path(db_storage_path()) / "tool_cache.db")
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        super().model_post_init(__context)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._pool is None:
+            self._pool = get_sqlite_pool(
+                self.db_path,  # type: ignore[arg-type]
+                MIGRATIONS,
+                self.busy_timeout,
+            )
+        return self._pool.connection()
+
+    def add(self, tool, input, output, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        try:
+            serialized = json.dumps(output)
+        except (TypeError, ValueError):
+            serialized = json.dumps(str(output))
+
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+            expired, self._expired = self._expired, set()
+            try:
+                conn = self._connect()
+                with conn:
+                    if expired:
+                        conn.executemany(
+                            """
+                            DELETE FROM tool_cache
+                            WHERE namespace = ? AND tool = ? AND input = ?
+                            AND expires_at <= ?
+                            """,
+                            [(self.namespace, *key, now) for key in expired],
+                        )
+                    if accessed:
+                        conn.executemany(
+                            """
+                            UPDATE tool_cache SET last_access = ?
+                            WHERE namespace = ? AND tool = ? AND input = ?
+                            """,
+                            [
+                                (at, self.namespace, *key)
+                                for key, at in accessed.items()
+                            ],
+                        )
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO tool_cache
+                        (namespace, tool, input, output, expires_at, last_access)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            self.namespace,
+                            tool,
+                            canonical_tool_input(input),
+                            serialized,
+                            expires_at,
+                            now,
+                        ),
+                    )
+                    if self.max_size is not None:
+                        evicted = conn.execute(
+                            """
+                            DELETE FROM tool_cache
+                            WHERE namespace = ? AND rowid IN (
+                                SELECT rowid FROM tool_cache WHERE namespace = ?
+                                ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                            )
+                            """,
+                            (self.namespace, self.namespace, self.max_size),
+                        ).rowcount
+                        self._stats.evictions += max(evicted, 0)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to write to the tool cache: {e}")
+
+    def read(self, tool, input) -> Optional[str]:
+        key = (tool, canonical_tool_input(input))
+        now = time.time()
+
+        with self._lock:
+            try:
+                row = (
+                    self._connect()
+                    .execute(
+                        """
+                        SELECT output, expires_at FROM tool_cache
+                        WHERE namespace = ? AND tool = ? AND input = ?
+                        """,
+                        (self.namespace, *key),
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read from the tool cache: {e}")
+                self._stats.misses += 1
+                return None
+            if row is not None and row[1] is not None and row[1] <= now:
+                self._expired.add(key)
+                self._accessed.pop(key, None)
+                self._stats.expirations += 1
+                row = None
+            if row is None:
+                self._stats.misses += 1
+                return None
+            if self.max_size is not None:
+                # Recency only matters for eviction, skip tracking otherwise
+                self._accessed[key] = now
+            self._stats.hits += 1
+            return json.loads(row[0])
+
+    @property
+    def size(self) -> int:
+        """Number of results in this namespace that have not expired."""
+        with self._lock:
+            try:
+                return (
+                    self._connect()
+                    .execute(
+                        "SELECT COUNT(*) FROM tool_cache WHERE namespace = ? "
+                        "AND (expires_at IS NULL OR expires_at > ?)",
+                        (self.namespace, time.time()),
+                    )
+                    .fetchone()[0]
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read from the tool cache: {e}")
+                return 0
+
+    def clear(self) -> None:
+        """Remove every result in this namespace and reset the counters."""
+        with self._lock:
+            self._accessed, self._expired = {}, set()
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "DELETE FROM tool_cache WHERE namespace = ?", (self.namespace,)
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear the tool cache: {e}")
+            self._stats = CacheStats()
+
+    def close(self) -> None:
+        """Release the connection pool, it is reacquired on next use.
+
+        The pool is shared with the other users of the database file, and
+        closes its connections once none of them holds it.
+        """
+        with self._lock:
+            self._pool = None
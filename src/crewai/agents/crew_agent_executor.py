@@ -4,6 +4,11 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
+from crewai.agents.loop_detector import (
+    AgentLoopDetectedException,
+    LoopDetection,
+    LoopDetector,
+)
 from crewai.agents.parser import (
     AgentAction,
     AgentFinish,
@@ -13,6 +18,7 @@ from crewai.agents.tools_handler import ToolsHandler
 from crewai.llm import BaseLLM
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_index import ToolIndex
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
 from crewai.utilities.agent_utils import (
@@ -30,7 +36,10 @@ from crewai.utilities.agent_utils import (
     show_agent_logs,
 )
 from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.agent_events import AgentLoopDetectedEvent
 from crewai.utilities.logger import Logger
+from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.tool_utils import execute_tool_and_check_finality
 from crewai.utilities.training_handler import CrewTrainingHandler
 
@@ -57,6 +66,8 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         respect_context_window: bool = False,
         request_within_rpm_limit: Optional[Callable[[], bool]] = None,
         callbacks: List[Any] = [],
+        tool_index: Optional[ToolIndex] = None,
+        loop_detector: Optional[LoopDetector] = None,
     ):
         self._i18n: I18N = I18N()
         self.llm: BaseLLM = llm
@@ -82,9 +93,11 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.messages: List[Dict[str, str]] = []
         self.iterations = 0
         self.log_error_after = 3
-        self.tool_name_to_tool_map: Dict[str, Union[CrewStructuredTool, BaseTool]] = {
-            tool.name: tool for tool in self.tools
-        }
+        self.tool_index = tool_index if tool_index is not None else ToolIndex(tools)
+        self.tool_name_to_tool_map: Dict[str, Union[CrewStructuredTool, BaseTool]] = (
+            self.tool_index.by_name
+        )
+        self.loop_detector = loop_detector
         existing_stop = self.llm.stop or []
         self.llm.stop = list(
             set(
@@ -139,6 +152,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         """
         formatted_answer = None
         while not isinstance(formatted_answer, AgentFinish):
+            tokens_before_step = self._total_tokens()
             try:
                 if has_reached_max_iterations(self.iterations, self.max_iter):
                     formatted_answer = handle_max_iterations_exceeded(
@@ -185,6 +199,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                         task=self.task,
                         agent=self.agent,
                         function_calling_llm=self.function_calling_llm,
+                        tools_description=self.tools_description,
+                        tools_names=self.tools_names,
+                        tool_index=self.tool_index,
+                        default_tool_timeout=getattr(self.crew, "tool_timeout", None),
                     )
                     formatted_answer = self._handle_agent_action(
                         formatted_answer, tool_result
@@ -193,6 +211,11 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                 self._invoke_step_callback(formatted_answer)
                 self._append_message(formatted_answer.text, role="assistant")
 
+                if isinstance(formatted_answer, AgentAction):
+                    formatted_answer = self._check_for_loop(
+                        formatted_answer, self._total_tokens() - tokens_before_step
+                    )
+
             except OutputParserException as e:
                 formatted_answer = handle_output_parser_exception(
                     e=e,
@@ -252,6 +275,62 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             show_logs=self._show_logs,
         )
 
+    def _total_tokens(self) -> int:
+        for callback in self.callbacks:
+            if isinstance(callback, TokenCalcHandler) and callback.token_cost_process:
+                return callback.token_cost_process.total_tokens
+        return 0
+
+    def _check_for_loop(
+        self, formatted_answer: AgentAction, step_tokens: int
+    ) -> Union[AgentAction, AgentFinish]:
+        """Record a tool step and intervene if the agent is going in circles."""
+        if not self.loop_detector:
+            return formatted_answer
+
+        detection = self.loop_detector.record(formatted_answer, tokens=step_tokens)
+        if detection is None:
+            return formatted_answer
+
+        intervention = self.loop_detector.intervention
+        self._emit_loop_detected(detection, intervention)
+
+        if intervention == "abort":
+            raise AgentLoopDetectedException(detection)
+        if intervention == "force_final_answer":
+            return handle_max_iterations_exceeded(
+                formatted_answer,
+                printer=self._printer,
+                i18n=self._i18n,
+                messages=self.messages,
+                llm=self.llm,
+                callbacks=self.callbacks,
+            )
+
+        self._append_message(self._i18n.errors("loop_detected"), role="user")
+        return formatted_answer
+
+    def _emit_loop_detected(self, detection: LoopDetection, intervention: str) -> None:
+        if self.agent and self.agent.verbose:
+            self._printer.print(
+                content=f"Loop detected ({detection.kind}), {detection.repeated_steps} repeated steps. Intervention: {intervention}",
+                color="yellow",
+            )
+        crewai_event_bus.emit(
+            self,
+            AgentLoopDetectedEvent(
+                agent_role=str(getattr(self.agent, "role", "unknown")),
+                kind=detection.kind,
+                period=detection.period,
+                repeated_steps=detection.repeated_steps,
+                wasted_tokens=detection.wasted_tokens,
+                total_wasted_tokens=self.loop_detector.wasted_tokens,  # type: ignore[union-attr]
+                intervention=intervention,
+                task=self.task,
+                agent=self.agent,
+            ),
+        )
+
     def _invoke_step_callback(self, formatted_answer) -> None:
         """Invoke the step callback if it exists."""
         if self.step_callback:
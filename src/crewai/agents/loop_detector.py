@@ -0,0 +1,166 @@
+import hashlib
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import List, Literal, Optional, Set
+
+from crewai.agents.cache.cache_handler import canonical_tool_input
+from crewai.agents.parser import AgentAction
+from crewai.tools.tool_index import normalize_tool_name
+
+LoopIntervention = Literal["nudge", "force_final_answer", "abort"]
+
+LOOP_MAX_CYCLE_LENGTH = 3
+LOOP_MIN_REPEATS = 2
+LOOP_SIMILARITY_THRESHOLD = 0.9
+LOOP_SIMILARITY_WINDOW = 6
+LOOP_MIN_THOUGHT_LENGTH = 20
+
+
+class AgentLoopDetectedException(Exception):
+    """Raised when an agent keeps looping and the intervention is to abort."""
+
+    def __init__(self, detection: "LoopDetection") -> None:
+        self.detection = detection
+        super().__init__(
+            f"Agent is stuck in a loop ({detection.kind}, "
+            f"{detection.repeated_steps} repeated steps)"
+        )
+
+
+@dataclass
+class LoopDetection:
+    """A loop found in an agent's step history.
+
+    Attributes:
+        kind: "cycle" when a block of identical tool calls repeats back to
+            back (A→A or A→B→A→B), "near_duplicate" when the agent re-issues
+            an almost identical call with an almost identical thought.
+        period: Number of steps in the repeating block.
+        repeated_steps: Steps that only repeated earlier work.
+        wasted_tokens: Tokens spent on the repeated steps.
+    """
+
+    kind: Literal["cycle", "near_duplicate"]
+    period: int
+    repeated_steps: int
+    wasted_tokens: int
+
+
+@dataclass
+class _Step:
+    signature: str
+    tool: str
+    arguments: str
+    thought: str
+    tokens: int
+
+
+class LoopDetector:
+    """Detects agents going in circles over their whole step history.
+
+    Each tool step is reduced to a hash of the normalized tool name and the
+    canonical JSON of its arguments. A loop is reported when the most recent
+    steps are a block of one to `max_cycle_length` hashes repeated
+    `min_repeats` times in a row, or when the latest step repeats a recent
+    one with near-identical arguments and thought.
+
+    Attributes:
+        intervention: What the executor should do when a loop is found.
+        wasted_tokens: Tokens spent on repeated steps so far.
+        detections: Every loop found so far.
+    """
+
+    def __init__(
+        self,
+        intervention: LoopIntervention = "nudge",
+        max_cycle_length: int = LOOP_MAX_CYCLE_LENGTH,
+        min_repeats: int = LOOP_MIN_REPEATS,
+        similarity_threshold: float = LOOP_SIMILARITY_THRESHOLD,
+        similarity_window: int = LOOP_SIMILARITY_WINDOW,
+    ) -> None:
+        self.intervention = intervention
+        self.max_cycle_length = max_cycle_length
+        self.min_repeats = min_repeats
+        self.similarity_threshold = similarity_threshold
+        self.similarity_window = similarity_window
+        self.wasted_tokens = 0
+        self.detections: List[LoopDetection] = []
+        self._steps: List[_Step] = []
+        self._wasted: Set[int] = set()
+
+    def record(self, action: AgentAction, tokens: int = 0) -> Optional[LoopDetection]:
+        """Add a tool step to the history and check it for loops.
+
+        Args:
+            action: The action the agent took.
+            tokens: Tokens spent on the step.
+
+        Returns:
+            The loop the step completes, or None.
+        """
+        tool = normalize_tool_name(action.tool)
+        arguments = canonical_tool_input(action.tool_input)
+        signature = hashlib.sha256(f"{tool}\x00{arguments}".encode()).hexdigest()
+        self._steps.append(
+            _Step(
+                signature=signature,
+                tool=tool,
+                arguments=arguments,
+                thought=" ".join(action.thought.split()).casefold(),
+                tokens=tokens,
+            )
+        )
+
+        detection = self._detect_cycle() or self._detect_near_duplicate()
+        if detection:
+            self.detections.append(detection)
+        return detection
+
+    def _mark_wasted(self, indexes: range) -> int:
+        tokens = 0
+        for index in indexes:
+            if index not in self._wasted:
+                self._wasted.add(index)
+                tokens += self._steps[index].tokens
+        self.wasted_tokens += tokens
+        return tokens
+
+    def _detect_cycle(self) -> Optional[LoopDetection]:
+        signatures = [step.signature for step in self._steps]
+        for period in range(1, self.max_cycle_length + 1):
+            span = period * self.min_repeats
+            if len(signatures) < span:
+                break
+            block = signatures[-period:]
+            if signatures[-span:] == block * self.min_repeats:
+                repeated = range(len(signatures) - span + period, len(signatures))
+                return LoopDetection(
+                    kind="cycle",
+                    period=period,
+                    repeated_steps=len(repeated),
+                    wasted_tokens=self._mark_wasted(repeated),
+                )
+        return None
+
+    def _detect_near_duplicate(self) -> Optional[LoopDetection]:
+        latest = self._steps[-1]
+        if len(latest.thought) < LOOP_MIN_THOUGHT_LENGTH:
+            return None
+        earlier = self._steps[-self.similarity_window - 1 : -1]
+        for distance, step in enumerate(reversed(earlier), start=1):
+            if (
+                step.tool == latest.tool
+                and self._similar(step.arguments, latest.arguments)
+                and self._similar(step.thought, latest.thought)
+            ):
+                last = len(self._steps) - 1
+                return LoopDetection(
+                    kind="near_duplicate",
+                    period=distance,
+                    repeated_steps=1,
+                    wasted_tokens=self._mark_wasted(range(last, last + 1)),
+                )
+        return None
+
+    def _similar(self, a: str, b: str) -> bool:
+        return SequenceMatcher(None, a, b).ratio() >= self.similarity_threshold
@@ -13,6 +13,7 @@ from crewai.memory.storage.kickoff_task_outputs_storage import (
 )
 
 from .authentication.main import AuthenticationCommand
+from .compact_memories_command import compact_memories_command
 from .deploy.main import DeployCommand
 from .evaluate_crew import evaluate_crew
 from .install_crew import install_crew
@@ -315,6 +316,23 @@ def tool_publish(is_public: bool, force: bool):
     tool_cmd.publish(is_public, force)
 
 
+@crewai.group()
+def memory():
+    """Memory related commands."""
+    pass
+
+
+@memory.command(name="compact")
+@click.option("-l", "--long", is_flag=True, help="Compact LONG TERM memory")
+@click.option("-s", "--short", is_flag=True, help="Compact SHORT TERM memory")
+@click.option("-e", "--entities", is_flag=True, help="Compact ENTITIES memory")
+def memory_compact(long: bool, short: bool, entities: bool) -> None:
+    """
+    Deduplicate, prune and vacuum the crew memories (all of them unless types are given).
+    """
+    compact_memories_command(long, short, entities)
+
+
 @crewai.group()
 def flow():
     """Flow related commands."""
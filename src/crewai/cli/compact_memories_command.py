@@ -0,0 +1,50 @@
+import click
+
+from crewai.cli.utils import get_crew
+
+
+def compact_memories_command(long: bool, short: bool, entity: bool) -> None:
+    """
+    Compact the crew memories.
+
+    Applies the retention policies, removes duplicate entries, merges
+    near-duplicate entities and vacuums the underlying stores. Compacts every
+    memory when no type is selected.
+
+    Args:
+      long (bool): Whether to compact the long-term memory.
+      short (bool): Whether to compact the short-term memory.
+      entity (bool): Whether to compact the entity memory.
+    """
+
+    try:
+        crew = get_crew()
+        if not crew:
+            raise ValueError("No crew found.")
+
+        selected = [
+            command_type
+            for command_type, flag in (
+                ("long", long),
+                ("short", short),
+                ("entity", entity),
+            )
+            if flag
+        ] or ["all"]
+
+        for command_type in selected:
+            for memory_type, stats in crew.compact_memories(command_type).items():
+                if stats is None:
+                    click.echo(
+                        f"{memory_type.capitalize()} memory does not support compaction."
+                    )
+                    continue
+                click.echo(
+                    f"{memory_type.capitalize()} memory compacted: removed "
+                    f"{stats.duplicates} duplicates, merged {stats.merged}, "
+                    f"expired {stats.expired}, evicted {stats.evicted}; "
+                    f"{stats.remaining} entries left."
+                )
+
+    except Exception as e:
+        click.echo(f"An unexpected error occurred: {e}", err=True)
@@ -6,7 +6,18 @@ import warnings
 from concurrent.futures import Future
 from copy import copy as shallow_copy
 from hashlib import md5
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from pydantic import (
     UUID4,
@@ -25,11 +36,14 @@ from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.cache import CacheHandler
 from crewai.crews.crew_output import CrewOutput
 from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.retrieval import KnowledgeRetriever
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.llm import LLM, BaseLLM
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.external.external_memory import ExternalMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.memory_pipeline import MemoryPipeline
+from crewai.memory.retention import CompactionStats
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.memory.user.user_memory import UserMemory
 from crewai.process import Process
@@ -64,6 +78,7 @@ from crewai.utilities.formatter import (
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.planning_handler import CrewPlanner
 from crewai.utilities.task_output_storage_handler import TaskOutputStorageHandler
+from crewai.utilities.tool_utils import run_with_async_tools
 from crewai.utilities.training_handler import CrewTrainingHandler
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -80,7 +95,10 @@ class Crew(BaseModel):
         manager_agent: Custom agent that will be used as manager.
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
+        memory_write_mode: How long-term and entity memories are evaluated and saved: "sync" inline, "background" on worker threads flushed before kickoff returns, or "async" on worker threads without waiting (see flush_memory).
         cache: Whether the crew should use a cache to store the results of the tools execution.
+        cache_handler: Cache used for tool results, e.g. a SQLiteCacheHandler shared across crews. Defaults to an in-memory cache per crew.
+        tool_timeout: Default timeout in seconds for tool executions, overridden by a tool's own timeout.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the crew will follow (e.g., sequential, hierarchical).
         verbose: Indicates the verbosity level for logging during execution.
@@ -101,12 +119,13 @@ class Crew(BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
     _user_memory: Optional[InstanceOf[UserMemory]] = PrivateAttr()
     _external_memory: Optional[InstanceOf[ExternalMemory]] = PrivateAttr()
+    _memory_pipeline: Optional[MemoryPipeline] = PrivateAttr(default=None)
     _train: Optional[bool] = PrivateAttr(default=False)
     _train_iteration: Optional[int] = PrivateAttr()
     _inputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)
@@ -116,9 +135,20 @@ class Crew(BaseModel):
     _task_output_handler: TaskOutputStorageHandler = PrivateAttr(
         default_factory=TaskOutputStorageHandler
     )
+    _knowledge_retriever: KnowledgeRetriever = PrivateAttr(
+        default_factory=KnowledgeRetriever
+    )
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Cache used for tool results, shared by the crew's copies. Defaults to an in-memory cache.",
+    )
+    tool_timeout: Optional[float] = Field(
+        default=None,
+        description="Default timeout in seconds for tool executions, overridden by a tool's own timeout.",
+    )
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
@@ -131,6 +161,10 @@ class Crew(BaseModel):
         default=None,
         description="Configuration for the memory to be used for the crew.",
     )
+    memory_write_mode: Literal["sync", "background", "async"] = Field(
+        default="background",
+        description="How long-term and entity memories are evaluated and saved: 'sync' inline, 'background' on worker threads flushed before kickoff returns, 'async' on worker threads without waiting.",
+    )
     short_term_memory: Optional[InstanceOf[ShortTermMemory]] = Field(
         default=None,
         description="An Instance of the ShortTermMemory to be used by the Crew",
@@ -262,7 +296,7 @@ class Crew(BaseModel):
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
 
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         event_listener = EventListener()
         event_listener.verbose = self.verbose
         event_listener.formatter.verbose = self.verbose
@@ -290,7 +324,10 @@ class Crew(BaseModel):
                 raise TypeError("user_memory must be a configuration dictionary")
 
     def _initialize_default_memories(self):
-        self._long_term_memory = self._long_term_memory or LongTermMemory()
+        self._long_term_memory = self._long_term_memory or LongTermMemory(
+            crew=self,
+            embedder_config=self.embedder,
+        )
         self._short_term_memory = self._short_term_memory or ShortTermMemory(
             crew=self,
             embedder_config=self.embedder,
@@ -619,6 +656,7 @@ class Crew(BaseModel):
 
             # Starts the crew to work on its assigned tasks.
             self._task_output_handler.reset()
+            self._knowledge_retriever.clear()
             self._logging_color = "bold_purple"
 
             if inputs is not None:
@@ -647,14 +685,19 @@ class Crew(BaseModel):
 
             metrics: List[UsageMetrics] = []
 
-            if self.process == Process.sequential:
-                result = self._run_sequential_process()
-            elif self.process == Process.hierarchical:
-                result = self._run_hierarchical_process()
-            else:
-                raise NotImplementedError(
-                    f"The process '{self.process}' is not implemented yet."
-                )
+            try:
+                if self.process == Process.sequential:
+                    result = self._run_sequential_process()
+                elif self.process == Process.hierarchical:
+                    result = self._run_hierarchical_process()
+                else:
+                    raise NotImplementedError(
+                        f"The process '{self.process}' is not implemented yet."
+                    )
+            except Exception:
+                # Memory evaluations of a failed kickoff must not outlive it
+                self._finish_memory_writes(wait=True)
+                raise
 
             for after_callback in self.after_kickoff_callbacks:
                 result = after_callback(result)
@@ -695,7 +738,7 @@ class Crew(BaseModel):
 
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> CrewOutput:
         """Asynchronous kickoff method to start the crew execution."""
-        return await asyncio.to_thread(self.kickoff, inputs)
+        return await run_with_async_tools(self.kickoff, inputs)
 
     async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[CrewOutput]:
         crew_copies = [self.copy() for _ in inputs]
@@ -1030,6 +1073,50 @@ class Crew(BaseModel):
         )
         return context
 
+    @property
+    def memory_pipeline(self) -> Optional[MemoryPipeline]:
+        """The pipeline running memory writes, None when they run inline."""
+        if self.memory_write_mode == "sync":
+            return None
+        if self._memory_pipeline is None:
+            self._memory_pipeline = MemoryPipeline()
+        return self._memory_pipeline
+
+    def flush_memory(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending memory evaluation and writes to finish.
+
+        Background evaluations are awaited first, then the memories write
+        out the entries they are still buffering.
+
+        Args:
+            timeout: Seconds to wait for background evaluations, None to wait
+                as long as needed.
+
+        Returns:
+            True if every pending write finished, False on timeout.
+        """
+        drained = (
+            self._memory_pipeline is None or self._memory_pipeline.flush(timeout)
+        )
+        for name in ("_short_term_memory", "_entity_memory", "_external_memory"):
+            memory = getattr(self, name, None)
+            if memory is not None:
+                memory.flush()
+        return drained
+
+    def _finish_memory_writes(self, wait: bool) -> None:
+        """Stop the memory pipeline workers at the end of a kickoff.
+
+        Args:
+            wait: Whether to flush the pending memory writes first. Otherwise
+                the workers exit once their queued writes have run. Either
+                way, the next kickoff starts new workers.
+        """
+        if wait:
+            self.flush_memory()
+        if self._memory_pipeline is not None:
+            self._memory_pipeline.shutdown(wait=wait)
+
     def _process_task_result(self, task: Task, output: TaskOutput) -> None:
         role = task.agent.role if task.agent is not None else "None"
         if self.output_log_file:
@@ -1052,6 +1139,7 @@ class Crew(BaseModel):
         final_task_output = valid_outputs[-1]
 
         final_string_output = final_task_output.raw
+        self._finish_memory_writes(wait=self.memory_write_mode != "async")
         self._finish_execution(final_string_output)
         token_usage = self.calculate_usage_metrics()
         crewai_event_bus.emit(
@@ -1181,6 +1269,7 @@ class Crew(BaseModel):
             "_execution_span",
             "_file_handler",
             "_cache_handler",
+            "cache_handler",
             "_short_term_memory",
             "_long_term_memory",
             "_entity_memory",
@@ -1242,6 +1331,7 @@ class Crew(BaseModel):
             knowledge=existing_knowledge,
             manager_agent=manager_agent,
             manager_llm=manager_llm,
+            cache_handler=self.cache_handler,
         )
 
         return copied_crew
@@ -1371,6 +1461,55 @@ class Crew(BaseModel):
             self._logger.log("error", error_msg)
             raise RuntimeError(error_msg) from e
 
+    def compact_memories(
+        self, command_type: str = "all"
+    ) -> Dict[str, Optional[CompactionStats]]:
+        """Deduplicate, prune and vacuum the crew's memory stores.
+
+        Applies each memory's retention policy, removes entries with
+        duplicate content, merges near-duplicate entities and reclaims disk
+        space.
+
+        Args:
+            command_type: Memory to compact: 'long', 'short', 'entity' or 'all'.
+
+        Returns:
+            What was removed from each memory, by memory type. None for a
+            memory whose storage does not support compaction.
+
+        Raises:
+            ValueError: If an invalid command type is provided.
+            RuntimeError: If a memory fails to compact.
+        """
+        memory_systems = {
+            "long": ("long term", self._long_term_memory),
+            "short": ("short term", self._short_term_memory),
+            "entity": ("entity", self._entity_memory),
+        }
+        if command_type != "all" and command_type not in memory_systems:
+            raise ValueError(
+                f"Invalid command type. Must be one of: {', '.join(sorted([*memory_systems, 'all']))}"
+            )
+        selected = (
+            memory_systems
+            if command_type == "all"
+            else {command_type: memory_systems[command_type]}
+        )
+
+        results: Dict[str, Optional[CompactionStats]] = {}
+        for key, (name, system) in selected.items():
+            if system is None:
+                if command_type != "all":
+                    raise RuntimeError(f"{name} memory system is not initialized")
+                continue
+            try:
+                results[key] = system.compact()
+            except Exception as e:
+                error_msg = f"Failed to compact {name} memory: {str(e)}"
+                self._logger.log("error", error_msg)
+                raise RuntimeError(error_msg) from e
+        return results
+
     def _reset_all_memories(self) -> None:
         """Reset all available memory systems."""
         memory_systems = [
@@ -3,7 +3,6 @@ SQLite-based implementation of flow state persistence.
 """
 
 import json
-import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
@@ -11,6 +10,27 @@ from typing import Any, Dict, Optional, Union
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.utilities.sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
+
+FLOW_STATE_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS flow_states (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        flow_uuid TEXT NOT NULL,
+        method_name TEXT NOT NULL,
+        timestamp DATETIME NOT NULL,
+        state_json TEXT NOT NULL
+    );
+    -- Add index for faster UUID lookups
+    CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
+    ON flow_states(flow_uuid);
+    """,
+    """
+    -- load_state reads the latest row of a flow, covered without a sort
+    CREATE INDEX IF NOT EXISTS idx_flow_states_uuid_id
+    ON flow_states(flow_uuid, id DESC);
+    """,
+]
 
 
 class SQLiteFlowPersistence(FlowPersistence):
@@ -22,6 +42,7 @@ class SQLiteFlowPersistence(FlowPersistence):
     """
 
     db_path: str  # Type annotation for instance variable
+    pool: SQLiteConnectionPool
 
     def __init__(self, db_path: Optional[str] = None):
         """Initialize SQLite persistence.
@@ -45,26 +66,8 @@ class SQLiteFlowPersistence(FlowPersistence):
         self.init_db()
 
     def init_db(self) -> None:
-        """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-            CREATE TABLE IF NOT EXISTS flow_states (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                flow_uuid TEXT NOT NULL,
-                method_name TEXT NOT NULL,
-                timestamp DATETIME NOT NULL,
-                state_json TEXT NOT NULL
-            )
-            """
-            )
-            # Add index for faster UUID lookups
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
-            ON flow_states(flow_uuid)
-            """
-            )
+        """Create the necessary tables and indexes if they don't exist."""
+        self.pool = get_sqlite_pool(self.db_path, FLOW_STATE_MIGRATIONS)
 
     def save_state(
         self,
@@ -89,7 +92,7 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self.pool.transaction() as conn:
             conn.execute(
                 """
             INSERT INTO flow_states (
@@ -116,8 +119,9 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        row = (
+            self.pool.connection()
+            .execute(
                 """
             SELECT state_json
             FROM flow_states
@@ -127,7 +131,8 @@ class SQLiteFlowPersistence(FlowPersistence):
             """,
                 (flow_uuid,),
             )
-            row = cursor.fetchone()
+            .fetchone()
+        )
 
         if row:
             return json.loads(row[0])
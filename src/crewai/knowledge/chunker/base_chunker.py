@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List
+
+
+class BaseChunker(ABC):
+    """
+    Abstract base class for splitting knowledge text into chunks
+    """
+
+    @abstractmethod
+    def chunk(self, segments: Iterable[str]) -> Iterator[str]:
+        """
+        Split a text given as consecutive segments, e.g. the pages of a file
+
+        Chunks are yielded as soon as they are complete, so the whole text
+        never needs to be in memory.
+
+        Args:
+            segments: The text, in order
+
+        Returns:
+            Iterator over the chunks
+        """
+        pass
+
+    def chunk_text(self, text: str) -> List[str]:
+        """
+        Split a whole text into chunks
+
+        Args:
+            text: The text to split
+
+        Returns:
+            The chunks
+        """
+        return list(self.chunk([text]))
+
+
+class CharacterChunker(BaseChunker):
+    """
+    Splits text at fixed character offsets, regardless of words and sentences
+    """
+
+    def __init__(self, chunk_size: int = 4000, chunk_overlap: int = 200):
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def chunk(self, segments: Iterable[str]) -> Iterator[str]:
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        for segment in segments:
+            buffer += segment
+            start = 0
+            while len(buffer) - start >= self.chunk_size:
+                yield buffer[start : start + self.chunk_size]
+                start += step
+            buffer = buffer[start:]
+        for start in range(0, len(buffer), step):
+            yield buffer[start : start + self.chunk_size]
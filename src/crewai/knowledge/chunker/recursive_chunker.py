@@ -0,0 +1,174 @@
+import re
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from crewai.knowledge.chunker.base_chunker import BaseChunker
+from crewai.utilities.constants import (
+    APPROX_CHARS_PER_TOKEN,
+    KNOWLEDGE_CHUNKER_WINDOW,
+    KNOWLEDGE_TOKEN_ENCODING,
+)
+
+DEFAULT_SEPARATORS: Tuple[str, ...] = (
+    r"\n[ \t]*\n\s*",  # paragraphs
+    r"\n\s*",  # lines
+    r"[.!?。！？][\"'”’)\]]*\s+",  # sentences
+    r"\s+",  # words
+)
+
+
+def token_counter(
+    model: Optional[str] = None, encoding: str = KNOWLEDGE_TOKEN_ENCODING
+) -> Callable[[str], int]:
+    """
+    Count tokens with tiktoken, estimating them when tiktoken is not installed
+
+    Args:
+        model: Embedding model whose tokenizer to use, e.g.
+            "text-embedding-3-small". Unknown models use `encoding`
+        encoding: The tiktoken encoding used when no model is given
+
+    Returns:
+        Function returning the number of tokens of a text
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return lambda text: len(text) // APPROX_CHARS_PER_TOKEN + 1
+
+    try:
+        tokenizer = (
+            tiktoken.encoding_for_model(model)
+            if model
+            else tiktoken.get_encoding(encoding)
+        )
+    except KeyError:
+        tokenizer = tiktoken.get_encoding(encoding)
+    return lambda text: len(tokenizer.encode(text, disallowed_special=()))
+
+
+class RecursiveChunker(BaseChunker):
+    """
+    Splits text at the coarsest natural boundary that keeps chunks in size
+
+    Text is split into paragraphs, then lines, sentences and words, going to
+    a finer boundary only for pieces still larger than `chunk_size`. The
+    pieces are then packed into chunks of up to `chunk_size`, each starting
+    with up to `chunk_overlap` of the end of the previous chunk. Sizes are
+    measured by `length_function`: characters by default, or tokens for
+    chunkers built with `for_tokens`.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 4000,
+        chunk_overlap: int = 200,
+        length_function: Callable[[str], int] = len,
+        separators: Sequence[str] = DEFAULT_SEPARATORS,
+        chars_per_unit: int = 1,
+    ):
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.length_function = length_function
+        self._patterns = [re.compile(separator) for separator in separators]
+        self._chars_per_unit = chars_per_unit
+        # Text buffered before splitting: enough for several chunks, so the
+        # boundaries found match those of the whole text
+        self._window = max(KNOWLEDGE_CHUNKER_WINDOW, 4 * chunk_size * chars_per_unit)
+
+    @classmethod
+    def for_tokens(
+        cls,
+        chunk_size: int = 512,
+        chunk_overlap: int = 64,
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> "RecursiveChunker":
+        """
+        Create a chunker measuring chunks in tokens of an embedding model
+
+        Args:
+            chunk_size: Maximum tokens per chunk
+            chunk_overlap: Tokens repeated from the previous chunk
+            model: Embedding model whose tokenizer to use
+
+        Returns:
+            The chunker
+        """
+        return cls(
+            chunk_size,
+            chunk_overlap,
+            length_function=token_counter(model),
+            chars_per_unit=APPROX_CHARS_PER_TOKEN,
+            **kwargs,
+        )
+
+    def chunk(self, segments: Iterable[str]) -> Iterator[str]:
+        carry = ""
+        for segment in segments:
+            carry += segment
+            if len(carry) < self._window:
+                continue
+            chunks = list(self._merge(self._split(carry, 0)))
+            # The last chunk may continue in the next segment, so its text is
+            # split again with it
+            for chunk in chunks[:-1]:
+                if chunk.strip():
+                    yield chunk.strip()
+            carry = chunks[-1] if chunks else ""
+        for chunk in self._merge(self._split(carry, 0)):
+            if chunk.strip():
+                yield chunk.strip()
+
+    def _split(self, text: str, level: int) -> Iterator[Tuple[str, int]]:
+        """Yield consecutive pieces of the text with their size, each fitting a chunk."""
+        # Far longer than a chunk can be, no need to measure it
+        if len(text) > 8 * self.chunk_size * self._chars_per_unit:
+            size = None
+        else:
+            size = self.length_function(text)
+            if size <= self.chunk_size:
+                if text:
+                    yield text, size
+                return
+        if level == len(self._patterns):
+            # No boundary left, cut the text in pieces of about chunk_size
+            size = size or self.length_function(text)
+            step = max(1, len(text) * self.chunk_size // size)
+            for start in range(0, len(text), step):
+                piece = text[start : start + step]
+                yield piece, self.length_function(piece)
+            return
+        for piece in _split_after(text, self._patterns[level]):
+            yield from self._split(piece, level + 1)
+
+    def _merge(self, pieces: Iterable[Tuple[str, int]]) -> Iterator[str]:
+        """Pack pieces into chunks, overlapping consecutive chunks."""
+        current: Deque[Tuple[str, int]] = deque()
+        total = 0
+        for piece, size in pieces:
+            if current and total + size > self.chunk_size:
+                yield "".join(text for text, _ in current)
+                while current and (
+                    total > self.chunk_overlap or total + size > self.chunk_size
+                ):
+                    total -= current.popleft()[1]
+            current.append((piece, size))
+            total += size
+        if current:
+            yield "".join(text for text, _ in current)
+
+
+def _split_after(text: str, pattern: "re.Pattern[str]") -> List[str]:
+    """Split text after each match, keeping every character."""
+    pieces = []
+    start = 0
+    for match in pattern.finditer(text):
+        if match.end() > start:
+            pieces.append(text[start : match.end()])
+            start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
@@ -40,23 +40,49 @@ class Knowledge(BaseModel):
                 embedder=embedder, collection_name=collection_name
             )
         self.sources = sources
-        self.storage.initialize_knowledge_storage()
         self._add_sources()
 
-    def query(self, query: List[str], limit: int = 3) -> List[Dict[str, Any]]:
+    def query(
+        self,
+        query: List[str],
+        limit: int = 3,
+        mode: str = "vector",
+        query_embeddings: Optional[Any] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Query across all knowledge sources to find the most relevant information.
         Returns the top_k most relevant chunks.
 
+        With mode="hybrid", keyword (BM25) and vector matches are fused, so
+        exact terms such as identifiers or error codes are found as well.
+        query_embeddings, one per query text, skips embedding the query again.
+
+        where restricts the search to chunks whose metadata matches, using
+        Chroma's filter syntax, e.g. {"source_type": "PDFKnowledgeSource"} or
+        {"$and": [{"team": "billing"}, {"page": {"$lte": 10}}]}. Chunks carry
+        their source_type, saved_at, the source_path and page, row or sheet
+        of files, and the metadata of their source.
+
         Raises:
             ValueError: If storage is not initialized.
         """
         if self.storage is None:
             raise ValueError("Storage is not initialized.")
 
+        # Only pass what was asked for, so custom storages implementing the
+        # base search signature keep working
+        options: Dict[str, Any] = {}
+        if mode != "vector":
+            options["mode"] = mode
+        if query_embeddings is not None:
+            options["query_embeddings"] = query_embeddings
+        if where is not None:
+            options["filter"] = where
         results = self.storage.search(
             query,
             limit,
+            **options,
         )
         return results
 
@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.constants import KNOWLEDGE_RETRIEVAL_MAX_WORKERS
+from crewai.utilities.embedding_cache import text_digest
+
+_MemoKey = Tuple[str, int, Tuple[int, ...]]
+
+
+class KnowledgeRetriever:
+    """Queries several knowledge bases for the same text at once.
+
+    The query is embedded once per embedder and the embedding is shared by
+    every knowledge base using that embedder. The knowledge bases are then
+    searched in parallel, and their results merged in order, dropping chunks
+    with the same content. Results are memoized per query and knowledge
+    bases until `clear` is called, so retried and repeated tasks do not
+    search again.
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[_MemoKey, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def retrieve(
+        self,
+        query: str,
+        knowledges: Sequence[Optional[Knowledge]],
+        limit: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """Search knowledge bases for a query.
+
+        Args:
+            query: The text to search for.
+            knowledges: The knowledge bases to search, in order of priority.
+                Missing and repeated knowledge bases are skipped.
+            limit: Results kept from each knowledge base.
+
+        Returns:
+            The results of every knowledge base, first knowledge base first,
+            without duplicate chunks.
+        """
+        unique = list({id(k): k for k in knowledges if k is not None}.values())
+        if not unique:
+            return []
+        key = (query, limit, tuple(id(k) for k in unique))
+        with self._lock:
+            cached = self._results.get(key)
+        if cached is not None:
+            return list(cached)
+
+        embeddings = self._embed(query, unique)
+
+        def search(knowledge: Knowledge) -> List[Dict[str, Any]]:
+            return knowledge.query(
+                [query], limit, query_embeddings=embeddings.get(id(knowledge))
+            )
+
+        if len(unique) == 1:
+            rankings = [search(unique[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(unique), KNOWLEDGE_RETRIEVAL_MAX_WORKERS),
+                thread_name_prefix="knowledge-retrieval",
+            ) as pool:
+                rankings = list(pool.map(search, unique))
+
+        results: List[Dict[str, Any]] = []
+        seen = set()
+        for ranking in rankings:
+            for result in ranking or []:
+                digest = text_digest(str(result.get("context", "")))
+                if digest not in seen:
+                    seen.add(digest)
+                    results.append(result)
+
+        with self._lock:
+            self._results[key] = results
+        return list(results)
+
+    def clear(self) -> None:
+        """Forget memoized results."""
+        with self._lock:
+            self._results.clear()
+
+    @staticmethod
+    def _embed(query: str, knowledges: List[Knowledge]) -> Dict[int, Any]:
+        """Embed the query once per embedder, keyed by knowledge base id."""
+        by_embedder: Dict[Any, Any] = {}
+        embeddings: Dict[int, Any] = {}
+        for knowledge in knowledges:
+            storage = knowledge.storage
+            if not isinstance(storage, KnowledgeStorage):
+                continue
+            embedder = storage.embedder
+            key = getattr(embedder, "namespace", None) or id(embedder)
+            if key not in by_embedder:
+                by_embedder[key] = embedder([query])
+            embeddings[id(knowledge)] = by_embedder[key]
+        return embeddings
@@ -1,18 +1,94 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import (
+    Any,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pydantic import Field, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.source.file_loader import load_files
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
-from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.constants import (
+    KNOWLEDGE_CHUNK_LOCATE_PREFIX,
+    KNOWLEDGE_DIRECTORY,
+    KNOWLEDGE_SAVE_BATCH_SIZE,
+)
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.knowledge_events import KnowledgeFileLoadedEvent
 from crewai.utilities.logger import Logger
 
 
+class _SegmentTracker:
+    """Tracks which segment of a streamed file each chunk starts in.
+
+    Chunks are looked up in the text read so far, from where the previous
+    chunk started, so only the text not yet chunked is kept. Chunks that
+    are not taken verbatim from the text cannot be located.
+    """
+
+    def __init__(self, name: str, segments: Iterable[str]) -> None:
+        self.name = name
+        self._segments = segments
+        self._text = ""
+        self._pending: List[str] = []
+        self._offset = 0
+        self._read = 0
+        self._starts: Deque[Tuple[int, int]] = deque()
+        self._located = False
+
+    def __iter__(self) -> Iterator[str]:
+        for number, segment in enumerate(self._segments, start=1):
+            self._starts.append((self._read, number))
+            self._pending.append(segment)
+            self._read += len(segment)
+            yield segment
+
+    def locate(self, chunk: str) -> Optional[int]:
+        """Number of the segment the chunk starts in, counted from 1."""
+        if self._pending:
+            self._text += "".join(self._pending)
+            self._pending = []
+        # Each chunk starts after the previous one, even when they overlap
+        position = self._text.find(
+            chunk[:KNOWLEDGE_CHUNK_LOCATE_PREFIX], 1 if self._located else 0
+        )
+        if position < 0:
+            return None
+        self._located = True
+        self._text = self._text[position:]
+        self._offset += position
+        while len(self._starts) > 1 and self._starts[1][0] <= self._offset:
+            self._starts.popleft()
+        return self._starts[0][1] if self._starts else None
+
+
 class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
-    """Base class for knowledge sources that load content from files."""
+    """Base class for knowledge sources that load content from files.
+
+    Sources with `streams_content` implement `read_segments` and are
+    streamed: files are not loaded when the source is created, and `add`
+    chunks and saves them a segment at a time as they are read, so `content`
+    and `chunks` stay empty. Sources with `parallel_loading` can parse their
+    files in a process pool by setting `loader_workers` above 1.
+
+    Chunks are saved with the path of their file and, for sources with a
+    `segment_name`, the number of the segment they start in, e.g. the page.
+    """
 
+    streams_content: ClassVar[bool] = False
+    parallel_loading: ClassVar[bool] = False
+    segment_name: ClassVar[Optional[str]] = None
     _logger: Logger = Logger(verbose=True)
     file_path: Optional[Union[Path, List[Path], str, List[str]]] = Field(
         default=None,
@@ -24,6 +100,11 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     content: Dict[Path, str] = Field(init=False, default_factory=dict)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    loader_workers: Optional[int] = Field(
+        default=1,
+        description="Processes parsing files in parallel, None for one per CPU. "
+        "With the default of 1, files are parsed in the calling process.",
+    )
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -43,13 +124,81 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         """Post-initialization method to load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if not self.streams_content:
+            self.content = self.load_content()
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
         pass
 
+    @classmethod
+    def read_segments(cls, path: Path) -> Iterable[str]:
+        """Yield the text of a file in reading order, one segment at a time.
+
+        Implemented by sources with `streams_content`. Runs in worker
+        processes for sources with `parallel_loading`, so it must not depend
+        on the state of the source.
+        """
+        raise NotImplementedError(f"{cls.__name__} does not stream its files")
+
+    def _add_streamed(self) -> None:
+        """Chunk and save the files as they are read, a batch of chunks at a time."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        batch: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        files = load_files(
+            self.safe_file_paths,
+            self.read_segments,
+            workers=self.loader_workers if self.parallel_loading else 1,
+        )
+        for files_loaded, (path, segments) in enumerate(files, start=1):
+            chunks = 0
+            metadata = self._chunk_metadata(source_path=str(path))
+            tracker = (
+                _SegmentTracker(self.segment_name, segments)
+                if self.segment_name
+                else None
+            )
+            for chunk in self._chunk_segments(tracker or segments):
+                batch.append(chunk)
+                number = tracker.locate(chunk) if tracker else None
+                metadatas.append(
+                    metadata
+                    if tracker is None or number is None
+                    else {tracker.name: number, **metadata}
+                )
+                chunks += 1
+                if len(batch) >= KNOWLEDGE_SAVE_BATCH_SIZE:
+                    self.storage.save(batch, metadatas)
+                    batch, metadatas = [], []
+            crewai_event_bus.emit(
+                self,
+                KnowledgeFileLoadedEvent(
+                    file_path=str(path),
+                    chunks=chunks,
+                    files_loaded=files_loaded,
+                    total_files=len(self.safe_file_paths),
+                ),
+            )
+        if batch:
+            self.storage.save(batch, metadatas)
+
+    def _add_loaded(self) -> None:
+        """Chunk and save the loaded files one at a time, each with its path."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        for path, text in self.content.items():
+            chunks = self._chunk_text(text)
+            self.chunks.extend(chunks)
+            if chunks:
+                self.storage.save(chunks, self._chunk_metadata(source_path=str(path)))
+
+    def _chunk_segments(self, segments: Iterable[str]) -> Iterator[str]:
+        """Chunk the text of a file as it is read."""
+        return self._get_chunker().chunk(segments)
+
     def validate_content(self):
         """Validate the paths."""
         for path in self.safe_file_paths:
@@ -1,23 +1,42 @@
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from crewai.knowledge.chunker.base_chunker import BaseChunker
+from crewai.knowledge.chunker.recursive_chunker import RecursiveChunker
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.memory.retention import SAVED_AT_KEY
 
 
 class BaseKnowledgeSource(BaseModel, ABC):
-    """Abstract base class for knowledge sources."""
+    """Abstract base class for knowledge sources.
+
+    Every chunk is saved with metadata describing where it comes from: the
+    type of the source, when it was saved and, for files, the path and the
+    page, row or sheet where available, along with the source's `metadata`.
+    Queries can be restricted on any of them with `Knowledge.query(where=...)`.
+    """
 
     chunk_size: int = 4000
     chunk_overlap: int = 200
     chunks: List[str] = Field(default_factory=list)
     chunk_embeddings: List[np.ndarray] = Field(default_factory=list)
+    chunker: Optional[BaseChunker] = Field(
+        default=None,
+        description="Splits the content into chunks, None for a RecursiveChunker "
+        "with chunk_size and chunk_overlap characters",
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     storage: Optional[KnowledgeStorage] = Field(default=None)
-    metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Tags saved with every chunk of the source, e.g. "
+        '{"team": "billing"}, to filter queries on',
+    )
     collection_name: Optional[str] = Field(default=None)
 
     @abstractmethod
@@ -36,10 +55,31 @@ class BaseKnowledgeSource(BaseModel, ABC):
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        return self._get_chunker().chunk_text(text)
+
+    def _get_chunker(self) -> BaseChunker:
+        if self.chunker is None:
+            self.chunker = RecursiveChunker(self.chunk_size, self.chunk_overlap)
+        return self.chunker
+
+    def _chunk_metadata(self, **fields: Any) -> Dict[str, Any]:
+        """Metadata saved with the chunks of the source.
+
+        Args:
+            **fields: Where the chunks come from, e.g. source_path or page.
+                None values are left out.
+
+        Returns:
+            The source type and save time, the fields and the source's
+            metadata, which takes precedence.
+        """
+        metadata = {
+            "source_type": type(self).__name__,
+            SAVED_AT_KEY: time.time(),
+            **fields,
+            **self.metadata,
+        }
+        return {key: value for key, value in metadata.items() if value is not None}
 
     def _save_documents(self):
         """
@@ -47,6 +87,6 @@ class BaseKnowledgeSource(BaseModel, ABC):
         This method should be called after the chunks and embeddings are generated.
         """
         if self.storage:
-            self.storage.save(self.chunks)
+            self.storage.save(self.chunks, self._chunk_metadata())
         else:
             raise ValueError("No storage found to save documents.")
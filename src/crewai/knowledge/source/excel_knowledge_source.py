@@ -147,23 +147,16 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
         Add Excel file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        # Convert dictionary values to a single string if content is a dictionary
-        # Updated to account for .xlsx workbooks with multiple tabs/sheets
-        content_str = ""
-        for value in self.content.values():
-            if isinstance(value, dict):
-                for sheet_value in value.values():
-                    content_str += str(sheet_value) + "\n"
-            else:
-                content_str += str(value) + "\n"
-
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        # Each sheet of each workbook is chunked and saved on its own, so its
+        # chunks can be filtered on the file and sheet they come from
+        for path, sheets in self.content.items():
+            for sheet_name, sheet_content in sheets.items():
+                new_chunks = self._chunk_text(str(sheet_content) + "\n")
+                self.chunks.extend(new_chunks)
+                if new_chunks:
+                    self.storage.save(
+                        new_chunks,
+                        self._chunk_metadata(source_path=str(path), sheet=sheet_name),
+                    )
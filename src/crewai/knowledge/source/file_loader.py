@@ -0,0 +1,103 @@
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import (
+    Callable,
+    Deque,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from crewai.utilities.constants import (
+    KNOWLEDGE_LOADER_MAX_PENDING_FILES,
+    KNOWLEDGE_LOADER_MAX_WORKERS,
+)
+
+SegmentReader = Callable[[Path], Iterable[str]]
+"""Yields the text of a file in reading order, one segment (e.g. a page) at a time."""
+
+logger = logging.getLogger(__name__)
+
+
+def _read_file(read: SegmentReader, path: Path) -> List[str]:
+    return list(read(path))
+
+
+def default_loader_workers() -> int:
+    """Processes used to parse files: one per CPU, up to a cap."""
+    return min(os.cpu_count() or 1, KNOWLEDGE_LOADER_MAX_WORKERS)
+
+
+def load_files(
+    paths: Iterable[Path],
+    read: SegmentReader,
+    workers: Optional[int] = 1,
+    max_pending: int = KNOWLEDGE_LOADER_MAX_PENDING_FILES,
+) -> Iterator[Tuple[Path, Iterable[str]]]:
+    """Stream the segments of files, file by file and in the given order.
+
+    With a single worker, the default, or a single file, files are read in
+    the calling thread one segment at a time, so only the segment being
+    processed is in memory. Otherwise files are parsed in a pool of spawned
+    processes, at most `max_pending` files ahead of the consumer, and a file
+    is handed over as soon as it and the files before it are parsed. If the
+    pool breaks, e.g. because the main module of a script starts loading
+    without an `if __name__ == "__main__":` guard, the files not handed over
+    yet are read in the calling thread instead.
+
+    Args:
+        paths: The files to read.
+        read: Reads the segments of one file. It runs in worker processes,
+            so it must be picklable, e.g. a module-level function or a
+            classmethod.
+        workers: Processes parsing files, None for `default_loader_workers()`.
+        max_pending: Files parsed or being parsed ahead of the consumer.
+
+    Yields:
+        Each path with the segments of its text.
+    """
+    paths = list(paths)
+    workers = min(workers or default_loader_workers(), len(paths))
+    if workers > 1:
+        paths = yield from _load_in_pool(paths, read, workers, max_pending)
+        if paths:
+            logger.warning(
+                "The file loading process pool broke, reading the remaining "
+                "%d files in this process",
+                len(paths),
+            )
+    for path in paths:
+        yield path, read(path)
+
+
+def _load_in_pool(
+    paths: List[Path], read: SegmentReader, workers: int, max_pending: int
+) -> Generator[Tuple[Path, Iterable[str]], None, List[Path]]:
+    """Parse files in a process pool, returning the files left if it breaks."""
+    # Spawned workers do not inherit the locks of the threads running here
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        queued = deque(paths)
+        pending: Deque[Tuple[Path, "Future[List[str]]"]] = deque()
+        try:
+            while True:
+                while queued and len(pending) < max(max_pending, workers):
+                    future = pool.submit(_read_file, read, queued[0])
+                    pending.append((queued.popleft(), future))
+                if not pending:
+                    return []
+                segments = pending[0][1].result()
+                yield pending.popleft()[0], segments
+        except BrokenProcessPool:
+            return [path for path, _ in pending] + list(queued)
+        finally:
+            for _, future in pending:
+                future.cancel()
@@ -1,30 +1,40 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, Iterator, Optional
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
 
 class PDFKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries PDF file content using embeddings."""
+    """A knowledge source that stores and queries PDF file content using embeddings.
+
+    Pages are streamed into chunking and embedding as files are parsed, in a
+    process pool when `loader_workers` is above 1.
+    """
+
+    streams_content: ClassVar[bool] = True
+    parallel_loading: ClassVar[bool] = True
+    segment_name: ClassVar[Optional[str]] = "page"
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess PDF file content."""
-        pdfplumber = self._import_pdfplumber()
-
-        content = {}
-
-        for path in self.safe_file_paths:
-            text = ""
-            path = self.convert_to_path(path)
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            content[path] = text
-        return content
-
-    def _import_pdfplumber(self):
+        return {
+            path: "".join(self.read_segments(self.convert_to_path(path)))
+            for path in self.safe_file_paths
+        }
+
+    @classmethod
+    def read_segments(cls, path: Path) -> Iterator[str]:
+        """Yield the text of each page of a PDF file, empty for pages without text."""
+        pdfplumber = cls._import_pdfplumber()
+        with pdfplumber.open(path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                # Parsed pages are cached by the document, drop them as we go
+                page.close()
+                yield page_text + "\n" if page_text else ""
+
+    @staticmethod
+    def _import_pdfplumber():
         """Dynamically import pdfplumber."""
         try:
             import pdfplumber
@@ -40,14 +50,4 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
         Add PDF file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._add_streamed()
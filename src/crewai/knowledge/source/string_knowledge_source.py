@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional
 
 from pydantic import Field
 
@@ -25,10 +25,3 @@ class StringKnowledgeSource(BaseKnowledgeSource):
         new_chunks = self._chunk_text(self.content)
         self.chunks.extend(new_chunks)
         self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
@@ -1,34 +1,32 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, Iterator
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.utilities.constants import KNOWLEDGE_READ_BLOCK_SIZE
 
 
 class TextFileKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries text file content using embeddings."""
 
+    streams_content: ClassVar[bool] = True
+
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess text file content."""
-        content = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
-            with open(path, "r", encoding="utf-8") as f:
-                content[path] = f.read()
-        return content
+        return {
+            path: "".join(self.read_segments(self.convert_to_path(path)))
+            for path in self.safe_file_paths
+        }
+
+    @classmethod
+    def read_segments(cls, path: Path) -> Iterator[str]:
+        """Yield the text of a file in blocks of KNOWLEDGE_READ_BLOCK_SIZE characters."""
+        with open(path, "r", encoding="utf-8") as f:
+            while block := f.read(KNOWLEDGE_READ_BLOCK_SIZE):
+                yield block
 
     def add(self) -> None:
         """
         Add text file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._add_streamed()
@@ -0,0 +1,116 @@
+import os
+from typing import Iterable, List, Optional
+
+from crewai.utilities.constants import KNOWLEDGE_KEYWORD_INDEX_FILE
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS knowledge_chunks (
+        id INTEGER PRIMARY KEY,
+        collection TEXT NOT NULL,
+        doc_id TEXT NOT NULL,
+        content TEXT NOT NULL,
+        UNIQUE (collection, doc_id)
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+        content, content='knowledge_chunks', content_rowid='id'
+    );
+    CREATE TRIGGER IF NOT EXISTS knowledge_chunks_insert
+    AFTER INSERT ON knowledge_chunks BEGIN
+        INSERT INTO knowledge_fts (rowid, content) VALUES (new.id, new.content);
+    END;
+    CREATE TRIGGER IF NOT EXISTS knowledge_chunks_delete
+    AFTER DELETE ON knowledge_chunks BEGIN
+        INSERT INTO knowledge_fts (knowledge_fts, rowid, content)
+        VALUES ('delete', old.id, old.content);
+    END;
+    """,
+]
+
+
+def match_expression(text: str) -> Optional[str]:
+    """Turn free text into an FTS5 query matching any of its terms.
+
+    Each whitespace separated term is quoted, so identifiers such as
+    `ERR-4021` or `get_user_id` match as a phrase of their parts instead of
+    being read as FTS5 operators.
+
+    Args:
+        text: The text to search for.
+
+    Returns:
+        The MATCH expression, or None if the text has no terms.
+    """
+    terms = ['"' + term.replace('"', '""') + '"' for term in text.split()]
+    return " OR ".join(terms) or None
+
+
+class KeywordIndex:
+    """BM25 keyword index of knowledge chunks, kept in SQLite FTS5.
+
+    Chunks are stored per collection under the id they have in the vector
+    store, so keyword and vector results can be fused by id. All the
+    collections of a project share one database file next to the Chroma
+    database.
+
+    Attributes:
+        pool: Connections to the database file.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.pool = get_sqlite_pool(
+            db_path or os.path.join(db_storage_path(), KNOWLEDGE_KEYWORD_INDEX_FILE),
+            MIGRATIONS,
+        )
+
+    def add(
+        self, collection: str, ids: Iterable[str], documents: Iterable[str]
+    ) -> None:
+        """Index chunks. Chunks already indexed under the same id are kept."""
+        with self.pool.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO knowledge_chunks (collection, doc_id, content) "
+                "VALUES (?, ?, ?)",
+                [(collection, id_, doc) for id_, doc in zip(ids, documents)],
+            )
+
+    def search(self, collection: str, text: str, limit: int) -> List[str]:
+        """Ids of the chunks of a collection best matching the text, best first."""
+        expression = match_expression(text)
+        if expression is None:
+            return []
+        rows = (
+            self.pool.connection()
+            .execute(
+                "SELECT c.doc_id FROM knowledge_fts "
+                "JOIN knowledge_chunks c ON c.id = knowledge_fts.rowid "
+                "WHERE knowledge_fts MATCH ? AND c.collection = ? "
+                "ORDER BY bm25(knowledge_fts) LIMIT ?",
+                (expression, collection, limit),
+            )
+            .fetchall()
+        )
+        return [row[0] for row in rows]
+
+    def count(self, collection: str) -> int:
+        """Number of chunks indexed for a collection."""
+        return (
+            self.pool.connection()
+            .execute(
+                "SELECT COUNT(*) FROM knowledge_chunks WHERE collection = ?",
+                (collection,),
+            )
+            .fetchone()[0]
+        )
+
+    def clear(self, collection: Optional[str] = None) -> None:
+        """Drop the chunks of a collection, or of every collection."""
+        with self.pool.transaction() as conn:
+            if collection is None:
+                conn.execute("DELETE FROM knowledge_chunks")
+            else:
+                conn.execute(
+                    "DELETE FROM knowledge_chunks WHERE collection = ?", (collection,)
+                )
@@ -4,18 +4,35 @@ import io
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union, cast
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
 
 import chromadb
 import chromadb.errors
 from chromadb.api import ClientAPI
 from chromadb.api.types import OneOrMany
-from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.keyword_index import KeywordIndex
 from crewai.utilities import EmbeddingConfigurator
-from crewai.utilities.chromadb import sanitize_collection_name
-from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.chromadb import (
+    get_chroma_client,
+    release_chroma_client,
+    sanitize_collection_name,
+)
+from crewai.utilities.constants import (
+    KNOWLEDGE_DIRECTORY,
+    KNOWLEDGE_EMBEDDING_BATCH_SIZE,
+    KNOWLEDGE_EMBEDDING_CONCURRENCY,
+    KNOWLEDGE_EMBEDDING_MAX_RETRIES,
+    KNOWLEDGE_EMBEDDING_RETRY_DELAY,
+    KNOWLEDGE_HYBRID_CANDIDATES_FACTOR,
+    KNOWLEDGE_HYBRID_RRF_K,
+    KNOWLEDGE_SAVE_BATCH_SIZE,
+)
+from crewai.utilities.embedding_cache import cached_embedding_function
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
 
@@ -41,18 +58,41 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    The collection is opened on first save or search, on a Chroma client
+    shared by every knowledge storage.
+
+    Saved documents are embedded in batches of `embedding_batch_size`, with
+    up to `embedding_concurrency` requests in flight. A failed batch is
+    retried on its own, up to `embedding_max_retries` times with
+    exponential backoff, and each batch is inserted with its embeddings as
+    soon as it is embedded.
+
+    Saved chunks are also indexed for keyword search, so `search` can run
+    in "hybrid" mode: BM25 keyword matches and vector matches are combined
+    with reciprocal rank fusion, which finds exact identifiers that vector
+    similarity alone misses.
     """
 
     collection: Optional[chromadb.Collection] = None
     collection_name: Optional[str] = "knowledge"
     app: Optional[ClientAPI] = None
+    keyword_index: Optional[KeywordIndex] = None
 
     def __init__(
         self,
         embedder: Optional[Dict[str, Any]] = None,
         collection_name: Optional[str] = None,
+        embedding_batch_size: int = KNOWLEDGE_EMBEDDING_BATCH_SIZE,
+        embedding_concurrency: int = KNOWLEDGE_EMBEDDING_CONCURRENCY,
+        embedding_max_retries: int = KNOWLEDGE_EMBEDDING_MAX_RETRIES,
     ):
         self.collection_name = collection_name
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_concurrency = embedding_concurrency
+        self.embedding_max_retries = embedding_max_retries
+        self._init_lock = threading.Lock()
+        self._keywords_synced = False
         self._set_embedder_config(embedder)
 
     def search(
@@ -61,14 +101,19 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        mode: str = "vector",
+        query_embeddings: Optional[Any] = None,
     ) -> List[Dict[str, Any]]:
+        if mode not in ("vector", "hybrid"):
+            raise ValueError(
+                f"Unknown search mode {mode!r}, expected 'vector' or 'hybrid'"
+            )
+        self._ensure_initialized()
+        if mode == "hybrid":
+            return self._hybrid_search(query, limit, filter, query_embeddings)
         with suppress_logging():
             if self.collection:
-                fetched = self.collection.query(
-                    query_texts=query,
-                    n_results=limit,
-                    where=filter,
-                )
+                fetched = self._query_collection(query, limit, filter, query_embeddings)
                 results = []
                 for i in range(len(fetched["ids"][0])):  # type: ignore
                     result = {
@@ -83,26 +128,130 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             else:
                 raise Exception("Collection not initialized")
 
-    def initialize_knowledge_storage(self):
-        base_path = os.path.join(db_storage_path(), "knowledge")
-        chroma_client = chromadb.PersistentClient(
-            path=base_path,
-            settings=Settings(allow_reset=True),
+    def _query_collection(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        query_embeddings: Optional[Any],
+    ) -> Any:
+        assert self.collection is not None
+        if query_embeddings is not None:
+            return self.collection.query(
+                query_embeddings=query_embeddings,
+                n_results=limit,
+                where=filter,
+            )
+        return self.collection.query(
+            query_texts=query,
+            n_results=limit,
+            where=filter,
         )
 
-        self.app = chroma_client
+    def _hybrid_search(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        query_embeddings: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fuse the vector and keyword rankings of each query text.
 
-        try:
-            collection_name = (
-                f"knowledge_{self.collection_name}"
-                if self.collection_name
-                else "knowledge"
+        Every query text is ranked both by vector similarity and by BM25, and
+        each chunk scores the sum of `1 / (k + rank)` over the rankings it
+        appears in. The score of a result is its fused score, so the
+        vector-distance `score_threshold` does not apply.
+        """
+        if not self.collection or not self.keyword_index:
+            raise Exception("Collection not initialized")
+        self._sync_keyword_index()
+        candidates = limit * KNOWLEDGE_HYBRID_CANDIDATES_FACTOR
+        records: Dict[str, Dict[str, Any]] = {}
+        rankings: List[List[str]] = []
+
+        with suppress_logging():
+            fetched = self._query_collection(
+                query, candidates, filter, query_embeddings
             )
+        for ids, metadatas, documents in zip(
+            fetched["ids"],
+            fetched["metadatas"] or [],  # type: ignore
+            fetched["documents"] or [],  # type: ignore
+        ):
+            for id_, meta, doc in zip(ids, metadatas, documents):
+                records[id_] = {"id": id_, "metadata": meta, "context": doc}
+            rankings.append(list(ids))
+
+        keyword_rankings = [
+            self.keyword_index.search(self._collection_key(), text, candidates)
+            for text in query
+        ]
+        # Keyword matches the vector search did not return still have to
+        # pass the metadata filter
+        missing = list(
+            {id_ for ids in keyword_rankings for id_ in ids if id_ not in records}
+        )
+        if missing:
+            got = self.collection.get(
+                ids=missing, where=filter, include=["documents", "metadatas"]
+            )
+            for id_, meta, doc in zip(
+                got["ids"],
+                got["metadatas"] or [],  # type: ignore
+                got["documents"] or [],  # type: ignore
+            ):
+                records[id_] = {"id": id_, "metadata": meta, "context": doc}
+        rankings.extend(
+            [id_ for id_ in ids if id_ in records] for ids in keyword_rankings
+        )
+
+        scores: Dict[str, float] = {}
+        for ranking in rankings:
+            for rank, id_ in enumerate(ranking, start=1):
+                scores[id_] = scores.get(id_, 0.0) + 1.0 / (
+                    KNOWLEDGE_HYBRID_RRF_K + rank
+                )
+        best = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
+        return [{**records[id_], "score": scores[id_]} for id_ in best]
+
+    def _sync_keyword_index(self) -> None:
+        """Index chunks saved to the collection before it had a keyword index."""
+        if self._keywords_synced or not self.collection or not self.keyword_index:
+            return
+        key = self._collection_key()
+        total = self.collection.count()
+        if self.keyword_index.count(key) < total:
+            for offset in range(0, total, KNOWLEDGE_SAVE_BATCH_SIZE):
+                page = self.collection.get(
+                    include=["documents"],
+                    limit=KNOWLEDGE_SAVE_BATCH_SIZE,
+                    offset=offset,
+                )
+                self.keyword_index.add(key, page["ids"], page["documents"] or [])
+        self._keywords_synced = True
+
+    def _collection_key(self) -> str:
+        return sanitize_collection_name(
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
+
+    def _ensure_initialized(self) -> None:
+        if self.collection is None:
+            with self._init_lock:
+                if self.collection is None:
+                    self.initialize_knowledge_storage()
+
+    def initialize_knowledge_storage(self):
+        base_path = os.path.join(db_storage_path(), "knowledge")
+        self.app = get_chroma_client(base_path)
+
+        try:
             if self.app:
                 self.collection = self.app.get_or_create_collection(
-                    name=sanitize_collection_name(collection_name),
+                    name=self._collection_key(),
                     embedding_function=self.embedder,
                 )
+                self.keyword_index = KeywordIndex()
             else:
                 raise Exception("Vector Database Client not initialized")
         except Exception:
@@ -111,21 +260,23 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     def reset(self):
         base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
         if not self.app:
-            self.app = chromadb.PersistentClient(
-                path=base_path,
-                settings=Settings(allow_reset=True),
-            )
+            self.app = get_chroma_client(base_path)
 
         self.app.reset()
         shutil.rmtree(base_path)
+        release_chroma_client(base_path)
+        KeywordIndex().clear()
         self.app = None
         self.collection = None
+        self.keyword_index = None
+        self._keywords_synced = False
 
     def save(
         self,
         documents: List[str],
         metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
     ):
+        self._ensure_initialized()
         if not self.collection:
             raise Exception("Collection not initialized")
 
@@ -160,11 +311,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 None if all(m is None for m in filtered_metadata) else filtered_metadata
             )
 
-            self.collection.upsert(
-                documents=filtered_docs,
-                metadatas=final_metadata,
-                ids=filtered_ids,
-            )
+            self._ingest(filtered_ids, filtered_docs, final_metadata)
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
                 "error",
@@ -180,13 +327,83 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
+    def _ingest(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[Sequence[Any]],
+    ) -> None:
+        """Embed documents in concurrent batches and insert them with their embeddings."""
+        size = max(1, self.embedding_batch_size)
+        batches = [
+            range(start, min(start + size, len(ids)))
+            for start in range(0, len(ids), size)
+        ]
+        if not batches:
+            return
+
+        def insert(batch: range, embeddings: Any) -> None:
+            assert self.collection is not None
+            self.collection.upsert(
+                ids=[ids[i] for i in batch],
+                documents=[documents[i] for i in batch],
+                metadatas=None if metadatas is None else [metadatas[i] for i in batch],
+                embeddings=embeddings,
+            )
+            if self.keyword_index:
+                self.keyword_index.add(
+                    self._collection_key(),
+                    [ids[i] for i in batch],
+                    [documents[i] for i in batch],
+                )
+
+        workers = min(max(1, self.embedding_concurrency), len(batches))
+        if workers == 1:
+            for batch in batches:
+                insert(batch, self._embed_batch([documents[i] for i in batch]))
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="knowledge-embedding"
+        ) as pool:
+            futures: Dict[Future, range] = {
+                pool.submit(self._embed_batch, [documents[i] for i in batch]): batch
+                for batch in batches
+            }
+            try:
+                for future in as_completed(futures):
+                    insert(futures[future], future.result())
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _embed_batch(self, texts: List[str]) -> Any:
+        """Embed a batch of texts, retrying it with exponential backoff."""
+        for attempt in range(self.embedding_max_retries + 1):
+            try:
+                return self.embedder(texts)
+            except Exception as e:
+                if attempt == self.embedding_max_retries:
+                    raise
+                delay = KNOWLEDGE_EMBEDDING_RETRY_DELAY * 2**attempt
+                logging.warning(
+                    f"Embedding a batch of {len(texts)} knowledge chunks failed, "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+
     def _create_default_embedding_function(self):
         from chromadb.utils.embedding_functions.openai_embedding_function import (
             OpenAIEmbeddingFunction,
         )
 
-        return OpenAIEmbeddingFunction(
-            api_key=os.getenv("OPENAI_API_KEY"), model_name="text-embedding-3-small"
+        return cached_embedding_function(
+            OpenAIEmbeddingFunction(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                model_name="text-embedding-3-small",
+            ),
+            None,
         )
 
     def _set_embedder_config(self, embedder: Optional[Dict[str, Any]] = None) -> None:
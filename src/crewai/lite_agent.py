@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Type, Union, cast
@@ -16,6 +15,7 @@ from crewai.agents.parser import (
 from crewai.llm import LLM
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_index import ToolIndex
 from crewai.utilities import I18N
 from crewai.utilities.agent_utils import (
     enforce_rpm_limit,
@@ -50,7 +50,10 @@ from crewai.utilities.events.llm_events import (
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.printer import Printer
 from crewai.utilities.token_counter_callback import TokenCalcHandler
-from crewai.utilities.tool_utils import execute_tool_and_check_finality
+from crewai.utilities.tool_utils import (
+    execute_tool_and_check_finality,
+    run_with_async_tools,
+)
 
 
 class LiteAgentOutput(BaseModel):
@@ -156,6 +159,9 @@ class LiteAgent(BaseModel):
     )
     # Private Attributes
     _parsed_tools: List[CrewStructuredTool] = PrivateAttr(default_factory=list)
+    _tools_names: str = PrivateAttr(default="")
+    _tools_description: str = PrivateAttr(default="")
+    _tool_index: ToolIndex = PrivateAttr(default_factory=lambda: ToolIndex([]))
     _token_process: TokenProcess = PrivateAttr(default_factory=TokenProcess)
     _cache_handler: CacheHandler = PrivateAttr(default_factory=CacheHandler)
     _key: str = PrivateAttr(default_factory=lambda: str(uuid.uuid4()))
@@ -180,6 +186,9 @@ class LiteAgent(BaseModel):
     def parse_tools(self):
         """Parse the tools and convert them to CrewStructuredTool instances."""
         self._parsed_tools = parse_tools(self.tools)
+        self._tools_names = get_tool_names(self._parsed_tools)
+        self._tools_description = render_text_description_and_args(self._parsed_tools)
+        self._tool_index = ToolIndex(self._parsed_tools)
 
         return self
 
@@ -301,7 +310,7 @@ class LiteAgent(BaseModel):
         Returns:
             LiteAgentOutput: The result of the agent execution.
         """
-        return await asyncio.to_thread(self.kickoff, messages)
+        return await run_with_async_tools(self.kickoff, messages)
 
     def _get_default_system_prompt(self) -> str:
         """Get the default system prompt for the agent."""
@@ -312,8 +321,8 @@ class LiteAgent(BaseModel):
                 role=self.role,
                 backstory=self.backstory,
                 goal=self.goal,
-                tools=render_text_description_and_args(self._parsed_tools),
-                tool_names=get_tool_names(self._parsed_tools),
+                tools=self._tools_description,
+                tool_names=self._tools_names,
             )
         else:
             # Use the prompt template for agents without tools
@@ -419,6 +428,9 @@ class LiteAgent(BaseModel):
                             agent_key=self.key,
                             agent_role=self.role,
                             agent=self.original_agent,
+                            tools_description=self._tools_description,
+                            tools_names=self._tools_names,
+                            tool_index=self._tool_index,
                         )
                     except Exception as e:
                         raise e
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from crewai.memory import (
     EntityMemory,
@@ -7,9 +9,43 @@ from crewai.memory import (
     ShortTermMemory,
     UserMemory,
 )
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.constants import (
+    APPROX_CHARS_PER_TOKEN,
+    MEMORY_CONTEXT_TOKEN_BUDGET,
+    MEMORY_RETRIEVAL_WORKERS,
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MEMORY_RETRIEVAL_WORKERS,
+                thread_name_prefix="crewai-memory-search",
+            )
+        return _executor
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // APPROX_CHARS_PER_TOKEN + 1
 
 
 class ContextualMemory:
+    """Builds the memory context added to an agent's task prompt.
+
+    Every configured memory is searched concurrently. RAG-backed memories
+    that use the same embedder share a single query embedding. The merged
+    results are trimmed to `token_budget` tokens (set through the
+    "context_token_budget" key of the crew's memory_config, None for no
+    limit), keeping the best ranked result of every memory before the
+    second best of any.
+    """
+
     def __init__(
         self,
         memory_config: Optional[Dict[str, Any]],
@@ -21,8 +57,12 @@ class ContextualMemory:
     ):
         if memory_config is not None:
             self.memory_provider = memory_config.get("provider")
+            self.token_budget = memory_config.get(
+                "context_token_budget", MEMORY_CONTEXT_TOKEN_BUDGET
+            )
         else:
             self.memory_provider = None
+            self.token_budget = MEMORY_CONTEXT_TOKEN_BUDGET
         self.stm = stm
         self.ltm = ltm
         self.em = em
@@ -39,72 +79,160 @@ class ContextualMemory:
         if query == "":
             return ""
 
-        context = []
-        context.append(self._fetch_ltm_context(task.description))
-        context.append(self._fetch_stm_context(query))
-        context.append(self._fetch_entity_context(query))
-        context.append(self._fetch_external_context(query))
+        sections: List[Tuple[str, Callable[[Optional[Any]], List[str]]]] = [
+            ("Historical Data:", lambda _: self._fetch_ltm_items(task.description)),
+            ("Recent Insights:", lambda emb: self._fetch_stm_items(query, emb)),
+            ("Entities:", lambda emb: self._fetch_entity_items(query, emb)),
+            ("External memories:", lambda emb: self._fetch_external_items(query, emb)),
+        ]
         if self.memory_provider == "mem0":
-            context.append(self._fetch_user_context(query))
-        return "\n".join(filter(None, context))
+            sections.append(
+                ("User memories/preferences:", lambda _: self._fetch_user_items(query))
+            )
 
-    def _fetch_stm_context(self, query) -> str:
-        """
-        Fetches recent relevant insights from STM related to the task's description and expected_output,
-        formatted as bullet points.
-        """
+        embeddings = self._shared_query_embeddings(query)
+        executor = _get_executor()
+        futures: List[Future] = [
+            executor.submit(fetch, embeddings.get(heading))
+            for heading, fetch in sections
+        ]
+        results = [
+            (heading, future.result())
+            for (heading, _), future in zip(sections, futures)
+        ]
+        return self._render_within_budget(results)
 
-        if self.stm is None:
-            return ""
+    def _shared_query_embeddings(self, query: str) -> Dict[str, Any]:
+        """Embed the query once per embedder used by the RAG-backed memories."""
+        memories = {
+            "Recent Insights:": self.stm,
+            "Entities:": self.em,
+            "External memories:": self.exm,
+        }
+        groups: Dict[str, List[Tuple[str, RAGStorage]]] = {}
+        for heading, memory in memories.items():
+            storage = getattr(memory, "storage", None)
+            if isinstance(storage, RAGStorage):
+                groups.setdefault(storage.embedder_key, []).append((heading, storage))
 
-        stm_results = self.stm.search(query)
-        formatted_results = "\n".join(
-            [
-                f"- {result['memory'] if self.memory_provider == 'mem0' else result['context']}"
-                for result in stm_results
-            ]
-        )
-        return f"Recent Insights:\n{formatted_results}" if stm_results else ""
+        embeddings: Dict[str, Any] = {}
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            try:
+                embedding = members[0][1].embed_query(query)
+            except Exception:
+                # Each memory falls back to embedding the query itself
+                continue
+            for heading, _ in members:
+                embeddings[heading] = embedding
+        return embeddings
 
-    def _fetch_ltm_context(self, task) -> Optional[str]:
-        """
-        Fetches historical data or insights from LTM that are relevant to the task's description and expected_output,
-        formatted as bullet points.
-        """
+    def _render_within_budget(self, results: List[Tuple[str, List[str]]]) -> str:
+        """Render the sections, dropping the lowest ranked items over budget."""
+        selected: List[List[bool]] = [[False] * len(items) for _, items in results]
+        remaining = self.token_budget
+        depth = max((len(items) for _, items in results), default=0)
+        for rank in range(depth):
+            for index, (heading, items) in enumerate(results):
+                if rank >= len(items):
+                    continue
+                cost = _estimate_tokens(f"- {items[rank]}")
+                if not any(selected[index]):
+                    cost += _estimate_tokens(heading)
+                if remaining is not None:
+                    if cost > remaining:
+                        continue
+                    remaining -= cost
+                selected[index][rank] = True
 
-        if self.ltm is None:
-            return ""
+        rendered = [
+            self._format_section(
+                heading, [item for item, chosen in zip(items, keep) if chosen]
+            )
+            for (heading, items), keep in zip(results, selected)
+        ]
+        return "\n".join(filter(None, rendered))
 
+    def _result_text(self, result: Dict[str, Any]) -> str:
+        return result["memory"] if self.memory_provider == "mem0" else result["context"]
+
+    def _fetch_stm_items(
+        self, query: str, query_embedding: Optional[Any] = None
+    ) -> List[str]:
+        if self.stm is None:
+            return []
+        if query_embedding is None:
+            stm_results = self.stm.search(query)
+        else:
+            stm_results = self.stm.search(query, query_embedding=query_embedding)
+        return [self._result_text(result) for result in stm_results]
+
+    def _fetch_ltm_items(self, task: str) -> List[str]:
+        if self.ltm is None:
+            return []
         ltm_results = self.ltm.search(task, latest_n=2)
         if not ltm_results:
-            return None
-
-        formatted_results = [
+            return []
+        suggestions = [
             suggestion
             for result in ltm_results
             for suggestion in result["metadata"]["suggestions"]  # type: ignore # Invalid index type "str" for "str"; expected type "SupportsIndex | slice"
         ]
-        formatted_results = list(dict.fromkeys(formatted_results))
-        formatted_results = "\n".join([f"- {result}" for result in formatted_results])  # type: ignore # Incompatible types in assignment (expression has type "str", variable has type "list[str]")
+        return list(dict.fromkeys(suggestions))
+
+    def _fetch_entity_items(
+        self, query: str, query_embedding: Optional[Any] = None
+    ) -> List[str]:
+        if self.em is None:
+            return []
+        if query_embedding is None:
+            em_results = self.em.search(query)
+        else:
+            em_results = self.em.search(query, query_embedding=query_embedding)
+        return [self._result_text(result) for result in em_results]  # type: ignore #  Invalid index type "str" for "str"; expected type "SupportsIndex | slice"
+
+    def _fetch_user_items(self, query: str) -> List[str]:
+        if self.um is None:
+            return []
+        return [result["memory"] for result in self.um.search(query) or []]
 
-        return f"Historical Data:\n{formatted_results}" if ltm_results else ""
+    def _fetch_external_items(
+        self, query: str, query_embedding: Optional[Any] = None
+    ) -> List[str]:
+        if self.exm is None:
+            return []
+        if query_embedding is None:
+            external_memories = self.exm.search(query)
+        else:
+            external_memories = self.exm.search(query, query_embedding=query_embedding)
+        return [result["memory"] for result in external_memories or []]
+
+    def _format_section(self, heading: str, items: List[str]) -> str:
+        if not items:
+            return ""
+        return f"{heading}\n" + "\n".join(f"- {item}" for item in items)
+
+    def _fetch_stm_context(self, query) -> str:
+        """
+        Fetches recent relevant insights from STM related to the task's description and expected_output,
+        formatted as bullet points.
+        """
+        return self._format_section("Recent Insights:", self._fetch_stm_items(query))
+
+    def _fetch_ltm_context(self, task) -> Optional[str]:
+        """
+        Fetches historical data or insights from LTM that are relevant to the task's description and expected_output,
+        formatted as bullet points.
+        """
+        return self._format_section("Historical Data:", self._fetch_ltm_items(task))
 
     def _fetch_entity_context(self, query) -> str:
         """
         Fetches relevant entity information from Entity Memory related to the task's description and expected_output,
         formatted as bullet points.
         """
-        if self.em is None:
-            return ""
-
-        em_results = self.em.search(query)
-        formatted_results = "\n".join(
-            [
-                f"- {result['memory'] if self.memory_provider == 'mem0' else result['context']}"
-                for result in em_results
-            ]  # type: ignore #  Invalid index type "str" for "str"; expected type "SupportsIndex | slice"
-        )
-        return f"Entities:\n{formatted_results}" if em_results else ""
+        return self._format_section("Entities:", self._fetch_entity_items(query))
 
     def _fetch_user_context(self, query: str) -> str:
         """
@@ -114,18 +242,9 @@ class ContextualMemory:
         Returns:
             str: Formatted user memories as bullet points, or an empty string if none found.
         """
-
-        if self.um is None:
-            return ""
-
-        user_memories = self.um.search(query)
-        if not user_memories:
-            return ""
-
-        formatted_memories = "\n".join(
-            f"- {result['memory']}" for result in user_memories
+        return self._format_section(
+            "User memories/preferences:", self._fetch_user_items(query)
         )
-        return f"User memories/preferences:\n{formatted_memories}"
 
     def _fetch_external_context(self, query: str) -> str:
         """
@@ -135,15 +254,6 @@ class ContextualMemory:
         Returns:
             str: Formatted information as bullet points, or an empty string if none found.
         """
-        if self.exm is None:
-            return ""
-
-        external_memories = self.exm.search(query)
-
-        if not external_memories:
-            return ""
-
-        formatted_memories = "\n".join(
-            f"- {result['memory']}" for result in external_memories
+        return self._format_section(
+            "External memories:", self._fetch_external_items(query)
         )
-        return f"External memories:\n{formatted_memories}"
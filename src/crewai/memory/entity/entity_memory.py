@@ -4,7 +4,9 @@ from pydantic import PrivateAttr
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.memory import Memory
-from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.retention import CompactionStats, retention_policy
+from crewai.memory.storage.rag_storage import RAGStorage, create_rag_storage
+from crewai.utilities.constants import ENTITY_MERGE_DISTANCE
 
 
 class EntityMemory(Memory):
@@ -34,12 +36,13 @@ class EntityMemory(Memory):
             storage = (
                 storage
                 if storage
-                else RAGStorage(
+                else create_rag_storage(
                     type="entities",
                     allow_reset=True,
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    retention=retention_policy(crew, "entities"),
                 )
             )
 
@@ -59,6 +62,12 @@ class EntityMemory(Memory):
             data = f"{item.name}({item.type}): {item.description}"
         super().save(data, item.metadata)
 
+    def compact(self) -> Optional[CompactionStats]:
+        """Compact the storage, merging entities described almost identically."""
+        if isinstance(self.storage, RAGStorage):
+            return self.storage.compact(merge_distance=ENTITY_MERGE_DISTANCE)
+        return super().compact()
+
     def reset(self) -> None:
         try:
             self.storage.reset()
@@ -1,8 +1,12 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from pydantic import PrivateAttr
 
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
 from crewai.memory.memory import Memory
+from crewai.memory.retention import retention_policy
 from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.utilities import EmbeddingConfigurator
 
 
 class LongTermMemory(Memory):
@@ -12,24 +16,53 @@ class LongTermMemory(Memory):
     Inherits from the Memory class and utilizes an instance of a class that
     adheres to the Storage for data storage, specifically working with
     LongTermMemoryItem instances.
+
+    Past tasks are found by full-text similarity to the task at hand. When an
+    embedder_config is given, task descriptions are also embedded and
+    similar tasks are ranked by their embeddings.
     """
 
-    def __init__(self, storage=None, path=None):
+    _embedder: Optional[Any] = PrivateAttr(default=None)
+
+    def __init__(self, storage=None, path=None, embedder_config=None, crew=None):
         if not storage:
-            storage = LTMSQLiteStorage(db_path=path) if path else LTMSQLiteStorage()
-        super().__init__(storage=storage)
+            retention = retention_policy(crew, "long_term")
+            storage = (
+                LTMSQLiteStorage(db_path=path, retention=retention)
+                if path
+                else LTMSQLiteStorage(retention=retention)
+            )
+        super().__init__(storage=storage, embedder_config=embedder_config)
+
+    def _embed(self, text: str) -> Optional[Any]:
+        if self.embedder_config is None or not isinstance(
+            self.storage, LTMSQLiteStorage
+        ):
+            return None
+        if self._embedder is None:
+            self._embedder = EmbeddingConfigurator().configure_embedder(
+                self.embedder_config
+            )
+        return self._embedder([text])[0]
 
     def save(self, item: LongTermMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
         metadata = item.metadata
         metadata.update({"agent": item.agent, "expected_output": item.expected_output})
+        embedding = self._embed(item.task)
+        kwargs = {} if embedding is None else {"embedding": embedding}
         self.storage.save(  # type: ignore # BUG?: Unexpected keyword argument "task_description","score","datetime" for "save" of "Storage"
             task_description=item.task,
             score=metadata["quality"],
             metadata=metadata,
             datetime=item.datetime,
+            **kwargs,
         )
 
     def search(self, task: str, latest_n: int = 3) -> List[Dict[str, Any]]:  # type: ignore # signature of "search" incompatible with supertype "Memory"
+        if isinstance(self.storage, LTMSQLiteStorage):
+            return self.storage.search(  # type: ignore # returns None when nothing matches
+                task, limit=latest_n, query_embedding=self._embed(task)
+            )
         return self.storage.load(task, latest_n)  # type: ignore # BUG?: "Storage" has no attribute "load"
 
     def reset(self) -> None:
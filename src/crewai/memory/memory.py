@@ -2,6 +2,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from crewai.memory.retention import CompactionStats
+
 
 class Memory(BaseModel):
     """
@@ -33,11 +35,26 @@ class Memory(BaseModel):
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[Any] = None,
     ) -> List[Any]:
+        kwargs = {} if query_embedding is None else {"query_embedding": query_embedding}
         return self.storage.search(
-            query=query, limit=limit, score_threshold=score_threshold
+            query=query, limit=limit, score_threshold=score_threshold, **kwargs
         )
 
+    def flush(self) -> None:
+        """Write any entries the storage is still buffering."""
+        flush = getattr(self.storage, "flush", None)
+        if callable(flush):
+            flush()
+
+    def compact(self) -> Optional[CompactionStats]:
+        """Deduplicate, prune and vacuum the storage, if it supports it."""
+        compact = getattr(self.storage, "compact", None)
+        if callable(compact):
+            return compact()
+        return None
+
     def set_crew(self, crew: Any) -> "Memory":
         self.crew = crew
         return self
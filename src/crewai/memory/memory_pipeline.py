@@ -0,0 +1,185 @@
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+import weakref
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional, Tuple
+
+from crewai.utilities.constants import (
+    MEMORY_PIPELINE_EXIT_TIMEOUT,
+    MEMORY_PIPELINE_MAX_PENDING,
+    MEMORY_PIPELINE_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+_Job = Tuple[str, Callable[[], None], contextvars.Context]
+
+
+@dataclass
+class MemoryPipelineStats:
+    """Counters describing the work done by a memory pipeline.
+
+    Attributes:
+        submitted: Jobs handed to the pipeline.
+        completed: Jobs that finished without an error.
+        failed: Jobs that raised an error.
+        backpressure_waits: Submissions that had to wait for queue space.
+        max_pending: Highest number of jobs queued or running at once.
+    """
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    backpressure_waits: int = 0
+    max_pending: int = 0
+
+
+def _flush_at_exit(
+    pipeline: "weakref.ReferenceType[MemoryPipeline]",
+) -> Callable[[], None]:
+    def flush() -> None:
+        instance = pipeline()
+        if instance is not None:
+            instance.flush(timeout=MEMORY_PIPELINE_EXIT_TIMEOUT)
+
+    return flush
+
+
+class MemoryPipeline:
+    """Runs memory evaluation and writes on background worker threads.
+
+    Jobs wait in a bounded queue. When it is full, `submit` blocks until a
+    worker frees a slot, so a crew producing memories faster than they can
+    be written slows down instead of growing the backlog without limit.
+    Failed jobs are logged and counted; they never fail the crew.
+
+    Attributes:
+        max_pending: Jobs that may wait in the queue before `submit` blocks.
+        workers: Number of worker threads.
+        last_error: The error raised by the most recent failed job.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = MEMORY_PIPELINE_MAX_PENDING,
+        workers: int = MEMORY_PIPELINE_WORKERS,
+    ) -> None:
+        self.max_pending = max_pending
+        self.workers = workers
+        self.last_error: Optional[BaseException] = None
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._stats = MemoryPipelineStats()
+        self._threads: List[threading.Thread] = []
+        self._exit_hook: Optional[Callable[[], None]] = None
+
+    @property
+    def stats(self) -> MemoryPipelineStats:
+        """A snapshot of the pipeline counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, job: Callable[[], None], name: str = "memory write") -> None:
+        """Queue a job, blocking while the queue is full.
+
+        Args:
+            job: The work to run in the background.
+            name: Description of the job used in failure logs.
+        """
+        self._start()
+        with self._lock:
+            self._pending += 1
+            self._stats.submitted += 1
+            self._stats.max_pending = max(self._stats.max_pending, self._pending)
+
+        item = (name, job, contextvars.copy_context())
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._stats.backpressure_waits += 1
+            self._queue.put(item)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job has finished.
+
+        Args:
+            timeout: Seconds to wait, None to wait as long as needed.
+
+        Returns:
+            True if the pipeline drained, False if the timeout expired first.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers once the jobs already submitted have run.
+
+        The next `submit` starts new workers, so a pipeline can be shut down
+        whenever it goes idle.
+
+        Args:
+            wait: Whether to wait for the workers to exit.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+            exit_hook = self._exit_hook if wait else None
+            if exit_hook is not None:
+                self._exit_hook = None
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+        if exit_hook is not None:
+            atexit.unregister(exit_hook)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"crewai-memory-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+            if self._exit_hook is None:
+                # Workers are daemon threads, give pending writes a chance at exit
+                self._exit_hook = _flush_at_exit(weakref.ref(self))
+                atexit.register(self._exit_hook)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            name, job, context = item
+            failed = False
+            try:
+                context.run(job)
+            except Exception as e:
+                failed = True
+                logger.error(f"Memory pipeline job '{name}' failed: {e}")
+                self.last_error = e
+            with self._idle:
+                self._pending -= 1
+                if failed:
+                    self._stats.failed += 1
+                else:
+                    self._stats.completed += 1
+                if self._pending == 0:
+                    self._idle.notify_all()
@@ -0,0 +1,94 @@
+import hashlib
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Optional
+
+from crewai.utilities.constants import (
+    ENTITY_MEMORY_MAX_ITEMS,
+    LONG_TERM_MEMORY_MAX_ITEMS,
+    SHORT_TERM_MEMORY_MAX_ITEMS,
+)
+
+SAVED_AT_KEY = "saved_at"
+"""Metadata key holding the time an entry was saved, used for TTL and eviction."""
+
+
+@dataclass
+class RetentionPolicy:
+    """Limits on what a memory store keeps.
+
+    Attributes:
+        max_items: Entries kept before the oldest are evicted, None for no
+            limit. Vector stores past it evict down to
+            `MEMORY_RETENTION_LOW_WATER` of it at once.
+        ttl: Seconds an entry is kept after it was saved, None to keep
+            entries until they are evicted.
+        dedup: Store identical content once. Saving it again refreshes the
+            stored entry instead of adding a copy.
+    """
+
+    max_items: Optional[int] = None
+    ttl: Optional[float] = None
+    dedup: bool = True
+
+
+@dataclass
+class CompactionStats:
+    """What compacting a memory store removed.
+
+    Attributes:
+        duplicates: Entries with the same content as a newer entry.
+        merged: Near-duplicate entries folded into a similar, newer entry.
+        expired: Entries older than the TTL.
+        evicted: Oldest entries removed to stay within `max_items`.
+        remaining: Entries left in the store.
+    """
+
+    duplicates: int = 0
+    merged: int = 0
+    expired: int = 0
+    evicted: int = 0
+    remaining: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.duplicates + self.merged + self.expired + self.evicted
+
+
+DEFAULT_RETENTION: Dict[str, RetentionPolicy] = {
+    "short_term": RetentionPolicy(max_items=SHORT_TERM_MEMORY_MAX_ITEMS),
+    "entities": RetentionPolicy(max_items=ENTITY_MEMORY_MAX_ITEMS),
+    "long_term": RetentionPolicy(max_items=LONG_TERM_MEMORY_MAX_ITEMS),
+}
+
+
+def retention_policy(crew: Any, memory_type: str) -> RetentionPolicy:
+    """Resolve the retention policy of a memory type for a crew.
+
+    The defaults can be overridden per memory type through the crew's
+    memory_config, e.g. `{"retention": {"short_term": {"ttl": 86400}}}`.
+
+    Args:
+        crew: The crew owning the memory, or None.
+        memory_type: "short_term", "entities" or "long_term".
+
+    Returns:
+        The default policy of the type, updated with the crew's overrides.
+    """
+    policy = DEFAULT_RETENTION.get(memory_type, RetentionPolicy())
+    memory_config = getattr(crew, "memory_config", None) or {}
+    overrides = (memory_config.get("retention") or {}).get(memory_type)
+    if isinstance(overrides, RetentionPolicy):
+        return overrides
+    overrides = overrides or {}
+    known = {f.name for f in fields(RetentionPolicy)}
+    unknown = set(overrides) - known
+    if unknown:
+        raise ValueError(
+            f"Unknown retention settings for {memory_type} memory: {sorted(unknown)}"
+        )
+    return replace(policy, **overrides)
+
+
+def content_id(content: str) -> str:
+    """Stable id of a memory entry derived from its content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
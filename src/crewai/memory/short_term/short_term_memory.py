@@ -3,8 +3,9 @@ from typing import Any, Dict, Optional
 from pydantic import PrivateAttr
 
 from crewai.memory.memory import Memory
+from crewai.memory.retention import retention_policy
 from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
-from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.storage.rag_storage import create_rag_storage
 
 
 class ShortTermMemory(Memory):
@@ -36,11 +37,12 @@ class ShortTermMemory(Memory):
             storage = (
                 storage
                 if storage
-                else RAGStorage(
+                else create_rag_storage(
                     type="short_term",
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    retention=retention_policy(crew, "short_term"),
                 )
             )
         super().__init__(storage=storage)
@@ -63,9 +65,11 @@ class ShortTermMemory(Memory):
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[Any] = None,
     ):
+        kwargs = {} if query_embedding is None else {"query_embedding": query_embedding}
         return self.storage.search(
-            query=query, limit=limit, score_threshold=score_threshold
+            query=query, limit=limit, score_threshold=score_threshold, **kwargs
         )  # type: ignore # BUG? The reference is to the parent class, but the parent class does not have this parameters
 
     def reset(self) -> None:
@@ -55,6 +55,10 @@ class BaseRAGStorage(ABC):
         """Reset the storage."""
         pass
 
+    def flush(self) -> None:
+        """Write any buffered entries to the storage."""
+        pass
+
     @abstractmethod
     def _generate_embedding(
         self, text: str, metadata: Optional[Dict[str, Any]] = None
@@ -14,3 +14,7 @@ class Storage:
 
     def reset(self) -> None:
         pass
+
+    def flush(self) -> None:
+        """Write any buffered entries."""
+        pass
@@ -9,9 +9,28 @@ from crewai.utilities import Printer
 from crewai.utilities.crew_json_encoder import CrewJSONEncoder
 from crewai.utilities.errors import DatabaseError, DatabaseOperationError
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
 
 logger = logging.getLogger(__name__)
 
+KICKOFF_TASK_OUTPUTS_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
+        task_id TEXT PRIMARY KEY,
+        expected_output TEXT,
+        output JSON,
+        task_index INTEGER,
+        inputs JSON,
+        was_replayed BOOLEAN,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_latest_kickoff_task_outputs_task_index
+    ON latest_kickoff_task_outputs (task_index)
+    """,
+]
+
 
 class KickoffTaskOutputsSQLiteStorage:
     """
@@ -26,8 +45,15 @@ class KickoffTaskOutputsSQLiteStorage:
             db_path = str(Path(db_storage_path()) / "latest_kickoff_task_outputs.db")
         self.db_path = db_path
         self._printer: Printer = Printer()
+        self._pool: Optional[SQLiteConnectionPool] = None
         self._initialize_db()
 
+    @property
+    def pool(self) -> SQLiteConnectionPool:
+        if self._pool is None:
+            self._pool = get_sqlite_pool(self.db_path, KICKOFF_TASK_OUTPUTS_MIGRATIONS)
+        return self._pool
+
     def _initialize_db(self) -> None:
         """Initialize the SQLite database and create the latest_kickoff_task_outputs table.
 
@@ -39,23 +65,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If database initialization fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
-                        task_id TEXT PRIMARY KEY,
-                        expected_output TEXT,
-                        output JSON,
-                        task_index INTEGER,
-                        inputs JSON,
-                        was_replayed BOOLEAN,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                )
-
-                conn.commit()
+            self._pool = get_sqlite_pool(self.db_path, KICKOFF_TASK_OUTPUTS_MIGRATIONS)
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
             logger.error(error_msg)
@@ -82,10 +92,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If saving the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-                cursor.execute(
+            with self.pool.transaction() as conn:
+                conn.execute(
                     """
                 INSERT OR REPLACE INTO latest_kickoff_task_outputs
                 (task_id, expected_output, output, task_index, inputs, was_replayed)
@@ -100,7 +108,6 @@ class KickoffTaskOutputsSQLiteStorage:
                         was_replayed,
                     ),
                 )
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
             logger.error(error_msg)
@@ -125,10 +132,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If updating the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-
+            with self.pool.transaction() as conn:
                 fields = []
                 values = []
                 for key, value in kwargs.items():
@@ -142,8 +146,7 @@ class KickoffTaskOutputsSQLiteStorage:
                 query = f"UPDATE latest_kickoff_task_outputs SET {', '.join(fields)} WHERE task_index = ?"  # nosec
                 values.append(task_index)
 
-                cursor.execute(query, tuple(values))
-                conn.commit()
+                cursor = conn.execute(query, tuple(values))
 
                 if cursor.rowcount == 0:
                     logger.warning(f"No row found with task_index {task_index}. No update performed.")
@@ -164,29 +167,29 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If loading task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
+            rows = (
+                self.pool.connection()
+                .execute("""
                 SELECT *
                 FROM latest_kickoff_task_outputs
                 ORDER BY task_index
                 """)
-
-                rows = cursor.fetchall()
-                results = []
-                for row in rows:
-                    result = {
-                        "task_id": row[0],
-                        "expected_output": row[1],
-                        "output": json.loads(row[2]),
-                        "task_index": row[3],
-                        "inputs": json.loads(row[4]),
-                        "was_replayed": row[5],
-                        "timestamp": row[6],
-                    }
-                    results.append(result)
-
-                return results
+                .fetchall()
+            )
+            results = []
+            for row in rows:
+                result = {
+                    "task_id": row[0],
+                    "expected_output": row[1],
+                    "output": json.loads(row[2]),
+                    "task_index": row[3],
+                    "inputs": json.loads(row[4]),
+                    "was_replayed": row[5],
+                    "timestamp": row[6],
+                }
+                results.append(result)
+
+            return results
 
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.LOAD_ERROR, e)
@@ -203,11 +206,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If deleting task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM latest_kickoff_task_outputs")
-                conn.commit()
+            with self.pool.transaction() as conn:
+                conn.execute("DELETE FROM latest_kickoff_task_outputs")
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
             logger.error(error_msg)
@@ -1,10 +1,112 @@
 import json
+import math
+import re
 import sqlite3
+import time
+from dataclasses import replace
+from datetime import datetime as dt
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
+
+from crewai.memory.retention import (
+    DEFAULT_RETENTION,
+    CompactionStats,
+    RetentionPolicy,
+    content_id,
+)
 from crewai.utilities import Printer
+from crewai.utilities.constants import (
+    LONG_TERM_MEMORY_PRUNE_INTERVAL,
+    LTM_COMMON_TERM_ROWS,
+    LTM_RECENCY_HALF_LIFE,
+    LTM_RECENCY_WEIGHT,
+    LTM_SEARCH_CANDIDATE_FACTOR,
+    LTM_SEARCH_MAX_TERMS,
+)
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
+
+LTM_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS long_term_memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_description TEXT,
+        metadata TEXT,
+        datetime TEXT,
+        score REAL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_long_term_memories_task
+    ON long_term_memories (task_description, datetime DESC, score)
+    """,
+    """
+    ALTER TABLE long_term_memories ADD COLUMN embedding BLOB;
+    CREATE VIRTUAL TABLE IF NOT EXISTS long_term_memories_fts USING fts5(
+        task_description,
+        content='long_term_memories',
+        content_rowid='id'
+    );
+    CREATE TRIGGER IF NOT EXISTS long_term_memories_fts_insert
+    AFTER INSERT ON long_term_memories BEGIN
+        INSERT INTO long_term_memories_fts (rowid, task_description)
+        VALUES (new.id, new.task_description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS long_term_memories_fts_delete
+    AFTER DELETE ON long_term_memories BEGIN
+        INSERT INTO long_term_memories_fts (long_term_memories_fts, rowid, task_description)
+        VALUES ('delete', old.id, old.task_description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS long_term_memories_fts_update
+    AFTER UPDATE OF task_description ON long_term_memories BEGIN
+        INSERT INTO long_term_memories_fts (long_term_memories_fts, rowid, task_description)
+        VALUES ('delete', old.id, old.task_description);
+        INSERT INTO long_term_memories_fts (rowid, task_description)
+        VALUES (new.id, new.task_description);
+    END;
+    INSERT INTO long_term_memories_fts (long_term_memories_fts) VALUES ('rebuild');
+    """,
+    """
+    ALTER TABLE long_term_memories ADD COLUMN content_hash TEXT;
+    CREATE INDEX IF NOT EXISTS idx_long_term_memories_content_hash
+    ON long_term_memories (content_hash);
+    """,
+]
+
+# Too common to tell tasks apart, and expensive to match in a large index
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in into is it its of on or that the "
+    "this to was were will with you your".split()
+)
+
+
+def _query_terms(text: str) -> List[str]:
+    """Distinct terms of free text, quoted for an FTS5 query, longest first."""
+    terms = dict.fromkeys(
+        term
+        for term in re.findall(r"\w+", text.casefold())
+        if len(term) > 1 and term not in _STOPWORDS
+    )
+    # Longer terms tend to be rarer, keep those when the text is long
+    kept = sorted(terms, key=len, reverse=True)[:LTM_SEARCH_MAX_TERMS]
+    return [f'"{term}"' for term in kept]
+
+
+def _content_hash(task_description: str, metadata_json: str) -> str:
+    return content_id(f"{task_description}\x00{metadata_json}")
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return dt.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
 
 
 class LTMSQLiteStorage:
@@ -13,37 +115,34 @@ class LTMSQLiteStorage:
     """
 
     def __init__(
-        self, db_path: Optional[str] = None
+        self,
+        db_path: Optional[str] = None,
+        retention: Optional[RetentionPolicy] = None,
     ) -> None:
         if db_path is None:
             # Get the parent directory of the default db path and create our db file there
             db_path = str(Path(db_storage_path()) / "long_term_memory_storage.db")
         self.db_path = db_path
         self._printer: Printer = Printer()
+        self._pool: Optional[SQLiteConnectionPool] = None
+        self.retention = retention or replace(DEFAULT_RETENTION["long_term"])
+        self._saves = 0
         # Ensure parent directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self._initialize_db()
 
+    @property
+    def pool(self) -> SQLiteConnectionPool:
+        if self._pool is None:
+            self._pool = get_sqlite_pool(self.db_path, LTM_MIGRATIONS)
+        return self._pool
+
     def _initialize_db(self):
         """
         Initializes the SQLite database and creates LTM table
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS long_term_memories (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        task_description TEXT,
-                        metadata TEXT,
-                        datetime TEXT,
-                        score REAL
-                    )
-                """
-                )
-
-                conn.commit()
+            self._pool = get_sqlite_pool(self.db_path, LTM_MIGRATIONS)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred during database initialization: {e}",
@@ -56,52 +155,146 @@ class LTMSQLiteStorage:
         metadata: Dict[str, Any],
         datetime: str,
         score: Union[int, float],
+        embedding: Optional[Sequence[float]] = None,
     ) -> None:
-        """Saves data to the LTM table with error handling."""
+        """Saves data to the LTM table with error handling.
+
+        With deduplication on, saving a task with the same description and
+        metadata as a stored one replaces it, so it counts as new again.
+        """
+        blob = (
+            None
+            if embedding is None
+            else np.asarray(embedding, dtype=np.float32).tobytes()
+        )
+        metadata_json = json.dumps(metadata)
+        digest = (
+            _content_hash(task_description, metadata_json)
+            if self.retention.dedup
+            else None
+        )
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self.pool.transaction() as conn:
+                if digest is not None:
+                    conn.execute(
+                        "DELETE FROM long_term_memories WHERE content_hash = ?",
+                        (digest,),
+                    )
+                conn.execute(
                     """
-                INSERT INTO long_term_memories (task_description, metadata, datetime, score)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO long_term_memories (task_description, metadata, datetime, score, embedding, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
             """,
-                    (task_description, json.dumps(metadata), datetime, score),
+                    (task_description, metadata_json, datetime, score, blob, digest),
                 )
-                conn.commit()
+            self._saves += 1
+            if self._saves % LONG_TERM_MEMORY_PRUNE_INTERVAL == 0:
+                self.prune()
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
                 color="red",
             )
 
+    def prune(self) -> Tuple[int, int]:
+        """Drops rows older than the TTL and the oldest rows past `max_items`.
+
+        Returns:
+            The number of expired and of evicted rows.
+        """
+        expired = evicted = 0
+        with self.pool.transaction() as conn:
+            if self.retention.ttl is not None:
+                # datetime holds time.time() as text; skip other formats
+                expired = conn.execute(
+                    """
+                    DELETE FROM long_term_memories
+                    WHERE datetime NOT GLOB '*[^0-9.]*'
+                    AND CAST(datetime AS REAL) < ?
+                """,
+                    (time.time() - self.retention.ttl,),
+                ).rowcount
+            if self.retention.max_items is not None:
+                evicted = conn.execute(
+                    """
+                    DELETE FROM long_term_memories
+                    WHERE id <= (
+                        SELECT id FROM long_term_memories
+                        ORDER BY id DESC
+                        LIMIT 1 OFFSET ?
+                    )
+                """,
+                    (self.retention.max_items,),
+                ).rowcount
+        return expired, evicted
+
+    def compact(self) -> CompactionStats:
+        """Deduplicates and prunes the table, then optimizes and vacuums it."""
+        stats = CompactionStats()
+        conn = self.pool.connection()
+        with conn:
+            # Rows saved before content hashes existed
+            legacy = conn.execute(
+                """
+                SELECT id, task_description, metadata
+                FROM long_term_memories WHERE content_hash IS NULL
+            """
+            ).fetchall()
+            conn.executemany(
+                "UPDATE long_term_memories SET content_hash = ? WHERE id = ?",
+                [
+                    (_content_hash(task_description or "", metadata or ""), row_id)
+                    for row_id, task_description, metadata in legacy
+                ],
+            )
+            stats.duplicates = conn.execute(
+                """
+                DELETE FROM long_term_memories
+                WHERE id NOT IN (
+                    SELECT MAX(id) FROM long_term_memories GROUP BY content_hash
+                )
+            """
+            ).rowcount
+        stats.expired, stats.evicted = self.prune()
+        with conn:
+            conn.execute(
+                "INSERT INTO long_term_memories_fts (long_term_memories_fts) "
+                "VALUES ('optimize')"
+            )
+        conn.execute("VACUUM")
+        stats.remaining = conn.execute(
+            "SELECT COUNT(*) FROM long_term_memories"
+        ).fetchone()[0]
+        return stats
+
     def load(
         self, task_description: str, latest_n: int
     ) -> Optional[List[Dict[str, Any]]]:
         """Queries the LTM table by task description with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"""
+            rows = (
+                self.pool.connection()
+                .execute(
+                    """
                     SELECT metadata, datetime, score
                     FROM long_term_memories
                     WHERE task_description = ?
                     ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec
-                    (task_description,),
+                    LIMIT ?
+                """,
+                    (task_description, latest_n),
                 )
-                rows = cursor.fetchall()
-                if rows:
-                    return [
-                        {
-                            "metadata": json.loads(row[0]),
-                            "datetime": row[1],
-                            "score": row[2],
-                        }
-                        for row in rows
-                    ]
+                .fetchall()
+            )
+            if rows:
+                return [
+                    {
+                        "metadata": json.loads(row[0]),
+                        "datetime": row[1],
+                        "score": row[2],
+                    }
+                    for row in rows
+                ]
 
         except sqlite3.Error as e:
             self._printer.print(
@@ -110,15 +303,134 @@ class LTMSQLiteStorage:
             )
         return None
 
+    def search(
+        self,
+        query: str,
+        limit: int = 3,
+        query_embedding: Optional[Sequence[float]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Finds the past tasks most similar to `query`.
+
+        Candidates are the best BM25 matches of the query terms in the
+        full-text index of task descriptions. When `query_embedding` is given,
+        candidates stored with an embedding are ranked by cosine similarity
+        instead. Relevance is then blended with recency, so of two equally
+        similar tasks the most recent one wins.
+
+        Args:
+            query: Description of the task at hand.
+            limit: Maximum number of results.
+            query_embedding: Embedding of `query`, optional.
+
+        Returns:
+            Results with the same fields as `load` plus their `relevance`, or
+            None when nothing matches.
+        """
+        terms = _query_terms(query)
+        if not terms:
+            return self.load(query, limit)
+        try:
+            rows = self._candidates(terms, limit * LTM_SEARCH_CANDIDATE_FACTOR)
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: An error occurred while searching LTM: {e}",
+                color="red",
+            )
+            return None
+        if not rows:
+            return None
+
+        # bm25() is negative, lower is better
+        best = max(-row[3] for row in rows) or 1.0
+        query_vector = (
+            None
+            if query_embedding is None
+            else np.asarray(query_embedding, dtype=np.float32)
+        )
+        now = time.time()
+        results = []
+        for metadata, datetime, score, rank, blob in rows:
+            relevance = -rank / best
+            if query_vector is not None and blob is not None:
+                vector = np.frombuffer(blob, dtype=np.float32)
+                norms = np.linalg.norm(vector) * np.linalg.norm(query_vector)
+                if vector.shape == query_vector.shape and norms:
+                    relevance = float(vector @ query_vector) / norms
+            timestamp = _timestamp(datetime)
+            recency = (
+                0.0
+                if timestamp is None
+                else math.pow(0.5, max(now - timestamp, 0.0) / LTM_RECENCY_HALF_LIFE)
+            )
+            results.append(
+                (
+                    (1 - LTM_RECENCY_WEIGHT) * relevance + LTM_RECENCY_WEIGHT * recency,
+                    timestamp or 0.0,
+                    {
+                        "metadata": json.loads(metadata),
+                        "datetime": datetime,
+                        "score": score,
+                        "relevance": relevance,
+                    },
+                )
+            )
+        results.sort(key=lambda result: (result[0], result[1]), reverse=True)
+        return [result for _, _, result in results[:limit]]
+
+    def _candidates(self, terms: List[str], limit: int) -> List[Any]:
+        conn = self.pool.connection()
+        # Ranking has to score every row matching a term, so a term shared by
+        # most tasks (the words of a task template) makes it scan the table.
+        # Counting stops at the threshold, so finding those terms is cheap.
+        counts = {
+            term: conn.execute(
+                """
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM long_term_memories_fts
+                    WHERE long_term_memories_fts MATCH ?
+                    LIMIT ?
+                )
+            """,
+                (term, LTM_COMMON_TERM_ROWS),
+            ).fetchone()[0]
+            for term in terms
+        }
+        distinctive = [
+            term for term in terms if 0 < counts[term] < LTM_COMMON_TERM_ROWS
+        ]
+        if distinctive:
+            match, rank, order = " OR ".join(distinctive), "rank", "rank"
+        else:
+            # Only common terms: rows containing all of them are equally
+            # relevant, so skip bm25(), which would count every match, and
+            # take the latest rows, which FTS5 reads without sorting
+            common = [term for term in terms if counts[term]]
+            if not common:
+                return []
+            match, rank, order = " AND ".join(common), "-1.0", "rowid DESC"
+        return conn.execute(
+            f"""
+            SELECT m.metadata, m.datetime, m.score, f.rank, m.embedding
+            FROM (
+                SELECT rowid, {rank} AS rank
+                FROM long_term_memories_fts
+                WHERE long_term_memories_fts MATCH ?
+                ORDER BY {order}
+                LIMIT ?
+            ) f
+            JOIN long_term_memories m ON m.id = f.rowid
+            ORDER BY f.rank
+        """,  # nosec
+            (match, limit),
+        ).fetchall()
+
     def reset(
         self,
     ) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
+            with self.pool.transaction() as conn:
+                conn.execute("DELETE FROM long_term_memories")
 
         except sqlite3.Error as e:
             self._printer.print(
@@ -0,0 +1,373 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.constants import NUMPY_STORAGE_INITIAL_CAPACITY
+
+_VECTORS_FILE = "vectors.npy"
+_ENTRIES_FILE = "entries.json"
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": lambda value, expected: value == expected,
+    "$ne": lambda value, expected: value != expected,
+    "$gt": lambda value, expected: value is not None and value > expected,
+    "$gte": lambda value, expected: value is not None and value >= expected,
+    "$lt": lambda value, expected: value is not None and value < expected,
+    "$lte": lambda value, expected: value is not None and value <= expected,
+    "$in": lambda value, expected: value in expected,
+    "$nin": lambda value, expected: value not in expected,
+}
+
+
+def _matches(metadata: Optional[Dict[str, Any]], where: Dict[str, Any]) -> bool:
+    # The subset of Chroma's where filters the memory storages rely on
+    metadata = metadata or {}
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(_matches(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            try:
+                if not all(
+                    _OPERATORS[operator](value, expected)
+                    for operator, expected in condition.items()
+                ):
+                    return False
+            except TypeError:
+                return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+class NumpyCollection:
+    """An in-process vector collection with the parts of Chroma's API memory uses.
+
+    Vectors live in one contiguous float32 matrix that doubles when full, with
+    their squared norms kept alongside so a query is a single matrix-vector
+    product followed by an `argpartition` top-k. Deleted rows are filled
+    with the last row, keeping the matrix dense.
+
+    Attributes:
+        embedding_function: Embeds documents and query texts when no
+            embeddings are given.
+        metadata: Collection metadata, `hnsw:space` is the distance used by
+            queries: "l2" (squared, Chroma's default), "cosine" or "ip".
+    """
+
+    def __init__(
+        self,
+        embedding_function: Optional[Callable[[List[str]], Any]] = None,
+        space: str = "l2",
+        initial_capacity: int = NUMPY_STORAGE_INITIAL_CAPACITY,
+    ) -> None:
+        if space not in ("l2", "cosine", "ip"):
+            raise ValueError(f"Unsupported distance: {space}")
+        self.embedding_function = embedding_function
+        self.metadata = {"hnsw:space": space}
+        self._initial_capacity = initial_capacity
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._vectors = np.empty((0, 0), dtype=np.float32)
+            self._norms = np.empty(0, dtype=np.float32)
+            self._ids: List[str] = []
+            self._documents: List[str] = []
+            self._metadatas: List[Dict[str, Any]] = []
+            self._rows: Dict[str, int] = {}
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        embeddings: Optional[Sequence[Any]] = None,
+    ) -> None:
+        if embeddings is None:
+            embeddings = self._embed(list(documents))
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(ids):
+            raise ValueError("Expected one embedding per id")
+        metadatas = metadatas or [None] * len(ids)
+        with self._lock:
+            self._reserve(len(ids), vectors.shape[1])
+            for entry_id, document, metadata, vector in zip(
+                ids, documents, metadatas, vectors
+            ):
+                row = self._rows.get(entry_id)
+                if row is None:
+                    row = len(self._ids)
+                    self._rows[entry_id] = row
+                    self._ids.append(entry_id)
+                    self._documents.append(document)
+                    self._metadatas.append(metadata or {})
+                else:
+                    self._documents[row] = document
+                    self._metadatas[row] = metadata or {}
+                self._vectors[row] = vector
+            rows = [self._rows[entry_id] for entry_id in ids]
+            self._norms[rows] = np.einsum(
+                "ij,ij->i", self._vectors[rows], self._vectors[rows]
+            )
+
+    add = upsert
+
+    def get(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = ("documents", "metadatas"),
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if ids is None:
+                rows = range(len(self._ids))
+            else:
+                rows = [self._rows[i] for i in ids if i in self._rows]
+            if where:
+                rows = [row for row in rows if _matches(self._metadatas[row], where)]
+            return self._collect(list(rows), include)
+
+    def query(
+        self,
+        query_texts: Optional[Any] = None,
+        query_embeddings: Optional[Sequence[Any]] = None,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = ("documents", "metadatas", "distances"),
+    ) -> Dict[str, Any]:
+        if query_embeddings is None:
+            texts = [query_texts] if isinstance(query_texts, str) else query_texts
+            query_embeddings = self._embed(list(texts or []))
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis]
+
+        results: Dict[str, List[Any]] = {"ids": []}
+        for name in include:
+            results[name] = []
+        with self._lock:
+            size = len(self._ids)
+            candidates = None
+            if where:
+                candidates = np.array(
+                    [
+                        row
+                        for row in range(size)
+                        if _matches(self._metadatas[row], where)
+                    ],
+                    dtype=np.intp,
+                )
+            for query in queries:
+                if size == 0 or query.shape[0] != self._vectors.shape[1]:
+                    rows, distances = np.empty(0, dtype=np.intp), np.empty(0)
+                else:
+                    distances = self._distances(query, candidates)
+                    k = min(n_results, len(distances))
+                    rows = (
+                        np.argpartition(distances, k - 1)[:k]
+                        if 0 < k < len(distances)
+                        else np.arange(k)
+                    )
+                    rows = rows[np.argsort(distances[rows], kind="stable")]
+                    distances = distances[rows]
+                    if candidates is not None:
+                        rows = candidates[rows]
+                found = self._collect(rows.tolist(), include)
+                for name in results:
+                    if name != "distances":
+                        results[name].append(found[name])
+                if "distances" in results:
+                    results["distances"].append(distances.tolist())
+        return results
+
+    def delete(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        with self._lock:
+            if ids is None:
+                ids = self.get(where=where or {}, include=[])["ids"]
+            for entry_id in ids:
+                row = self._rows.pop(entry_id, None)
+                if row is None:
+                    continue
+                last = len(self._ids) - 1
+                if row != last:
+                    moved = self._ids[last]
+                    self._ids[row] = moved
+                    self._documents[row] = self._documents[last]
+                    self._metadatas[row] = self._metadatas[last]
+                    self._vectors[row] = self._vectors[last]
+                    self._norms[row] = self._norms[last]
+                    self._rows[moved] = row
+                self._ids.pop()
+                self._documents.pop()
+                self._metadatas.pop()
+
+    def save(self, directory: str) -> None:
+        """Write the collection to `directory`, replacing what was there."""
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            vectors = self._vectors[: len(self._ids)]
+            entries = {
+                "ids": self._ids,
+                "documents": self._documents,
+                "metadatas": self._metadatas,
+            }
+            # Write next to the target and rename, so a crash mid-write never
+            # leaves a truncated file behind
+            for name, write in (
+                (_VECTORS_FILE, lambda file: np.save(file, vectors)),
+                (_ENTRIES_FILE, lambda file: file.write(json.dumps(entries).encode())),
+            ):
+                fd, temporary = tempfile.mkstemp(dir=directory)
+                try:
+                    with os.fdopen(fd, "wb") as file:
+                        write(file)
+                    os.replace(temporary, os.path.join(directory, name))
+                except BaseException:
+                    os.unlink(temporary)
+                    raise
+
+    def load(self, directory: str) -> None:
+        """Replace the collection with the one saved in `directory`, if any."""
+        vectors_path = os.path.join(directory, _VECTORS_FILE)
+        entries_path = os.path.join(directory, _ENTRIES_FILE)
+        if not (os.path.exists(vectors_path) and os.path.exists(entries_path)):
+            return
+        with open(entries_path) as file:
+            entries = json.load(file)
+        vectors = np.load(vectors_path, mmap_mode="r")
+        with self._lock:
+            self.clear()
+            if len(entries["ids"]):
+                self.upsert(
+                    entries["ids"],
+                    entries["documents"],
+                    entries["metadatas"],
+                    embeddings=vectors,
+                )
+
+    def _embed(self, texts: List[str]) -> Any:
+        if self.embedding_function is None:
+            raise ValueError("An embedding function is needed to embed texts")
+        return self.embedding_function(texts)
+
+    def _reserve(self, extra: int, dimension: int) -> None:
+        size = len(self._ids)
+        if size and dimension != self._vectors.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {dimension} does not match the "
+                f"collection dimension {self._vectors.shape[1]}"
+            )
+        capacity = self._vectors.shape[0] if self._vectors.shape[1] else 0
+        if size + extra <= capacity:
+            return
+        capacity = max(capacity * 2, size + extra, self._initial_capacity)
+        vectors = np.empty((capacity, dimension), dtype=np.float32)
+        norms = np.empty(capacity, dtype=np.float32)
+        if size:
+            vectors[:size] = self._vectors[:size]
+            norms[:size] = self._norms[:size]
+        self._vectors, self._norms = vectors, norms
+
+    def _distances(self, query: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        vectors = self._vectors[: len(self._ids)]
+        norms = self._norms[: len(self._ids)]
+        if rows is not None:
+            vectors, norms = vectors[rows], norms[rows]
+        dots = vectors @ query
+        space = self.metadata["hnsw:space"]
+        if space == "ip":
+            return 1.0 - dots
+        query_norm = float(query @ query)
+        if space == "cosine":
+            scale = np.sqrt(norms * query_norm)
+            return 1.0 - np.divide(
+                dots, scale, out=np.zeros_like(dots), where=scale > 0
+            )
+        return np.maximum(norms - 2.0 * dots + query_norm, 0.0)
+
+    def _collect(self, rows: List[int], include: Sequence[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {"ids": [self._ids[row] for row in rows]}
+        if "documents" in include:
+            found["documents"] = [self._documents[row] for row in rows]
+        if "metadatas" in include:
+            found["metadatas"] = [self._metadatas[row] for row in rows]
+        if "embeddings" in include:
+            found["embeddings"] = self._vectors[rows].copy()
+        return found
+
+
+class NumpyStorage(RAGStorage):
+    """RAGStorage backed by an in-process NumpyCollection instead of Chroma.
+
+    Nothing is started or written to disk, so creating the storage and
+    writing to it cost no more than embedding the entries. Meant for memory
+    that only lives for a run, such as short-term memory. With `persist`,
+    the collection is loaded from and saved to `path` after every written
+    batch.
+    """
+
+    def __init__(
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        persist: bool = False,
+        space: str = "l2",
+        **kwargs,
+    ):
+        self.persist = persist
+        self.space = space
+        super().__init__(type, allow_reset, embedder_config, crew, path, **kwargs)
+
+    @property
+    def directory(self) -> str:
+        return self.path if self.path else self.storage_file_name
+
+    def _initialize_app(self):
+        self._set_embedder_config()
+        self.app = None
+        self.collection = NumpyCollection(self.embedder_config, space=self.space)
+        if self.persist:
+            self.collection.load(self.directory)
+
+    def _write_batch(self, entries) -> None:
+        super()._write_batch(entries)
+        if self.persist:
+            self.collection.save(self.directory)
+
+    def _vacuum(self) -> None:
+        if self.persist:
+            self.collection.save(self.directory)
+
+    def reset(self) -> None:
+        self._write_buffer.clear()
+        if getattr(self, "collection", None) is not None:
+            self.collection.clear()
+        if self.persist and os.path.isdir(self.directory):
+            try:
+                shutil.rmtree(self.directory)
+            except OSError as e:
+                logging.warning(f"Could not remove the {self.type} memory: {e}")
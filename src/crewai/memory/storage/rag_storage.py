@@ -1,16 +1,33 @@
 import contextlib
 import io
+import json
 import logging
 import os
 import shutil
-import uuid
-from typing import Any, Dict, List, Optional
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from chromadb.api import ClientAPI
 
+from crewai.memory.retention import (
+    SAVED_AT_KEY,
+    CompactionStats,
+    RetentionPolicy,
+    content_id,
+)
 from crewai.memory.storage.base_rag_storage import BaseRAGStorage
+from crewai.memory.storage.write_buffer import PendingWrite, WriteBehindBuffer
 from crewai.utilities import EmbeddingConfigurator
-from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
+from crewai.utilities.chromadb import get_chroma_client, release_chroma_client
+from crewai.utilities.constants import (
+    MAX_FILE_NAME_LENGTH,
+    MEMORY_RETENTION_LOW_WATER,
+    MEMORY_WRITE_BATCH_SIZE,
+    MEMORY_WRITE_FLUSH_INTERVAL,
+)
 from crewai.utilities.paths import db_storage_path
 
 
@@ -35,14 +52,41 @@ class RAGStorage(BaseRAGStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    Saves are buffered and written in batches, with one embedding call per
+    batch. Searches also look at the entries that are not written yet.
+
+    The retention policy bounds the collection: identical content is stored
+    once under an id derived from it, entries older than the TTL are dropped
+    and past `max_items` the oldest entries are evicted, down to
+    `MEMORY_RETENTION_LOW_WATER` of it.
+
+    The collection is opened on first use, on a Chroma client shared by
+    every storage with the same path.
     """
 
     app: ClientAPI | None = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        write_batch_size: int = MEMORY_WRITE_BATCH_SIZE,
+        write_flush_interval: Optional[float] = MEMORY_WRITE_FLUSH_INTERVAL,
+        retention: Optional[RetentionPolicy] = None,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
+        self.retention = retention or RetentionPolicy()
+        self.embedder_key = json.dumps(embedder_config, sort_keys=True, default=repr)
+        self._write_buffer = WriteBehindBuffer(
+            self._write_batch,
+            batch_size=write_batch_size,
+            flush_interval=write_flush_interval,
+            name=type,
+        )
         agents = crew.agents if crew else []
         agents = [self._sanitize_role(agent.role) for agent in agents]
         agents = "_".join(agents)
@@ -53,24 +97,41 @@ class RAGStorage(BaseRAGStorage):
 
         self.allow_reset = allow_reset
         self.path = path
-        self._initialize_app()
+        self.collection: Any = None
+        self._init_lock = threading.Lock()
 
     def _set_embedder_config(self):
         configurator = EmbeddingConfigurator()
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
 
-    def _initialize_app(self):
-        import chromadb
-        from chromadb.config import Settings
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "RAGStorage":
+        # Copies of a crew share the client and collection, only the buffer
+        # of pending writes belongs to each copy
+        copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copy
+        copy.__dict__.update(self.__dict__)
+        copy._init_lock = threading.Lock()
+        copy._write_buffer = WriteBehindBuffer(
+            copy._write_batch,
+            batch_size=self._write_buffer.batch_size,
+            flush_interval=self._write_buffer.flush_interval,
+            name=self.type,
+        )
+        return copy
+
+    def _ensure_initialized(self) -> None:
+        if self.collection is None:
+            with self._init_lock:
+                if self.collection is None:
+                    self._initialize_app()
 
+    def _initialize_app(self):
         self._set_embedder_config()
-        chroma_client = chromadb.PersistentClient(
-            path=self.path if self.path else self.storage_file_name,
-            settings=Settings(allow_reset=self.allow_reset),
+        self.app = get_chroma_client(
+            self.path if self.path else self.storage_file_name,
+            allow_reset=self.allow_reset,
         )
 
-        self.app = chroma_client
-
         try:
             self.collection = self.app.get_collection(
                 name=self.type, embedding_function=self.embedder_config
@@ -101,12 +162,18 @@ class RAGStorage(BaseRAGStorage):
         return f"{base_path}/{file_name}"
 
     def save(self, value: Any, metadata: Dict[str, Any]) -> None:
-        if not hasattr(self, "app") or not hasattr(self, "collection"):
-            self._initialize_app()
-        try:
-            self._generate_embedding(value, metadata)
-        except Exception as e:
-            logging.error(f"Error during {self.type} save: {str(e)}")
+        metadata = {**(metadata or {}), SAVED_AT_KEY: time.time()}
+        entry_id = content_id(value) if self.retention.dedup else None
+        self._write_buffer.add(value, metadata, id=entry_id)
+
+    def flush(self) -> None:
+        """Write every buffered entry to the collection."""
+        self._write_buffer.flush()
+
+    def embed_query(self, query: str) -> Any:
+        """Embed a query so it can be shared by storages with the same embedder."""
+        self._ensure_initialized()
+        return self._embed([query])[0]
 
     def search(
         self,
@@ -114,45 +181,238 @@ class RAGStorage(BaseRAGStorage):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        query_embedding: Optional[Any] = None,
     ) -> List[Any]:
-        if not hasattr(self, "app"):
-            self._initialize_app()
+        self._ensure_initialized()
 
         try:
-            with suppress_logging():
-                response = self.collection.query(query_texts=query, n_results=limit)
-
-            results = []
-            for i in range(len(response["ids"][0])):
-                result = {
-                    "id": response["ids"][0][i],
-                    "metadata": response["metadatas"][0][i],
-                    "context": response["documents"][0][i],
-                    "score": response["distances"][0][i],
-                }
-                if result["score"] >= score_threshold:
-                    results.append(result)
+            pending = self._write_buffer.pending()
+            if not pending and query_embedding is None:
+                with suppress_logging():
+                    response = self.collection.query(
+                        query_texts=query, n_results=limit
+                    )
+                results = self._format_results(response)
+            else:
+                # Embed the query once for both the collection and the
+                # entries that are not written yet
+                self._embed_pending(pending)
+                if query_embedding is None:
+                    query_embedding = self._embed([query])[0]
+                with suppress_logging():
+                    response = self.collection.query(
+                        query_embeddings=[query_embedding], n_results=limit
+                    )
+                pending_results = self._search_pending(pending, query_embedding)
+                # A pending entry replaces the stored entry with the same id
+                pending_ids = {result["id"] for result in pending_results}
+                results = [
+                    result
+                    for result in self._format_results(response)
+                    if result["id"] not in pending_ids
+                ] + pending_results
+                results = sorted(results, key=lambda result: result["score"])[:limit]
 
-            return results
+            return [
+                result
+                for result in results
+                if result["score"] >= score_threshold and not self._expired(result)
+            ]
         except Exception as e:
             logging.error(f"Error during {self.type} search: {str(e)}")
             return []
 
-    def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
-        if not hasattr(self, "app") or not hasattr(self, "collection"):
-            self._initialize_app()
+    def _format_results(self, response: Any) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": response["ids"][0][i],
+                "metadata": response["metadatas"][0][i],
+                "context": response["documents"][0][i],
+                "score": response["distances"][0][i],
+            }
+            for i in range(len(response["ids"][0]))
+        ]
+
+    def _search_pending(
+        self, pending: List[PendingWrite], query_embedding: Any
+    ) -> List[Dict[str, Any]]:
+        space = (getattr(self.collection, "metadata", None) or {}).get(
+            "hnsw:space", "l2"
+        )
+        query_vector = np.asarray(query_embedding, dtype=float)
+        results = []
+        for entry in pending:
+            vector = np.asarray(entry.embedding, dtype=float)
+            if space == "cosine":
+                norms = np.linalg.norm(vector) * np.linalg.norm(query_vector)
+                distance = 1.0 - float(vector @ query_vector) / norms if norms else 1.0
+            elif space == "ip":
+                distance = 1.0 - float(vector @ query_vector)
+            else:
+                distance = float(np.sum((vector - query_vector) ** 2))
+            results.append(
+                {
+                    "id": entry.id,
+                    "metadata": entry.metadata,
+                    "context": entry.document,
+                    "score": distance,
+                }
+            )
+        return results
+
+    def _embed(self, texts: List[str]) -> List[Any]:
+        return list(self.embedder_config(texts))  # type: ignore[misc]
+
+    def _embed_pending(self, entries: List[PendingWrite]) -> None:
+        missing = [entry for entry in entries if entry.embedding is None]
+        if missing:
+            embeddings = self._embed([entry.document for entry in missing])
+            for entry, embedding in zip(missing, embeddings):
+                entry.embedding = embedding
+
+    def _write_batch(self, entries: List[PendingWrite]) -> None:
+        self._ensure_initialized()
+
+        # Ids must be unique within a batch, the latest save of an id wins
+        entries = list({entry.id: entry for entry in entries}.values())
+        self._embed_pending(entries)
+        self.collection.upsert(
+            documents=[entry.document for entry in entries],
+            metadatas=[entry.metadata or {} for entry in entries],
+            ids=[entry.id for entry in entries],
+            embeddings=[entry.embedding for entry in entries],
+        )
+        try:
+            self._apply_retention()
+        except Exception as e:
+            logging.warning(f"Error applying {self.type} memory retention: {e}")
 
-        self.collection.add(
-            documents=[text],
-            metadatas=[metadata or {}],
-            ids=[str(uuid.uuid4())],
+    def _expired(self, result: Dict[str, Any]) -> bool:
+        saved_at = (result.get("metadata") or {}).get(SAVED_AT_KEY)
+        return (
+            self.retention.ttl is not None
+            and isinstance(saved_at, (int, float))
+            and saved_at < time.time() - self.retention.ttl
         )
 
+    def _apply_retention(self) -> Tuple[int, int]:
+        """Drop expired entries and, past `max_items`, evict the oldest.
+
+        Returns:
+            The number of expired and of evicted entries.
+        """
+        expired: List[str] = []
+        if self.retention.ttl is not None:
+            expired = self.collection.get(
+                where={SAVED_AT_KEY: {"$lt": time.time() - self.retention.ttl}},
+                include=[],
+            )["ids"]
+            if expired:
+                self.collection.delete(ids=expired)
+
+        evicted: List[str] = []
+        max_items = self.retention.max_items
+        if max_items is not None:
+            count = self.collection.count()
+            if count > max_items:
+                # Evict down to the low-water mark, so the scan below runs
+                # once every few batches instead of on every write at the limit
+                excess = count - int(max_items * MEMORY_RETENTION_LOW_WATER)
+                stored = self.collection.get(include=["metadatas"])
+                by_age = sorted(
+                    zip(stored["ids"], stored["metadatas"]),
+                    key=lambda item: (item[1] or {}).get(SAVED_AT_KEY, 0),
+                )
+                evicted = [entry_id for entry_id, _ in by_age[:excess]]
+                self.collection.delete(ids=evicted)
+        return len(expired), len(evicted)
+
+    def compact(self, merge_distance: Optional[float] = None) -> CompactionStats:
+        """Apply the retention policy, deduplicate and vacuum the collection.
+
+        Args:
+            merge_distance: Cosine distance under which two entries are near
+                duplicates and only the newest is kept, None to only remove
+                entries with identical content.
+
+        Returns:
+            What was removed.
+        """
+        self._ensure_initialized()
+        self.flush()
+        stats = CompactionStats()
+        stats.expired, stats.evicted = self._apply_retention()
+
+        stored = self.collection.get(include=["documents", "metadatas", "embeddings"])
+        # Newest first, so the entry kept for a group is the latest one
+        order = sorted(
+            range(len(stored["ids"])),
+            key=lambda i: (stored["metadatas"][i] or {}).get(SAVED_AT_KEY, 0),
+            reverse=True,
+        )
+        seen = set()
+        duplicates, kept = [], []
+        for i in order:
+            digest = content_id(stored["documents"][i] or "")
+            if digest in seen:
+                duplicates.append(stored["ids"][i])
+            else:
+                seen.add(digest)
+                kept.append(i)
+
+        merged: List[str] = []
+        if merge_distance is not None and len(kept) > 1:
+            vectors = np.asarray(
+                [stored["embeddings"][i] for i in kept], dtype=np.float32
+            )
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+            removed = np.zeros(len(kept), dtype=bool)
+            for position in range(len(kept)):
+                if removed[position]:
+                    continue
+                distances = 1.0 - vectors[position + 1 :] @ vectors[position]
+                similar = np.flatnonzero(distances <= merge_distance) + position + 1
+                removed[similar] = True
+            merged = [
+                stored["ids"][kept[position]] for position in np.flatnonzero(removed)
+            ]
+
+        if duplicates or merged:
+            self.collection.delete(ids=duplicates + merged)
+        stats.duplicates, stats.merged = len(duplicates), len(merged)
+        stats.remaining = self.collection.count()
+        self._vacuum()
+        return stats
+
+    def _vacuum(self) -> None:
+        database = os.path.join(
+            self.path if self.path else self.storage_file_name, "chroma.sqlite3"
+        )
+        if not os.path.exists(database):
+            return
+        try:
+            conn = sqlite3.connect(database, timeout=5)
+            try:
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.warning(f"Could not vacuum the {self.type} memory: {e}")
+
+    def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
+        self._write_batch([PendingWrite(document=text, metadata=metadata or {})])
+
     def reset(self) -> None:
+        self._write_buffer.clear()
         try:
+            self._ensure_initialized()
             if self.app:
                 self.app.reset()
                 shutil.rmtree(f"{db_storage_path()}/{self.type}")
+                release_chroma_client(
+                    self.path if self.path else self.storage_file_name
+                )
                 self.app = None
                 self.collection = None
         except Exception as e:
@@ -172,3 +432,36 @@ class RAGStorage(BaseRAGStorage):
         return OpenAIEmbeddingFunction(
             api_key=os.getenv("OPENAI_API_KEY"), model_name="text-embedding-3-small"
         )
+
+
+def create_rag_storage(type: str, crew: Any = None, **kwargs: Any) -> RAGStorage:
+    """Create the storage of a memory type on the vector store the crew selected.
+
+    Chroma is used unless the crew's memory_config picks another vector store
+    for the type, e.g. `{"vector_store": {"short_term": "numpy"}}`. Options
+    for the store can be given as a dict:
+    `{"vector_store": {"short_term": {"provider": "numpy", "persist": True}}}`.
+
+    Args:
+        type: The memory type, "short_term" or "entities".
+        crew: The crew owning the memory, or None.
+        **kwargs: Passed to the storage.
+
+    Returns:
+        The storage.
+    """
+    memory_config = getattr(crew, "memory_config", None) or {}
+    options = (memory_config.get("vector_store") or {}).get(type) or "chroma"
+    if isinstance(options, str):
+        options = {"provider": options}
+    options = dict(options)
+    provider = options.pop("provider", "chroma")
+    if provider == "chroma":
+        storage_class = RAGStorage
+    elif provider == "numpy":
+        from crewai.memory.storage.numpy_storage import NumpyStorage
+
+        storage_class = NumpyStorage
+    else:
+        raise ValueError(f"Unknown vector store for {type} memory: {provider}")
+    return storage_class(type=type, crew=crew, **kwargs, **options)
@@ -0,0 +1,130 @@
+import atexit
+import logging
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from crewai.utilities.constants import (
+    MEMORY_WRITE_BATCH_SIZE,
+    MEMORY_WRITE_FLUSH_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _flush_at_exit(
+    buffer: "weakref.ReferenceType[WriteBehindBuffer]",
+) -> Callable[[], None]:
+    def flush() -> None:
+        instance = buffer()
+        if instance is not None:
+            instance.flush()
+
+    return flush
+
+
+@dataclass
+class PendingWrite:
+    """A memory entry waiting to be written to its storage."""
+
+    document: str
+    metadata: Dict[str, Any]
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    embedding: Optional[Any] = None
+
+
+class WriteBehindBuffer:
+    """Collects memory writes and hands them to the storage in batches.
+
+    A batch is written once `batch_size` entries are pending, `flush_interval`
+    seconds after the first pending entry, on `flush()` and at interpreter
+    exit. Batches are written one at a time and in order. A batch that fails
+    to write is logged and dropped, like a failed single save.
+
+    Attributes:
+        batch_size: Pending entries that trigger a write.
+        flush_interval: Seconds an entry may wait before it is written, None
+            to only write on size or explicit flushes.
+        failed_writes: Entries dropped because their batch failed.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[PendingWrite]], None],
+        batch_size: int = MEMORY_WRITE_BATCH_SIZE,
+        flush_interval: Optional[float] = MEMORY_WRITE_FLUSH_INTERVAL,
+        name: str = "memory",
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.failed_writes = 0
+        self._write = write
+        self._name = name
+        self._pending: List[PendingWrite] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._exit_hook: Optional[Callable[[], None]] = None
+
+    def add(
+        self, document: str, metadata: Dict[str, Any], id: Optional[str] = None
+    ) -> PendingWrite:
+        """Queue an entry, writing the batch if it is full."""
+        entry = PendingWrite(document=document, metadata=metadata)
+        if id is not None:
+            entry.id = id
+        with self._lock:
+            self._pending.append(entry)
+            if self._exit_hook is None:
+                # Give pending entries a chance to be written at exit
+                self._exit_hook = _flush_at_exit(weakref.ref(self))
+                atexit.register(self._exit_hook)
+            full = len(self._pending) >= self.batch_size
+            if not full and self._timer is None and self.flush_interval is not None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return entry
+
+    def pending(self) -> List[PendingWrite]:
+        """Entries not written yet, oldest first."""
+        with self._lock:
+            return list(self._pending)
+
+    def flush(self) -> None:
+        """Write every pending entry now."""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    self.failed_writes += len(batch)
+                    logger.error(f"Error during {self._name} batch save: {str(e)}")
+        self._release_exit_hook()
+
+    def clear(self) -> None:
+        """Drop every pending entry without writing it."""
+        with self._lock:
+            self._pending = []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._release_exit_hook()
+
+    def _release_exit_hook(self) -> None:
+        """Unregister the exit hook once nothing is pending."""
+        with self._lock:
+            exit_hook = None if self._pending else self._exit_hook
+            if exit_hook is not None:
+                self._exit_hook = None
+        if exit_hook is not None:
+            atexit.unregister(exit_hook)
@@ -35,6 +35,7 @@ from pydantic import (
 from pydantic_core import PydanticCustomError
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.llms.base_llm import BaseLLM
 from crewai.security import Fingerprint, SecurityConfig
 from crewai.tasks.guardrail_result import GuardrailResult
 from crewai.tasks.output_format import OutputFormat
@@ -147,6 +148,10 @@ class Task(BaseModel):
     max_retries: int = Field(
         default=3, description="Maximum number of retries when guardrail fails"
     )
+    guardrail_repair: bool = Field(
+        default=False,
+        description="Whether to ask the agent's LLM to fix an output rejected by the guardrail before re-executing the task",
+    )
     retry_count: int = Field(default=0, description="Current number of retries")
     start_time: Optional[datetime.datetime] = Field(
         default=None, description="Start time of the task execution"
@@ -396,21 +401,27 @@ class Task(BaseModel):
             )
 
             pydantic_output, json_output = self._export_output(result)
-            task_output = TaskOutput(
-                name=self.name,
-                description=self.description,
-                expected_output=self.expected_output,
-                raw=result,
-                pydantic=pydantic_output,
-                json_dict=json_output,
-                agent=agent.role,
-                output_format=self._get_output_format(),
+            task_output = self._build_task_output(
+                result, pydantic_output, json_output, agent
             )
 
             if self.guardrail:
                 guardrail_result = GuardrailResult.from_tuple(
                     self.guardrail(task_output)
                 )
+                if not guardrail_result.success and self.guardrail_repair:
+                    repaired_output = self._repair_output(
+                        agent, task_output, guardrail_result.error
+                    )
+                    if repaired_output is not None:
+                        task_output = repaired_output
+                        result = task_output.raw
+                        pydantic_output = task_output.pydantic
+                        json_output = task_output.json_dict
+                        guardrail_result = GuardrailResult.from_tuple(
+                            self.guardrail(task_output)
+                        )
+
                 if not guardrail_result.success:
                     if self.retry_count >= self.max_retries:
                         raise Exception(
@@ -612,6 +623,77 @@ class Task(BaseModel):
 
         return copied_task
 
+    def _build_task_output(
+        self,
+        result: str,
+        pydantic_output: Optional[BaseModel],
+        json_output: Optional[Dict[str, Any]],
+        agent: BaseAgent,
+    ) -> TaskOutput:
+        return TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+
+    def _repair_output(
+        self, agent: BaseAgent, task_output: TaskOutput, error: Optional[str]
+    ) -> Optional[TaskOutput]:
+        """Ask the agent's LLM once to fix an output rejected by the guardrail.
+
+        This is much cheaper than re-executing the task, which rebuilds the
+        prompt and runs a whole new agent loop, and is usually enough for
+        formatting problems.
+
+        Returns:
+            The repaired output, or None if the repair call failed.
+        """
+        llm = getattr(agent, "llm", None)
+        if not isinstance(llm, BaseLLM):
+            return None
+
+        Printer().print(
+            content=f"Guardrail blocked, repairing the output, due to: {error}\n",
+            color="yellow",
+        )
+        try:
+            repaired = llm.call(
+                [
+                    {
+                        "role": "system",
+                        "content": self.i18n.slice("guardrail_repair_system"),
+                    },
+                    {
+                        "role": "user",
+                        "content": self.i18n.slice("guardrail_repair").format(
+                            description=self.description,
+                            expected_output=self.expected_output,
+                            guardrail_result_error=error,
+                            task_output=task_output.raw,
+                        ),
+                    },
+                ]
+            )
+            if not isinstance(repaired, str) or not repaired.strip():
+                return None
+            repaired = repaired.strip()
+            # A repair that cannot be converted to the task's output format
+            # is no better than the original, so re-execute instead
+            pydantic_output, json_output = self._export_output(repaired)
+        except Exception as e:
+            Printer().print(
+                content=f"Guardrail repair failed, re-executing the task: {e}\n",
+                color="yellow",
+            )
+            return None
+
+        return self._build_task_output(repaired, pydantic_output, json_output, agent)
+
     def _export_output(
         self, result: str
     ) -> Tuple[Optional[BaseModel], Optional[Dict[str, Any]]]:
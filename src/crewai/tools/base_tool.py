@@ -2,7 +2,7 @@ import asyncio
 import warnings
 from abc import ABC, abstractmethod
 from inspect import signature
-from typing import Any, Callable, Type, get_args, get_origin
+from typing import Any, Callable, Optional, Type, get_args, get_origin
 
 from pydantic import (
     BaseModel,
@@ -34,6 +34,12 @@ class BaseTool(BaseModel, ABC):
     """Flag to check if the description has been updated."""
     cache_function: Callable = lambda _args=None, _result=None: True
     """Function that will be used to determine if the tool should be cached, should return a boolean. If None, the tool will be cached."""
+    cache_ttl: Optional[float] = None
+    """Seconds a cached result of this tool stays valid. If None, the cache handler's default is used."""
+    max_concurrency: Optional[int] = None
+    """Maximum number of concurrent async executions of this tool. If None, the tool execution pool's default is used."""
+    timeout: Optional[float] = None
+    """Seconds the tool may run before the agent is told it timed out. If None, the crew's tool_timeout is used."""
     result_as_answer: bool = False
     """Flag to check if the tool should be the final agent answer."""
 
@@ -91,6 +97,10 @@ class BaseTool(BaseModel, ABC):
             args_schema=self.args_schema,
             func=self._run,
             result_as_answer=self.result_as_answer,
+            cache_function=self.cache_function,
+            cache_ttl=self.cache_ttl,
+            max_concurrency=self.max_concurrency,
+            timeout=self.timeout,
         )
 
     @classmethod
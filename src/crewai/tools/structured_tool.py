@@ -23,6 +23,10 @@ class CrewStructuredTool:
         args_schema: type[BaseModel],
         func: Callable[..., Any],
         result_as_answer: bool = False,
+        cache_function: Optional[Callable[..., bool]] = None,
+        cache_ttl: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """Initialize the structured tool.
 
@@ -32,6 +36,10 @@ class CrewStructuredTool:
             args_schema: The pydantic model for the tool's arguments
             func: The function to run when the tool is called
             result_as_answer: Whether to return the output directly
+            cache_function: Decides whether a result may be cached, caching everything if None
+            cache_ttl: Seconds a cached result stays valid, using the cache default if None
+            max_concurrency: Maximum concurrent async executions, using the pool default if None
+            timeout: Seconds the tool may run, using the crew default if None
         """
         self.name = name
         self.description = description
@@ -39,6 +47,10 @@ class CrewStructuredTool:
         self.func = func
         self._logger = Logger()
         self.result_as_answer = result_as_answer
+        self.cache_function = cache_function
+        self.cache_ttl = cache_ttl
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
 
         # Validate the function signature matches the schema
         self._validate_function_signature()
@@ -217,7 +229,7 @@ class CrewStructuredTool:
             # Run sync functions in a thread pool
             import asyncio
 
-            return await asyncio.get_event_loop().run_in_executor(
+            return await asyncio.get_running_loop().run_in_executor(
                 None, lambda: self.func(**parsed_args, **kwargs)
             )
 
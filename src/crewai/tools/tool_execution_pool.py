@@ -0,0 +1,250 @@
+import asyncio
+import contextvars
+import inspect
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.utilities.constants import (
+    TOOL_EXECUTION_POOL_SIZE,
+    TOOL_MAX_CONCURRENCY,
+)
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when a tool does not finish within its timeout."""
+
+    def __init__(self, tool_name: str, timeout: float) -> None:
+        self.tool_name = tool_name
+        self.timeout = timeout
+        super().__init__(f"Tool '{tool_name}' timed out after {timeout} seconds")
+
+
+def run_with_timeout(
+    func: Callable[[], Any], timeout: Optional[float], tool_name: str
+) -> Any:
+    """Run a blocking tool call in a supervised worker thread.
+
+    The caller waits at most `timeout` seconds. Python threads cannot be
+    killed, so a timed out worker is abandoned: it is a daemon thread and its
+    eventual result is discarded, while the caller is free to move on.
+
+    Args:
+        func: The call to run.
+        timeout: Seconds to wait, None to run the call inline without a limit.
+        tool_name: Name of the tool, used in the error and the thread name.
+
+    Returns:
+        The result of the call.
+
+    Raises:
+        ToolTimeoutError: If the call does not finish in time.
+    """
+    if timeout is None:
+        return func()
+
+    outcome: Dict[str, Any] = {}
+    done = threading.Event()
+    context = contextvars.copy_context()
+
+    def worker() -> None:
+        try:
+            outcome["result"] = context.run(func)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    threading.Thread(
+        target=worker, name=f"crewai-tool-{tool_name}", daemon=True
+    ).start()
+    if not done.wait(timeout):
+        raise ToolTimeoutError(tool_name, timeout)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class _Slot:
+    """A per-tool concurrency slot, released exactly once."""
+
+    def __init__(self, semaphore: Optional[asyncio.Semaphore]) -> None:
+        self._semaphore = semaphore
+        self._released = False
+        # Set while a timed blocking call runs on its own thread, which then
+        # releases the slot when the call actually returns
+        self.held_by_worker = False
+
+    def release(self) -> None:
+        if self._semaphore is not None and not self._released:
+            self._released = True
+            self._semaphore.release()
+
+
+class ToolExecutionPool:
+    """Runs tools from async code without blocking the event loop.
+
+    Coroutine tools are awaited directly. Blocking tools run on a dedicated,
+    bounded thread pool instead of the loop's default executor, so slow tools
+    cannot starve other users of `run_in_executor`. Each tool may run at most
+    `max_concurrency` times at once (its own limit, or the pool default), so a
+    burst of calls to one tool cannot take every worker.
+
+    Blocking tools called with a timeout run on a thread of their own rather
+    than on the pool, and keep their concurrency slot until that thread
+    returns. A hung tool therefore never holds pool workers, and at most
+    `max_concurrency` of its calls can hang at once.
+
+    Attributes:
+        max_workers: Number of threads available to blocking tools.
+        default_tool_concurrency: Concurrent calls allowed per tool that sets
+            no limit of its own, None for no limit.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = TOOL_EXECUTION_POOL_SIZE,
+        default_tool_concurrency: Optional[int] = TOOL_MAX_CONCURRENCY,
+    ) -> None:
+        self.max_workers = max_workers
+        self.default_tool_concurrency = default_tool_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="crewai-tool"
+        )
+        # asyncio semaphores are bound to a loop, so keep one set per loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _semaphore(self, tool: CrewStructuredTool) -> Optional[asyncio.Semaphore]:
+        limit = getattr(tool, "max_concurrency", None) or self.default_tool_concurrency
+        if not limit:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if tool.name not in semaphores:
+                semaphores[tool.name] = asyncio.Semaphore(limit)
+            return semaphores[tool.name]
+
+    async def run(
+        self,
+        tool: CrewStructuredTool,
+        input: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Invoke a tool with already validated arguments.
+
+        Args:
+            tool: The tool to run.
+            input: The tool arguments.
+            timeout: Seconds to wait for the tool, None for no limit. Coroutine
+                tools are cancelled on timeout; blocking tools keep their
+                thread and concurrency slot until they return, but the caller
+                moves on.
+
+        Returns:
+            The result of the tool execution.
+
+        Raises:
+            ToolTimeoutError: If the tool does not finish in time.
+        """
+        semaphore = self._semaphore(tool)
+        if semaphore is not None:
+            await semaphore.acquire()
+        slot = _Slot(semaphore)
+        try:
+            return await self._run_with_timeout(tool, input, timeout, slot)
+        finally:
+            if not slot.held_by_worker:
+                slot.release()
+
+    async def _run_with_timeout(
+        self,
+        tool: CrewStructuredTool,
+        input: Dict[str, Any],
+        timeout: Optional[float],
+        slot: _Slot,
+    ) -> Any:
+        if timeout is None:
+            return await self._run(tool, input)
+        # asyncio.wait keeps a TimeoutError raised by the tool itself distinct
+        # from the tool running out of time
+        task = asyncio.ensure_future(self._run(tool, input, slot))
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if not done:
+            task.cancel()
+            raise ToolTimeoutError(tool.name, timeout)
+        return task.result()
+
+    async def _run(
+        self,
+        tool: CrewStructuredTool,
+        input: Dict[str, Any],
+        slot: Optional[_Slot] = None,
+    ) -> Any:
+        if inspect.iscoroutinefunction(tool.func):
+            return await tool.ainvoke(input=input)
+        if slot is None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, lambda: tool.invoke(input=input)
+            )
+        else:
+            result = await self._run_in_thread(tool, input, slot)
+        # Sync wrappers around async functions hand back a coroutine
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _run_in_thread(
+        self, tool: CrewStructuredTool, input: Dict[str, Any], slot: _Slot
+    ) -> Any:
+        """Run a timed blocking tool on its own thread, which owns the slot."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Any]" = loop.create_future()
+        context = contextvars.copy_context()
+
+        def finish(result: Any, error: Optional[BaseException]) -> None:
+            slot.release()
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def worker() -> None:
+            result, error = None, None
+            try:
+                result = context.run(lambda: tool.invoke(input=input))
+            except BaseException as e:
+                error = e
+            try:
+                loop.call_soon_threadsafe(finish, result, error)
+            except RuntimeError:
+                pass  # The loop is closed, nobody is waiting anymore
+
+        threading.Thread(
+            target=worker, name=f"crewai-tool-{tool.name}", daemon=True
+        ).start()
+        slot.held_by_worker = True
+        return await future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+
+_default_pool: Optional[ToolExecutionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_tool_execution_pool() -> ToolExecutionPool:
+    """Return the process-wide pool used by async tool execution."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ToolExecutionPool()
+        return _default_pool
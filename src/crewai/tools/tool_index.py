@@ -0,0 +1,102 @@
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Generic, List, Optional, Sequence, Set, TypeVar
+
+from crewai.tools.base_tool import BaseTool
+from crewai.tools.structured_tool import CrewStructuredTool
+
+T = TypeVar("T", CrewStructuredTool, BaseTool)
+
+FUZZY_MATCH_THRESHOLD = 0.85
+FUZZY_MAX_CANDIDATES = 5
+
+
+def normalize_tool_name(name: str) -> str:
+    """Normalize a tool name for case-insensitive lookups."""
+    return name.casefold().strip()
+
+
+def _trigrams(name: str) -> Set[str]:
+    """Return the trigrams of a normalized name, padded so short names still index."""
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ToolIndex(Generic[T]):
+    """Prebuilt name index over a fixed set of tools.
+
+    Lookups try an exact name match first, then a case-folded match (also
+    accepting underscores for spaces), and finally a fuzzy match restricted to
+    the tools that share the most trigrams with the requested name. The index
+    is built once per tool set and shared by everything that resolves tool
+    names for the same executor.
+
+    Attributes:
+        tools: The indexed tools, in their original order.
+        by_name: Mapping of exact tool names to tools.
+    """
+
+    def __init__(self, tools: Sequence[T]) -> None:
+        self.tools: List[T] = list(tools)
+        self.by_name: Dict[str, T] = {}
+        self._by_normalized_name: Dict[str, T] = {}
+        self._normalized_names: List[str] = []
+        self._trigram_index: Dict[str, List[int]] = {}
+
+        for position, tool in enumerate(self.tools):
+            normalized = normalize_tool_name(tool.name)
+            self.by_name.setdefault(tool.name, tool)
+            self._by_normalized_name.setdefault(normalized, tool)
+            self._normalized_names.append(normalized)
+            for trigram in _trigrams(normalized):
+                self._trigram_index.setdefault(trigram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def get(self, name: str) -> Optional[T]:
+        """Resolve a tool by exact or case-insensitive name, without fuzzy matching."""
+        if tool := self.by_name.get(name):
+            return tool
+        normalized = normalize_tool_name(name)
+        return self._by_normalized_name.get(
+            normalized
+        ) or self._by_normalized_name.get(normalized.replace("_", " "))
+
+    def find(
+        self, name: str, threshold: float = FUZZY_MATCH_THRESHOLD
+    ) -> Optional[T]:
+        """Resolve a tool by name, falling back to fuzzy matching.
+
+        Args:
+            name: The tool name requested by the agent.
+            threshold: Minimum similarity ratio for a fuzzy match.
+
+        Returns:
+            The best matching tool, or None if no tool is similar enough.
+        """
+        if not name:
+            return None
+        if tool := self.get(name):
+            return tool
+
+        normalized = normalize_tool_name(name)
+        shared_trigrams: Counter = Counter()
+        for trigram in _trigrams(normalized):
+            shared_trigrams.update(self._trigram_index.get(trigram, ()))
+
+        best_tool: Optional[T] = None
+        best_ratio = threshold
+        candidates = sorted(
+            shared_trigrams.items(), key=lambda item: (-item[1], item[0])
+        )[:FUZZY_MAX_CANDIDATES]
+        for position, _ in sorted(candidates):
+            ratio = SequenceMatcher(
+                None, self._normalized_names[position], normalized
+            ).ratio()
+            if ratio > best_ratio:
+                best_tool, best_ratio = self.tools[position], ratio
+        return best_tool
@@ -1,13 +1,9 @@
-import ast
 import datetime
 import json
 import time
-from difflib import SequenceMatcher
-from json import JSONDecodeError
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-import json5
 from json_repair import repair_json
 
 from crewai.agents.tools_handler import ToolsHandler
@@ -15,6 +11,12 @@ from crewai.task import Task
 from crewai.telemetry import Telemetry
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_calling import InstructorToolCalling, ToolCalling
+from crewai.tools.tool_execution_pool import (
+    ToolTimeoutError,
+    get_tool_execution_pool,
+    run_with_timeout,
+)
+from crewai.tools.tool_index import ToolIndex
 from crewai.utilities import I18N, Converter, Printer
 from crewai.utilities.agent_utils import (
     get_tool_names,
@@ -22,12 +24,18 @@ from crewai.utilities.agent_utils import (
 )
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import (
+    ToolInputRepairedEvent,
     ToolSelectionErrorEvent,
     ToolUsageErrorEvent,
     ToolUsageFinishedEvent,
     ToolUsageStartedEvent,
+    ToolUsageTimeoutEvent,
     ToolValidateInputErrorEvent,
 )
+from crewai.utilities.tolerant_json import (
+    TolerantJSONParseError,
+    parse_tolerant_json,
+)
 
 if TYPE_CHECKING:
     from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -63,6 +71,8 @@ class ToolUsage:
       original_tools: Original tools available for the agent before being converted to BaseTool.
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
+      tool_index: Name index used to resolve the tools requested by the agent.
+      default_tool_timeout: Timeout in seconds for tools that don't set their own.
       function_calling_llm: Language model to be used for the tool usage.
     """
 
@@ -75,6 +85,10 @@ class ToolUsage:
         agent: Optional[Union["BaseAgent", "LiteAgent"]] = None,
         action: Any = None,
         fingerprint_context: Optional[Dict[str, str]] = None,
+        tools_description: Optional[str] = None,
+        tools_names: Optional[str] = None,
+        tool_index: Optional[ToolIndex] = None,
+        default_tool_timeout: Optional[float] = None,
     ) -> None:
         self._i18n: I18N = agent.i18n if agent else I18N()
         self._printer: Printer = Printer()
@@ -83,14 +97,22 @@ class ToolUsage:
         self._max_parsing_attempts: int = 3
         self._remember_format_after_usages: int = 3
         self.agent = agent
-        self.tools_description = render_text_description_and_args(tools)
-        self.tools_names = get_tool_names(tools)
+        self.tools_description = (
+            tools_description
+            if tools_description is not None
+            else render_text_description_and_args(tools)
+        )
+        self.tools_names = (
+            tools_names if tools_names is not None else get_tool_names(tools)
+        )
         self.tools_handler = tools_handler
         self.tools = tools
+        self.tool_index = tool_index if tool_index is not None else ToolIndex(tools)
         self.task = task
         self.action = action
         self.function_calling_llm = function_calling_llm
         self.fingerprint_context = fingerprint_context or {}
+        self.default_tool_timeout = default_tool_timeout
 
         # Set the maximum parsing attempts for bigger models
         if (
@@ -107,6 +129,46 @@ class ToolUsage:
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        tool = self._resolve_calling(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
+                return result
+
+            except Exception as e:
+                return self._handle_use_error(e)
+
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """Async counterpart of `use`.
+
+        Coroutine tools are awaited directly, blocking tools run on the shared
+        tool execution pool so they don't block the event loop.
+        """
+        tool = self._resolve_calling(calling)
+        if isinstance(tool, str):
+            return tool
+
+        if self._is_add_image_tool(tool):
+            try:
+                return await self._ause(
+                    tool_string=tool_string, tool=tool, calling=calling
+                )
+            except Exception as e:
+                return self._handle_use_error(e)
+
+        return f"{await self._ause(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    def _resolve_calling(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Union[CrewStructuredTool, str]:
+        """Select the tool for a calling, or return the error to show the agent."""
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             if self.agent and self.agent.verbose:
@@ -116,39 +178,99 @@ class ToolUsage:
             return error
 
         try:
-            tool = self._select_tool(calling.tool_name)
+            return self._select_tool(calling.tool_name)
         except Exception as e:
-            error = getattr(e, "message", str(e))
-            if self.task:
-                self.task.increment_tools_errors()
-            if self.agent and self.agent.verbose:
-                self._printer.print(content=f"\n\n{error}\n", color="red")
-            return error
+            return self._handle_use_error(e)
 
-        if (
+    def _handle_use_error(self, e: Exception) -> str:
+        error = getattr(e, "message", str(e))
+        if self.task:
+            self.task.increment_tools_errors()
+        if self.agent and self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
+
+    def _is_add_image_tool(self, tool: Any) -> bool:
+        return (
             isinstance(tool, CrewStructuredTool)
             and tool.name == self._i18n.tools("add_image")["name"]  # type: ignore
-        ):
-            try:
-                result = self._use(tool_string=tool_string, tool=tool, calling=calling)
-                return result
+        )
+
+    def _use(
+        self,
+        tool_string: str,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> str:
+        repeated_usage = self._repeated_usage_result(tool=tool, calling=calling)
+        if repeated_usage is not None:
+            return repeated_usage
+
+        started_at = self._on_tool_use_started()
+        result, from_cache = self._read_cache(calling)
 
+        if result is None:
+            try:
+                self._track_delegation(calling)
+                result = self._invoke_tool(tool=tool, calling=calling)
+            except ToolTimeoutError as e:
+                return self._on_tool_timeout(tool=tool, calling=calling, e=e)
             except Exception as e:
-                error = getattr(e, "message", str(e))
-                if self.task:
-                    self.task.increment_tools_errors()
-                if self.agent and self.agent.verbose:
-                    self._printer.print(content=f"\n\n{error}\n", color="red")
-                return error
+                error = self._on_invoke_error(tool=tool, calling=calling, e=e)
+                if error is not None:
+                    return error  # type: ignore # No return value expected
+                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
 
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+            self._cache_result(tool=tool, calling=calling, result=result)
 
-    def _use(
+        return self._finish_use(
+            tool=tool,
+            calling=calling,
+            result=result,
+            from_cache=from_cache,
+            started_at=started_at,
+        )
+
+    async def _ause(
         self,
         tool_string: str,
         tool: CrewStructuredTool,
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> str:
+        repeated_usage = self._repeated_usage_result(tool=tool, calling=calling)
+        if repeated_usage is not None:
+            return repeated_usage
+
+        started_at = self._on_tool_use_started()
+        result, from_cache = self._read_cache(calling)
+
+        if result is None:
+            try:
+                self._track_delegation(calling)
+                result = await self._ainvoke_tool(tool=tool, calling=calling)
+            except ToolTimeoutError as e:
+                return self._on_tool_timeout(tool=tool, calling=calling, e=e)
+            except Exception as e:
+                error = self._on_invoke_error(tool=tool, calling=calling, e=e)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
+
+            self._cache_result(tool=tool, calling=calling, result=result)
+
+        return self._finish_use(
+            tool=tool,
+            calling=calling,
+            result=result,
+            from_cache=from_cache,
+            started_at=started_at,
+        )
+
+    def _repeated_usage_result(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Optional[str]:
         if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
             try:
                 result = self._i18n.errors("task_repeated_usage").format(
@@ -165,7 +287,9 @@ class ToolUsage:
             except Exception:
                 if self.task:
                     self.task.increment_tools_errors()
+        return None
 
+    def _on_tool_use_started(self) -> float:
         if self.agent:
             event_data = {
                 "agent_key": self.agent.key,
@@ -181,95 +305,177 @@ class ToolUsage:
 
             crewai_event_bus.emit(self,ToolUsageStartedEvent(**event_data))
             
-        started_at = time.time()
-        from_cache = False
-        result = None  # type: ignore
+        return time.time()
 
+    def _read_cache(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Tuple[Any, bool]:
+        result = None
         if self.tools_handler and self.tools_handler.cache:
             result = self.tools_handler.cache.read(
                 tool=calling.tool_name, input=calling.arguments
             )  # type: ignore
-            from_cache = result is not None
+        return result, result is not None
 
-        available_tool = next(
-            (
-                available_tool
-                for available_tool in self.tools
-                if available_tool.name == tool.name
-            ),
-            None,
-        )
+    def _track_delegation(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name in [
+            "Delegate work to coworker",
+            "Ask question to coworker",
+        ]:
+            coworker = calling.arguments.get("coworker") if calling.arguments else None
+            if self.task:
+                self.task.increment_delegations(coworker)
 
-        if result is None:
+    def _tool_arguments(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Dict[str, Any]:
+        """Arguments accepted by the tool's schema, with fingerprint metadata."""
+        acceptable_args = tool.args_schema.model_json_schema()["properties"].keys()  # type: ignore
+        arguments = {
+            k: v for k, v in calling.arguments.items() if k in acceptable_args
+        }
+        # Add fingerprint metadata if available
+        return self._add_fingerprint_metadata(arguments)
+
+    def _tool_timeout(self, tool: CrewStructuredTool) -> Optional[float]:
+        timeout = getattr(tool, "timeout", None)
+        return timeout if timeout is not None else self.default_tool_timeout
+
+    def _invoke_tool(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Any:
+        timeout = self._tool_timeout(tool)
+
+        def invoke(arguments: Dict[str, Any]) -> Any:
+            return run_with_timeout(
+                lambda: tool.invoke(input=arguments), timeout, tool.name
+            )
+
+        if calling.arguments:
             try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
-                    coworker = (
-                        calling.arguments.get("coworker") if calling.arguments else None
-                    )
-                    if self.task:
-                        self.task.increment_delegations(coworker)
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.model_json_schema()[
-                            "properties"
-                        ].keys()  # type: ignore
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                    except Exception:
-                        arguments = calling.arguments
-                        # Add fingerprint metadata if available
-                        arguments = self._add_fingerprint_metadata(arguments)
-                        result = tool.invoke(input=arguments)
-                else:
-                    # Add fingerprint metadata even to empty arguments
-                    arguments = self._add_fingerprint_metadata({})
-                    result = tool.invoke(input=arguments)
-            except Exception as e:
-                self.on_tool_error(tool=tool, tool_calling=calling, e=e)
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
-                    )
-                    error = ToolUsageErrorException(
-                        f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
-                    ).message
-                    if self.task:
-                        self.task.increment_tools_errors()
-                    if self.agent and self.agent.verbose:
-                        self._printer.print(
-                            content=f"\n\n{error_message}\n", color="red"
-                        )
-                    return error  # type: ignore # No return value expected
+                return invoke(self._tool_arguments(tool, calling))
+            except ToolTimeoutError:
+                raise
+            except Exception:
+                return invoke(self._add_fingerprint_metadata(calling.arguments))
+        # Add fingerprint metadata even to empty arguments
+        return invoke(self._add_fingerprint_metadata({}))
 
-                if self.task:
-                    self.task.increment_tools_errors()
-                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+    async def _ainvoke_tool(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> Any:
+        pool = get_tool_execution_pool()
+        timeout = self._tool_timeout(tool)
+        if calling.arguments:
+            try:
+                return await pool.run(
+                    tool, self._tool_arguments(tool, calling), timeout=timeout
+                )
+            except ToolTimeoutError:
+                raise
+            except Exception:
+                arguments = self._add_fingerprint_metadata(calling.arguments)
+                return await pool.run(tool, arguments, timeout=timeout)
+        return await pool.run(
+            tool, self._add_fingerprint_metadata({}), timeout=timeout
+        )
 
-            if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(available_tool, "cache_function")
-                    and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                ):
-                    should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                        calling.arguments, result
-                    )
+    def _on_tool_timeout(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: ToolTimeoutError,
+    ) -> str:
+        """Report a timed out tool and return the observation for the agent.
+
+        Timeouts are not retried: a hung tool is likely to hang again, so the
+        agent is asked to take another path instead.
+        """
+        event_data = self._prepare_event_data(tool, calling)
+        crewai_event_bus.emit(
+            self, ToolUsageTimeoutEvent(**{**event_data, "timeout": e.timeout})
+        )
+        if self.task:
+            self.task.increment_tools_errors()
+        error = self._i18n.errors("tool_timeout").format(
+            tool=tool.name, timeout=e.timeout
+        )
+        if self.agent and self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
 
-                self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+    def _on_invoke_error(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+    ) -> Optional[str]:
+        """Record a failed invocation.
+
+        Returns the error to show the agent once the attempts are exhausted,
+        or None if the tool should be retried.
+        """
+        self.on_tool_error(tool=tool, tool_calling=calling, e=e)
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f"\n{error_message}.\nMoving on then. {self._i18n.slice('format').format(tool_names=self.tools_names)}"
+            ).message
+            if self.task:
+                self.task.increment_tools_errors()
+            if self.agent and self.agent.verbose:
+                self._printer.print(content=f"\n\n{error_message}\n", color="red")
+            return error
+
+        if self.task:
+            self.task.increment_tools_errors()
+        return None
+
+    def _cache_result(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+    ) -> None:
+        if self.tools_handler:
+            available_tool = self.tool_index.get(tool.name)
+            should_cache = True
+            if (
+                hasattr(available_tool, "cache_function")
+                and available_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+            ):
+                should_cache = available_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+                    calling.arguments, result
                 )
+
+            self.tools_handler.on_tool_use(
+                calling=calling,
+                output=result,
+                should_cache=should_cache,
+                cache_ttl=getattr(available_tool, "cache_ttl", None),
+            )
+
+    def _finish_use(
+        self,
+        tool: CrewStructuredTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+        from_cache: bool,
+        started_at: float,
+    ) -> str:
+        available_tool = self.tool_index.get(tool.name)
         self._telemetry.tool_usage(
             llm=self.function_calling_llm,
             tool_name=tool.name,
@@ -333,22 +539,8 @@ class ToolUsage:
         return False
 
     def _select_tool(self, tool_name: str) -> Any:
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, tool.name.lower().strip(), tool_name.lower().strip()
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            if (
-                tool.name.lower().strip() == tool_name.lower().strip()
-                or SequenceMatcher(
-                    None, tool.name.lower().strip(), tool_name.lower().strip()
-                ).ratio()
-                > 0.85
-            ):
-                return tool
+        if tool := self.tool_index.find(tool_name):
+            return tool
         if self.task:
             self.task.increment_tools_errors()
         tool_selection_data: Dict[str, Any] = {
@@ -477,43 +669,24 @@ class ToolUsage:
                 "Tool input must be a valid dictionary in JSON or Python literal format"
             )
 
-        # Attempt 1: Parse as JSON
-        try:
-            arguments = json.loads(tool_input)
-            if isinstance(arguments, dict):
-                return arguments
-        except (JSONDecodeError, TypeError):
-            pass  # Continue to the next parsing attempt
-
-        # Attempt 2: Parse as Python literal
+        # Single tolerant pass over JSON, Python literals and common LLM quirks
         try:
-            arguments = ast.literal_eval(tool_input)
-            if isinstance(arguments, dict):
-                return arguments
-        except (ValueError, SyntaxError):
-            repaired_input = repair_json(tool_input)
-            pass  # Continue to the next parsing attempt
-
-        # Attempt 3: Parse as JSON5
-        try:
-            arguments = json5.loads(tool_input)
-            if isinstance(arguments, dict):
-                return arguments
-        except (JSONDecodeError, ValueError, TypeError):
-            pass  # Continue to the next parsing attempt
+            parsed = parse_tolerant_json(tool_input)
+            arguments, repairs = parsed.value, parsed.repairs
+        except TolerantJSONParseError:
+            # Last resort for inputs the tolerant parser cannot make sense of
+            try:
+                arguments = json.loads(
+                    str(repair_json(tool_input, skip_json_loads=True))
+                )
+                repairs = ["json_repair"]
+            except Exception:
+                arguments, repairs = None, []
 
-        # Attempt 4: Repair JSON
-        try:
-            repaired_input = str(repair_json(tool_input, skip_json_loads=True))
-            self._printer.print(
-                content=f"Repaired JSON: {repaired_input}", color="blue"
-            )
-            arguments = json.loads(repaired_input)
-            if isinstance(arguments, dict):
-                return arguments
-        except Exception as e:
-            error = f"Failed to repair JSON: {e}"
-            self._printer.print(content=error, color="red")
+        if isinstance(arguments, dict):
+            if repairs:
+                self._emit_input_repaired(repairs)
+            return arguments
 
         error_message = (
             "Tool input must be a valid dictionary in JSON or Python literal format"
@@ -522,6 +695,25 @@ class ToolUsage:
         # If all parsing attempts fail, raise an error
         raise Exception(error_message)
 
+    def _emit_input_repaired(self, repairs: List[str]) -> None:
+        event_data = {
+            "agent_key": str(getattr(self.agent, "key", "unknown")),
+            "agent_role": str(getattr(self.agent, "role", "unknown")),
+            "tool_name": str(getattr(self.action, "tool", "unknown")),
+            "tool_args": str(getattr(self.action, "tool_input", "")),
+            "tool_class": self.__class__.__name__,
+            "agent": self.agent,
+        }
+
+        # Include fingerprint context if available
+        if self.fingerprint_context:
+            event_data.update(self.fingerprint_context)
+
+        crewai_event_bus.emit(
+            self,
+            ToolInputRepairedEvent(**event_data, repairs=repairs),
+        )
+
     def _emit_validate_input_error(self, final_error: str):
         tool_selection_data = {
             "agent_key": getattr(self.agent, "key", None) if self.agent else None,
@@ -1,5 +1,6 @@
 import json
 import re
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from crewai.agents.parser import (
@@ -14,6 +15,7 @@ from crewai.llms.base_llm import BaseLLM
 from crewai.tools import BaseTool as CrewAITool
 from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_index import ToolIndex
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
@@ -21,6 +23,19 @@ from crewai.utilities.exceptions.context_window_exceeding_exception import (
 )
 
 
+@dataclass
+class ExecutorArtifacts:
+    """Tool and prompt artifacts reused across executors of the same agent."""
+
+    raw_tools: List[BaseTool]
+    parsed_tools: List[CrewStructuredTool]
+    prompt: Dict[str, str]
+    stop_words: List[str]
+    tools_names: str
+    tools_description: str
+    tool_index: ToolIndex
+
+
 def parse_tools(tools: List[BaseTool]) -> List[CrewStructuredTool]:
     """Parse tools to be used for the task."""
     tools_list = []
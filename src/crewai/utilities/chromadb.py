@@ -1,5 +1,10 @@
+import os
 import re
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
 
 MIN_COLLECTION_LENGTH = 3
 MAX_COLLECTION_LENGTH = 63
@@ -60,3 +65,48 @@ def sanitize_collection_name(name: Optional[str]) -> str:
             sanitized = sanitized[:-1] + "z"
 
     return sanitized
+
+
+_clients: Dict[Tuple[str, bool], "ClientAPI"] = {}
+_clients_lock = threading.Lock()
+
+
+def get_chroma_client(path: str, allow_reset: bool = True) -> "ClientAPI":
+    """
+    Return the Chroma client of a storage path, shared by every storage using it.
+
+    Memory and knowledge storages, and the storages of every copy of a crew,
+    reuse one client per path instead of each opening their own.
+
+    Args:
+        path: The directory Chroma persists to
+        allow_reset: Whether the client may reset the database
+
+    Returns:
+        The client for the path
+    """
+    import chromadb
+    from chromadb.config import Settings
+
+    key = (os.path.realpath(path), allow_reset)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = chromadb.PersistentClient(
+                path=path, settings=Settings(allow_reset=allow_reset)
+            )
+            _clients[key] = client
+        return client
+
+
+def release_chroma_client(path: str) -> None:
+    """
+    Forget the shared clients of a storage path, e.g. after its files were removed.
+
+    Args:
+        path: The directory Chroma persists to
+    """
+    real_path = os.path.realpath(path)
+    with _clients_lock:
+        for key in [key for key in _clients if key[0] == real_path]:
+            del _clients[key]
@@ -5,3 +5,50 @@ KNOWLEDGE_DIRECTORY = "knowledge"
 MAX_LLM_RETRY = 3
 MAX_FILE_NAME_LENGTH = 255
 EMITTER_COLOR = "bold_blue"
+EXECUTOR_ARTIFACTS_CACHE_SIZE = 16
+TOOL_CACHE_MAX_SIZE = 1024
+TOOL_EXECUTION_POOL_SIZE = 16
+TOOL_MAX_CONCURRENCY = 4
+SCHEMA_CACHE_SIZE = 256
+MEMORY_PIPELINE_MAX_PENDING = 64
+MEMORY_PIPELINE_WORKERS = 2
+MEMORY_PIPELINE_EXIT_TIMEOUT = 30.0
+MEMORY_WRITE_BATCH_SIZE = 16
+MEMORY_WRITE_FLUSH_INTERVAL = 5.0
+MEMORY_CONTEXT_TOKEN_BUDGET = 2000
+MEMORY_RETRIEVAL_WORKERS = 8
+APPROX_CHARS_PER_TOKEN = 4
+EMBEDDING_CACHE_MAX_ENTRIES = 10000
+EMBEDDING_CACHE_DTYPE = "float32"
+EMBEDDING_CACHE_DIRECTORY = "embedding_cache"
+SQLITE_BUSY_TIMEOUT = 30.0
+SQLITE_CACHED_STATEMENTS = 128
+LTM_SEARCH_CANDIDATE_FACTOR = 10
+LTM_SEARCH_MAX_TERMS = 16
+LTM_RECENCY_WEIGHT = 0.2
+LTM_RECENCY_HALF_LIFE = 30 * 24 * 3600.0
+LTM_COMMON_TERM_ROWS = 1000
+SHORT_TERM_MEMORY_MAX_ITEMS = 10000
+ENTITY_MEMORY_MAX_ITEMS = 10000
+LONG_TERM_MEMORY_MAX_ITEMS = 100000
+LONG_TERM_MEMORY_PRUNE_INTERVAL = 100
+ENTITY_MERGE_DISTANCE = 0.05
+NUMPY_STORAGE_INITIAL_CAPACITY = 256
+KNOWLEDGE_LOADER_MAX_WORKERS = 8
+KNOWLEDGE_LOADER_MAX_PENDING_FILES = 16
+KNOWLEDGE_READ_BLOCK_SIZE = 1 << 20
+KNOWLEDGE_CHUNKER_WINDOW = 1 << 16
+KNOWLEDGE_TOKEN_ENCODING = "cl100k_base"
+KNOWLEDGE_EMBEDDING_BATCH_SIZE = 64
+KNOWLEDGE_EMBEDDING_CONCURRENCY = 4
+KNOWLEDGE_EMBEDDING_MAX_RETRIES = 3
+KNOWLEDGE_EMBEDDING_RETRY_DELAY = 1.0
+KNOWLEDGE_SAVE_BATCH_SIZE = (
+    KNOWLEDGE_EMBEDDING_BATCH_SIZE * KNOWLEDGE_EMBEDDING_CONCURRENCY
+)
+KNOWLEDGE_KEYWORD_INDEX_FILE = "knowledge_keywords.db"
+KNOWLEDGE_HYBRID_CANDIDATES_FACTOR = 4
+KNOWLEDGE_HYBRID_RRF_K = 60
+KNOWLEDGE_RETRIEVAL_MAX_WORKERS = 4
+KNOWLEDGE_CHUNK_LOCATE_PREFIX = 200
+MEMORY_RETENTION_LOW_WATER = 0.9
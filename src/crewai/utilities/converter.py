@@ -1,12 +1,19 @@
 import json
 import re
-from typing import Any, Optional, Type, Union, get_args, get_origin
+import threading
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Type, Union, get_args, get_origin
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from crewai.agents.agent_builder.utilities.base_output_converter import OutputConverter
+from crewai.utilities.constants import SCHEMA_CACHE_SIZE
 from crewai.utilities.printer import Printer
 from crewai.utilities.pydantic_schema_parser import PydanticSchemaParser
+from crewai.utilities.tolerant_json import TolerantJSONParseError, parse_tolerant_json
+
+_FENCED_BLOCK_RE = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)```", re.DOTALL)
 
 
 class ConverterError(Exception):
@@ -17,11 +24,159 @@ class ConverterError(Exception):
         self.message = message
 
 
+@dataclass
+class ConversionStats:
+    """Counts of structured outputs converted locally and with an LLM."""
+
+    local: int = 0
+    llm: int = 0
+
+    @property
+    def local_ratio(self) -> float:
+        total = self.local + self.llm
+        return self.local / total if total else 0.0
+
+
+_conversion_stats = ConversionStats()
+_conversion_stats_lock = threading.Lock()
+
+
+def _record_conversion(kind: str) -> None:
+    with _conversion_stats_lock:
+        setattr(_conversion_stats, kind, getattr(_conversion_stats, kind) + 1)
+
+
+def get_conversion_stats() -> ConversionStats:
+    """Return a snapshot of how many outputs were converted locally and with an LLM."""
+    with _conversion_stats_lock:
+        return replace(_conversion_stats)
+
+
+def reset_conversion_stats() -> None:
+    """Reset the local and LLM conversion counters."""
+    global _conversion_stats
+    with _conversion_stats_lock:
+        _conversion_stats = ConversionStats()
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _type_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def _balanced_objects(text: str) -> List[str]:
+    """Return the top-level balanced {...} spans of a text, largest first."""
+    spans = []
+    depth = 0
+    start = 0
+    in_string = False
+    escaped = False
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = depth > 0
+        elif char == "{":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                spans.append(text[start : index + 1])
+    return sorted(spans, key=len, reverse=True)
+
+
+def _json_candidates(text: str) -> Iterator[str]:
+    yield text
+    for block in _FENCED_BLOCK_RE.findall(text):
+        yield block
+    yield from _balanced_objects(text)
+    # Truncated output: everything from the first brace, completed by the
+    # tolerant parser
+    start = text.find("{")
+    if start != -1:
+        yield text[start:]
+
+
+def _lenient_values(value: Any) -> Iterator[Any]:
+    yield value
+    # Models wrapped in a single-item list or under a single key
+    if isinstance(value, list) and len(value) == 1:
+        yield value[0]
+    elif isinstance(value, dict) and len(value) == 1:
+        (inner,) = value.values()
+        if isinstance(inner, dict):
+            yield inner
+
+
+def extract_model_locally(text: str, model: Type[BaseModel]) -> Optional[BaseModel]:
+    """Convert text into a model without calling an LLM.
+
+    Tries, in order: the whole text, fenced code blocks, the balanced JSON
+    objects in the text from largest to smallest and finally the text from
+    its first brace with truncated JSON completed. Each candidate is parsed
+    leniently and validated with pydantic's lax coercion, also looking
+    inside single-item lists and single-key wrappers.
+
+    Args:
+        text: The text to convert.
+        model: The model to convert the text into.
+
+    Returns:
+        The validated model, or None if the text holds no valid instance.
+    """
+    adapter = _type_adapter(model)
+    seen = set()
+    for candidate in _json_candidates(text.strip()):
+        if candidate in seen:
+            continue
+        seen.add(candidate)
+        try:
+            value = json.loads(candidate, strict=False)
+        except json.JSONDecodeError:
+            try:
+                value = parse_tolerant_json(candidate).value
+            except TolerantJSONParseError:
+                continue
+        for lenient_value in _lenient_values(value):
+            try:
+                return adapter.validate_python(lenient_value)
+            except ValidationError:
+                continue
+    return None
+
+
 class Converter(OutputConverter):
     """Class that converts text into either pydantic or json."""
 
+    local_extraction: bool = Field(
+        default=True,
+        description="Try converting the text locally before calling the LLM. "
+        "Disabled when the caller already tried and failed.",
+    )
+
     def to_pydantic(self, current_attempt=1) -> BaseModel:
-        """Convert text to pydantic."""
+        """Convert text to pydantic.
+
+        The text is converted locally when it already holds a valid instance
+        of the model; the LLM is only called otherwise.
+        """
+        if current_attempt == 1:
+            local_result = (
+                extract_model_locally(self.text, self.model)
+                if self.local_extraction
+                else None
+            )
+            if local_result is not None:
+                _record_conversion("local")
+                return local_result
+            _record_conversion("llm")
         try:
             if self.llm.supports_function_calling():
                 result = self._create_instructor().to_pydantic()
@@ -32,28 +187,11 @@ class Converter(OutputConverter):
                         {"role": "user", "content": self.text},
                     ]
                 )
-                try:
-                    # Try to directly validate the response JSON
-                    result = self.model.model_validate_json(response)
-                except ValidationError:
-                    # If direct validation fails, attempt to extract valid JSON
-                    result = handle_partial_json(response, self.model, False, None)
-                    # Ensure result is a BaseModel instance
-                    if not isinstance(result, BaseModel):
-                        if isinstance(result, dict):
-                            result = self.model.parse_obj(result)
-                        elif isinstance(result, str):
-                            try:
-                                parsed = json.loads(result)
-                                result = self.model.parse_obj(parsed)
-                            except Exception as parse_err:
-                                raise ConverterError(
-                                    f"Failed to convert partial JSON result into Pydantic: {parse_err}"
-                                )
-                        else:
-                            raise ConverterError(
-                                "handle_partial_json returned an unexpected type."
-                            )
+                result = extract_model_locally(response, self.model)
+                if result is None:
+                    raise ConverterError(
+                        "The LLM response does not contain valid JSON for the model."
+                    )
             return result
         except ValidationError as e:
             if current_attempt < self.max_attempts:
@@ -70,6 +208,8 @@ class Converter(OutputConverter):
 
     def to_json(self, current_attempt=1):
         """Convert text to json."""
+        if current_attempt == 1:
+            _record_conversion("llm")
         try:
             if self.llm.supports_function_calling():
                 return self._create_instructor().to_json()
@@ -126,7 +266,9 @@ def convert_to_model(
         return result
     try:
         escaped_result = json.dumps(json.loads(result, strict=False))
-        return validate_model(escaped_result, model, bool(output_json))
+        exported_result = validate_model(escaped_result, model, bool(output_json))
+        _record_conversion("local")
+        return exported_result
     except json.JSONDecodeError:
         return handle_partial_json(
             result, model, bool(output_json), agent, converter_cls
@@ -161,25 +303,27 @@ def handle_partial_json(
     agent: Any,
     converter_cls: Optional[Type[Converter]] = None,
 ) -> Union[dict, BaseModel, str]:
-    match = re.search(r"({.*})", result, re.DOTALL)
-    if match:
-        try:
-            exported_result = model.model_validate_json(match.group(0))
-            if is_json_output:
-                return exported_result.model_dump()
-            return exported_result
-        except json.JSONDecodeError:
-            pass
-        except ValidationError:
-            pass
-        except Exception as e:
-            Printer().print(
-                content=f"Unexpected error during partial JSON handling: {type(e).__name__}: {e}. Attempting alternative conversion method.",
-                color="red",
-            )
+    try:
+        exported_result = extract_model_locally(result, model)
+    except Exception as e:
+        exported_result = None
+        Printer().print(
+            content=f"Unexpected error during partial JSON handling: {type(e).__name__}: {e}. Attempting alternative conversion method.",
+            color="red",
+        )
+    if exported_result is not None:
+        _record_conversion("local")
+        if is_json_output:
+            return exported_result.model_dump()
+        return exported_result
 
     return convert_with_instructions(
-        result, model, is_json_output, agent, converter_cls
+        result,
+        model,
+        is_json_output,
+        agent,
+        converter_cls,
+        local_extraction=False,
     )
 
 
@@ -189,6 +333,7 @@ def convert_with_instructions(
     is_json_output: bool,
     agent: Any,
     converter_cls: Optional[Type[Converter]] = None,
+    local_extraction: bool = True,
 ) -> Union[dict, BaseModel, str]:
     llm = agent.function_calling_llm or agent.llm
     instructions = get_conversion_instructions(model, llm)
@@ -200,6 +345,8 @@ def convert_with_instructions(
         model=model,
         instructions=instructions,
     )
+    if isinstance(converter, Converter) and not local_extraction:
+        converter.local_extraction = False
     exported_result = (
         converter.to_pydantic() if not is_json_output else converter.to_json()
     )
@@ -253,6 +400,7 @@ def create_converter(
     return converter
 
 
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
 def generate_model_description(model: Type[BaseModel]) -> str:
     """
     Generate a string description of a Pydantic model's fields and their types.
@@ -260,7 +408,7 @@ def generate_model_description(model: Type[BaseModel]) -> str:
     This function takes a Pydantic model class and returns a string that describes
     the model's fields and their respective types. The description includes handling
     of complex types such as `Optional`, `List`, and `Dict`, as well as nested Pydantic
-    models.
+    models. Descriptions are cached per model class.
     """
 
     def describe_field(field_type):
@@ -0,0 +1,478 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.constants import (
+    EMBEDDING_CACHE_DIRECTORY,
+    EMBEDDING_CACHE_DTYPE,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+)
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import get_sqlite_pool
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_ENV = "CREWAI_EMBEDDING_CACHE"
+"""Environment variable selecting the cache mode: "disk" (default), "memory"
+or "off"."""
+
+_SQLITE_MAX_VARIABLES = 500
+
+EMBEDDING_CACHE_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS embedding_files (
+        namespace TEXT PRIMARY KEY,
+        dim INTEGER NOT NULL,
+        dtype TEXT NOT NULL,
+        rows INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS embeddings (
+        namespace TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        row INTEGER NOT NULL,
+        PRIMARY KEY (namespace, digest)
+    );
+    """,
+]
+
+_Key = Tuple[str, str]
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters describing how often embeddings were served from the cache.
+
+    Attributes:
+        memory_hits: Texts found in the in-memory LRU.
+        disk_hits: Texts found in the on-disk store.
+        misses: Texts that had to be embedded by the provider.
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def text_digest(text: str) -> str:
+    """Content address of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def config_digest(config: Any) -> Tuple[str, bool]:
+    """Hash an embedder config.
+
+    Returns:
+        The digest and whether it is stable across processes. Configs holding
+        objects that are not JSON serializable, such as the callable of a
+        custom embedder, are hashed by their repr and only stable for the
+        lifetime of the process.
+    """
+    try:
+        serialized = json.dumps(config, sort_keys=True)
+        stable = True
+    except (TypeError, ValueError):
+        serialized = json.dumps(config, sort_keys=True, default=repr)
+        stable = False
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest(), stable
+
+
+class EmbeddingDiskStore:
+    """Persistent embedding store: a numpy memmap per embedder, indexed in SQLite.
+
+    Each embedder config gets its own file of fixed width rows. The SQLite
+    index maps a text digest to its row, and records the width and number of
+    rows of every file. Rows are only appended, inside an immediate
+    transaction, so several processes may share one directory.
+    """
+
+    def __init__(self, directory: str, dtype: str = EMBEDDING_CACHE_DTYPE) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+        self.db_path = str(self.directory / "index.db")
+        self._maps: Dict[str, np.memmap] = {}
+        self._lock = threading.Lock()
+        self._pool = get_sqlite_pool(self.db_path, EMBEDDING_CACHE_MIGRATIONS)
+
+    def _file(self, namespace: str, dtype: str) -> Path:
+        return self.directory / f"{namespace}.{dtype}"
+
+    def _rows(
+        self, namespace: str, dim: int, dtype: str, rows: int
+    ) -> Optional[np.memmap]:
+        with self._lock:
+            cached = self._maps.get(namespace)
+            if cached is not None and cached.shape[0] >= rows:
+                return cached
+            path = self._file(namespace, dtype)
+            item_size = np.dtype(dtype).itemsize * dim
+            available = path.stat().st_size // item_size if path.exists() else 0
+            if available < rows:
+                return None
+            mapped = np.memmap(path, dtype=dtype, mode="r", shape=(available, dim))
+            self._maps[namespace] = mapped
+            return mapped
+
+    def get_many(self, namespace: str, digests: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Look up embeddings by text digest, skipping the ones not stored."""
+        found: Dict[str, np.ndarray] = {}
+        conn = self._pool.connection()
+        header = conn.execute(
+            "SELECT dim, dtype, rows FROM embedding_files WHERE namespace = ?",
+            (namespace,),
+        ).fetchone()
+        if header is None:
+            return found
+        rows: Dict[str, int] = {}
+        for start in range(0, len(digests), _SQLITE_MAX_VARIABLES):
+            chunk = list(digests[start : start + _SQLITE_MAX_VARIABLES])
+            placeholders = ",".join("?" * len(chunk))
+            rows.update(
+                conn.execute(
+                    f"SELECT digest, row FROM embeddings "
+                    f"WHERE namespace = ? AND digest IN ({placeholders})",
+                    [namespace, *chunk],
+                ).fetchall()
+            )
+        if not rows:
+            return found
+
+        dim, dtype, _ = header
+        mapped = self._rows(namespace, dim, dtype, max(rows.values()) + 1)
+        if mapped is None:
+            return found
+        for digest, row in rows.items():
+            found[digest] = np.asarray(mapped[row], dtype=np.float32)
+        return found
+
+    def put_many(self, namespace: str, embeddings: Dict[str, np.ndarray]) -> None:
+        """Append embeddings that are not stored yet."""
+        if not embeddings:
+            return
+        dim = len(next(iter(embeddings.values())))
+        with self._pool.transaction() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            header = conn.execute(
+                "SELECT dim, dtype, rows FROM embedding_files WHERE namespace = ?",
+                (namespace,),
+            ).fetchone()
+            if header is None:
+                dtype, rows = self.dtype.name, 0
+                conn.execute(
+                    "INSERT INTO embedding_files (namespace, dim, dtype, rows) "
+                    "VALUES (?, ?, ?, 0)",
+                    (namespace, dim, dtype),
+                )
+            else:
+                stored_dim, dtype, rows = header
+                if stored_dim != dim:
+                    logger.warning(
+                        f"Not caching embeddings of width {dim} in a store of "
+                        f"width {stored_dim}"
+                    )
+                    return
+
+            existing = set()
+            digests = list(embeddings)
+            for start in range(0, len(digests), _SQLITE_MAX_VARIABLES):
+                chunk = digests[start : start + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                existing.update(
+                    digest
+                    for (digest,) in conn.execute(
+                        f"SELECT digest FROM embeddings "
+                        f"WHERE namespace = ? AND digest IN ({placeholders})",
+                        [namespace, *chunk],
+                    )
+                )
+            new = [
+                (digest, vector)
+                for digest, vector in embeddings.items()
+                if digest not in existing and len(vector) == dim
+            ]
+            if not new:
+                return
+
+            block = np.stack([vector for _, vector in new]).astype(dtype)
+            item_size = np.dtype(dtype).itemsize * dim
+            # Seek instead of appending so a write interrupted before its
+            # commit is overwritten rather than shifting later rows
+            path = self._file(namespace, dtype)
+            with open(path, "r+b" if path.exists() else "wb") as f:
+                f.seek(rows * item_size)
+                f.write(block.tobytes())
+            conn.executemany(
+                "INSERT INTO embeddings (namespace, digest, row) VALUES (?, ?, ?)",
+                [
+                    (namespace, digest, rows + offset)
+                    for offset, (digest, _) in enumerate(new)
+                ],
+            )
+            conn.execute(
+                "UPDATE embedding_files SET rows = ? WHERE namespace = ?",
+                (rows + len(new), namespace),
+            )
+
+    def clear(self) -> None:
+        """Delete every stored embedding."""
+        with self._lock:
+            self._maps.clear()
+        with self._pool.transaction() as conn:
+            namespaces = conn.execute(
+                "SELECT namespace, dtype FROM embedding_files"
+            ).fetchall()
+            conn.execute("DELETE FROM embeddings")
+            conn.execute("DELETE FROM embedding_files")
+        for namespace, dtype in namespaces:
+            self._file(namespace, dtype).unlink(missing_ok=True)
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache shared by memory and knowledge.
+
+    Embeddings are keyed by a hash of the embedder config and the sha256 of
+    the text. Lookups go to an in-memory LRU first, then to the on-disk store
+    of the current storage directory. Disk errors are logged and treated as
+    misses, so the cache never fails an embedding call.
+
+    Attributes:
+        max_entries: Embeddings kept in memory.
+        mode: "disk" to also persist embeddings, "memory" to keep them for
+            the lifetime of the process only, "off" to disable caching.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES,
+        mode: Optional[str] = None,
+        dtype: str = EMBEDDING_CACHE_DTYPE,
+    ) -> None:
+        self.max_entries = max_entries
+        self.mode = mode or os.environ.get(EMBEDDING_CACHE_ENV, "disk")
+        self.dtype = dtype
+        self._entries: "OrderedDict[_Key, np.ndarray]" = OrderedDict()
+        self._stores: Dict[str, EmbeddingDiskStore] = {}
+        self._stats = EmbeddingCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def stats(self) -> EmbeddingCacheStats:
+        """A snapshot of the cache counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = EmbeddingCacheStats()
+
+    def clear(self) -> None:
+        """Drop every cached embedding, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+        store = self._store()
+        if store is not None:
+            store.clear()
+
+    def _store(self) -> Optional[EmbeddingDiskStore]:
+        if self.mode != "disk":
+            return None
+        # Resolved on every call as the storage directory may change
+        directory = os.path.join(db_storage_path(), EMBEDDING_CACHE_DIRECTORY)
+        with self._lock:
+            store = self._stores.get(directory)
+        if store is None:
+            try:
+                store = EmbeddingDiskStore(directory, dtype=self.dtype)
+            except Exception as e:
+                logger.warning(f"Embedding cache store unavailable: {e}")
+                return None
+            with self._lock:
+                store = self._stores.setdefault(directory, store)
+        return store
+
+    def embed(
+        self,
+        namespace: str,
+        texts: Sequence[str],
+        embed: Callable[[List[str]], Embeddings],
+        persist: bool = True,
+    ) -> List[np.ndarray]:
+        """Return the embedding of every text, calling `embed` for the misses.
+
+        Args:
+            namespace: Digest of the embedder config.
+            texts: Texts to embed.
+            embed: Embeds a list of texts with the provider.
+            persist: Whether embeddings may be written to the disk store.
+
+        Returns:
+            The embeddings, in the order of `texts`.
+        """
+        digests = [text_digest(text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for digest in digests:
+                vector = self._entries.get((namespace, digest))
+                if vector is not None:
+                    self._entries.move_to_end((namespace, digest))
+                    found[digest] = vector
+        memory_hits = len(found)
+
+        store = self._store() if persist else None
+        missing = list(dict.fromkeys(d for d in digests if d not in found))
+        disk_hits: Dict[str, np.ndarray] = {}
+        if store is not None and missing:
+            try:
+                disk_hits = store.get_many(namespace, missing)
+            except Exception as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+            found.update(disk_hits)
+
+        to_embed: Dict[str, str] = {}
+        for text, digest in zip(texts, digests):
+            if digest not in found:
+                to_embed.setdefault(digest, text)
+        computed: Dict[str, np.ndarray] = {}
+        if to_embed:
+            vectors = embed(list(to_embed.values()))
+            computed = {
+                digest: np.asarray(vector, dtype=np.float32)
+                for digest, vector in zip(to_embed, vectors)
+            }
+            found.update(computed)
+            if store is not None:
+                try:
+                    store.put_many(namespace, computed)
+                except Exception as e:
+                    logger.warning(f"Embedding cache write failed: {e}")
+
+        with self._lock:
+            for digest, vector in {**disk_hits, **computed}.items():
+                self._entries[(namespace, digest)] = vector
+                self._entries.move_to_end((namespace, digest))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._stats.memory_hits += memory_hits
+            self._stats.disk_hits += len(disk_hits)
+            self._stats.misses += len(computed)
+
+        return [found[digest] for digest in digests]
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embedding function that serves repeated texts from the embedding cache.
+
+    Only the texts missing from the cache reach the wrapped function, in a
+    single call. Everything chroma reads from an embedding function other
+    than the embeddings themselves is delegated, so collections created with
+    the wrapper are indistinguishable from ones created with the provider.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        config: Any,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.namespace, self.persist = config_digest(config)
+        self._cache = cache
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache or get_embedding_cache()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return self.cache.embed(
+            self.namespace, list(input), self.embedding_function, self.persist
+        )
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        # Providers may embed queries differently from documents
+        return self.cache.embed(
+            f"{self.namespace}:query",
+            list(input),
+            self.embedding_function.embed_query,
+            self.persist,
+        )
+
+    def name(self) -> str:  # type: ignore[override]
+        return self.embedding_function.name()
+
+    def get_config(self) -> Dict[str, Any]:
+        return self.embedding_function.get_config()
+
+    def build_from_config(self, config: Dict[str, Any]) -> EmbeddingFunction:  # type: ignore[override]
+        return self.embedding_function.build_from_config(config)
+
+    def validate_config(self, config: Dict[str, Any]) -> None:  # type: ignore[override]
+        self.embedding_function.validate_config(config)
+
+    def validate_config_update(
+        self, old_config: Dict[str, Any], new_config: Dict[str, Any]
+    ) -> None:
+        self.embedding_function.validate_config_update(old_config, new_config)
+
+    def default_space(self):
+        return self.embedding_function.default_space()
+
+    def supported_spaces(self):
+        return self.embedding_function.supported_spaces()
+
+    def is_legacy(self) -> bool:
+        return self.embedding_function.is_legacy()
+
+
+def cached_embedding_function(
+    embedding_function: EmbeddingFunction, config: Any
+) -> EmbeddingFunction:
+    """Wrap an embedding function in the shared cache, unless caching is off."""
+    if isinstance(embedding_function, CachedEmbeddingFunction):
+        return embedding_function
+    if not get_embedding_cache().enabled:
+        return embedding_function
+    return CachedEmbeddingFunction(embedding_function, config)
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache()
+        return _default_cache
+
+
+def get_embedding_cache_stats() -> EmbeddingCacheStats:
+    """Hit and miss counters of the process-wide embedding cache."""
+    return get_embedding_cache().stats
+
+
+def reset_embedding_cache_stats() -> None:
+    get_embedding_cache().reset_stats()
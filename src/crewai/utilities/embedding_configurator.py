@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional, cast
 from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.api.types import validate_embedding_function
 
+from crewai.utilities.embedding_cache import cached_embedding_function
+
 
 class EmbeddingConfigurator:
     def __init__(self):
@@ -25,9 +27,15 @@ class EmbeddingConfigurator:
         self,
         embedder_config: Optional[Dict[str, Any]] = None,
     ) -> EmbeddingFunction:
-        """Configures and returns an embedding function based on the provided config."""
+        """Configures and returns an embedding function based on the provided config.
+
+        The embedding function is wrapped in the shared embedding cache, so
+        texts it has already embedded are not sent to the provider again.
+        """
         if embedder_config is None:
-            return self._create_default_embedding_function()
+            return cached_embedding_function(
+                self._create_default_embedding_function(), embedder_config
+            )
 
         provider = embedder_config.get("provider")
         config = embedder_config.get("config", {})
@@ -39,10 +47,13 @@ class EmbeddingConfigurator:
             )
 
         embedding_function = self.embedding_functions[provider]
-        return (
-            embedding_function(config)
-            if provider == "custom"
-            else embedding_function(config, model_name)
+        return cached_embedding_function(
+            (
+                embedding_function(config)
+                if provider == "custom"
+                else embedding_function(config, model_name)
+            ),
+            embedder_config,
         )
 
     @staticmethod
@@ -13,6 +13,7 @@ from .agent_events import (
     AgentExecutionStartedEvent,
     AgentExecutionCompletedEvent,
     AgentExecutionErrorEvent,
+    AgentLoopDetectedEvent,
 )
 from .task_events import (
     TaskStartedEvent,
@@ -34,7 +35,9 @@ from .tool_usage_events import (
     ToolUsageFinishedEvent,
     ToolUsageErrorEvent,
     ToolUsageStartedEvent,
+    ToolUsageTimeoutEvent,
     ToolExecutionErrorEvent,
+    ToolInputRepairedEvent,
     ToolSelectionErrorEvent,
     ToolUsageEvent,
     ToolValidateInputErrorEvent,
@@ -46,6 +49,7 @@ from .llm_events import (
     LLMCallType,
     LLMStreamChunkEvent,
 )
+from .knowledge_events import KnowledgeFileLoadedEvent
 
 # events
 from .event_listener import EventListener
@@ -76,6 +76,23 @@ class AgentExecutionErrorEvent(BaseEvent):
                 self.fingerprint_metadata = self.agent.fingerprint.metadata
 
 
+class AgentLoopDetectedEvent(BaseEvent):
+    """Event emitted when an agent is found repeating its own tool calls"""
+
+    agent_role: str
+    kind: str
+    period: int
+    repeated_steps: int
+    wasted_tokens: int
+    total_wasted_tokens: int
+    intervention: str
+    task: Any = None
+    agent: Optional[Any] = None
+    type: str = "agent_loop_detected"
+
+    model_config = {"arbitrary_types_allowed": True}
+
+
 # New event classes for LiteAgent
 class LiteAgentExecutionStartedEvent(BaseEvent):
     """Event emitted when a LiteAgent starts executing"""
@@ -47,6 +47,7 @@ from .tool_usage_events import (
     ToolUsageErrorEvent,
     ToolUsageFinishedEvent,
     ToolUsageStartedEvent,
+    ToolUsageTimeoutEvent,
 )
 
 
@@ -281,6 +282,15 @@ class EventListener(BaseEventListener):
                 self.formatter.current_crew_tree,
             )
 
+        @crewai_event_bus.on(ToolUsageTimeoutEvent)
+        def on_tool_usage_timeout(source, event: ToolUsageTimeoutEvent):
+            self.formatter.handle_tool_usage_error(
+                self.formatter.current_tool_branch,
+                event.tool_name,
+                f"Timed out after {event.timeout} seconds",
+                self.formatter.current_crew_tree,
+            )
+
         # ----------- LLM EVENTS -----------
 
         @crewai_event_bus.on(LLMCallStartedEvent)
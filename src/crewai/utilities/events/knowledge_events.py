@@ -0,0 +1,11 @@
+from .base_events import BaseEvent
+
+
+class KnowledgeFileLoadedEvent(BaseEvent):
+    """Event emitted when a knowledge source finished loading one of its files"""
+
+    file_path: str
+    chunks: int
+    files_loaded: int
+    total_files: int
+    type: str = "knowledge_file_loaded"
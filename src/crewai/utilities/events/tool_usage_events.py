@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .base_events import BaseEvent
 
@@ -54,6 +54,13 @@ class ToolUsageErrorEvent(ToolUsageEvent):
     type: str = "tool_usage_error"
 
 
+class ToolUsageTimeoutEvent(ToolUsageEvent):
+    """Event emitted when a tool execution exceeds its timeout"""
+
+    timeout: float
+    type: str = "tool_usage_timeout"
+
+
 class ToolValidateInputErrorEvent(ToolUsageEvent):
     """Event emitted when a tool input validation encounters an error"""
 
@@ -61,6 +68,13 @@ class ToolValidateInputErrorEvent(ToolUsageEvent):
     type: str = "tool_validate_input_error"
 
 
+class ToolInputRepairedEvent(ToolUsageEvent):
+    """Event emitted when malformed tool input had to be repaired to be parsed"""
+
+    repairs: List[str]
+    type: str = "tool_input_repaired"
+
+
 class ToolSelectionErrorEvent(ToolUsageEvent):
     """Event emitted when a tool selection encounters an error"""
 
@@ -1,7 +1,10 @@
+from functools import lru_cache
 from typing import Dict, List, Type, Union, get_args, get_origin
 
 from pydantic import BaseModel
 
+from crewai.utilities.constants import SCHEMA_CACHE_SIZE
+
 
 class PydanticSchemaParser(BaseModel):
     model: Type[BaseModel]
@@ -10,9 +13,11 @@ class PydanticSchemaParser(BaseModel):
         """
         Public method to get the schema of a Pydantic model.
 
+        Schemas are cached per parser class and model.
+
         :return: String representation of the model schema.
         """
-        return "{\n" + self._get_model_schema(self.model) + "\n}"
+        return _cached_schema(type(self), self.model)
 
     def _get_model_schema(self, model: Type[BaseModel], depth: int = 0) -> str:
         indent = " " * 4 * depth
@@ -90,3 +95,11 @@ class PydanticSchemaParser(BaseModel):
             nested_indent = " " * 4 * depth
             return f"{annotation.__name__}\n{nested_indent}{{\n{nested_schema}\n{nested_indent}}}"
         return annotation.__name__
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _cached_schema(
+    parser_cls: Type[PydanticSchemaParser], model: Type[BaseModel]
+) -> str:
+    parser = parser_cls(model=model)
+    return "{\n" + parser._get_model_schema(model) + "\n}"
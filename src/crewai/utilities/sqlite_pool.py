@@ -0,0 +1,166 @@
+import os
+import re
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence, Tuple
+
+from crewai.utilities.constants import (
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_CACHED_STATEMENTS,
+)
+
+_ADD_COLUMN = re.compile(
+    r"\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+(?:COLUMN\s+)?(\w+)", re.IGNORECASE
+)
+
+
+def _adds_existing_column(conn: sqlite3.Connection, statement: str) -> bool:
+    # ADD COLUMN has no IF NOT EXISTS, check the table for the column instead
+    match = _ADD_COLUMN.match(statement)
+    if match is None:
+        return False
+    table, column = match.groups()
+    columns = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    return any(row[1].lower() == column.lower() for row in columns)
+
+
+def _statements(script: str) -> Iterator[str]:
+    # executescript would commit the migration transaction, so split the
+    # script ourselves; complete_statement keeps trigger bodies together
+    statement = ""
+    for part in script.split(";"):
+        statement += part + ";"
+        if sqlite3.complete_statement(statement):
+            if statement.strip(" \n\t;"):
+                yield statement.strip()
+            statement = ""
+
+
+class SQLiteConnectionPool:
+    """Per-thread SQLite connections to one database file.
+
+    Each thread keeps its own connection open for as long as it runs, so
+    repeated saves and loads reuse it, along with its cache of compiled
+    statements, instead of reconnecting and re-parsing every query. The
+    connections of threads that have exited are closed when the next
+    connection is opened, so short-lived threads do not leak them.
+    Connections run in WAL mode with `synchronous=NORMAL`: readers never
+    block the writer, and commits no longer wait for an fsync.
+
+    Schema changes are applied as numbered migrations tracked in
+    `PRAGMA user_version`, so each migration runs once per database file.
+    Migrations must be idempotent (`IF NOT EXISTS`) so databases created
+    before versioning upgrade cleanly. `ALTER TABLE ... ADD COLUMN` has no
+    `IF NOT EXISTS`, so it is skipped when the table has the column.
+
+    Attributes:
+        db_path: Path of the database file.
+        migrations: SQL scripts in the order they are applied.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        migrations: Sequence[str] = (),
+        busy_timeout: float = SQLITE_BUSY_TIMEOUT,
+    ) -> None:
+        self.db_path = db_path
+        self.migrations = list(migrations)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: List[
+            Tuple["weakref.ReferenceType[threading.Thread]", sqlite3.Connection]
+        ] = []
+        self._lock = threading.Lock()
+        self.migrate()
+
+    def connection(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout,
+                check_same_thread=False,
+                cached_statements=SQLITE_CACHED_STATEMENTS,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+            self._track(conn)
+        return conn
+
+    def _track(self, conn: sqlite3.Connection) -> None:
+        """Track a new connection and close those of threads that have exited."""
+        with self._lock:
+            connections, exited = [], []
+            for thread, other in self._connections:
+                owner = thread()
+                if owner is not None and owner.is_alive():
+                    connections.append((thread, other))
+                else:
+                    exited.append(other)
+            connections.append((weakref.ref(threading.current_thread()), conn))
+            self._connections = connections
+        for other in exited:
+            other.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a transaction, committed unless an error is raised."""
+        conn = self.connection()
+        with conn:
+            yield conn
+
+    def migrate(self) -> None:
+        """Apply the migrations the database has not seen yet."""
+        conn = self.connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for index, script in enumerate(
+                self.migrations[version:], start=version + 1
+            ):
+                for statement in _statements(script):
+                    if not _adds_existing_column(conn, statement):
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {index}")
+
+    def close(self) -> None:
+        """Close every connection. Threads reconnect on next use."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for _, conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+_pools: "weakref.WeakValueDictionary[str, SQLiteConnectionPool]" = (
+    weakref.WeakValueDictionary()
+)
+_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(
+    db_path: str,
+    migrations: Sequence[str] = (),
+    busy_timeout: float = SQLITE_BUSY_TIMEOUT,
+) -> SQLiteConnectionPool:
+    """Return the pool of a database file, shared by every storage using it.
+
+    Pools live as long as a storage holds on to them. A storage asking for
+    a pool that already exists gets its migrations applied on top, and the
+    busy timeout of the storage that created the pool.
+    """
+    key = os.path.realpath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(db_path, migrations, busy_timeout)
+            _pools[key] = pool
+        elif len(migrations) > len(pool.migrations):
+            pool.migrations = list(migrations)
+            pool.migrate()
+        return pool
@@ -0,0 +1,273 @@
+"""Single-pass tolerant parser for JSON-like text produced by LLMs."""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+_NUMBER_RE = re.compile(
+    r"[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+)
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_WHITESPACE = " \t\n\r"
+_LITERALS: Dict[str, Tuple[Any, Optional[str]]] = {
+    "true": (True, None),
+    "false": (False, None),
+    "null": (None, None),
+    "True": (True, "python_literals"),
+    "False": (False, "python_literals"),
+    "None": (None, "python_literals"),
+    "NaN": (float("nan"), "non_finite_numbers"),
+    "Infinity": (float("inf"), "non_finite_numbers"),
+}
+_ESCAPES = {
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_CLOSERS = {"{": "}", "[": "]", "(": ")"}
+
+
+class TolerantJSONParseError(ValueError):
+    """Raised when the input cannot be parsed even with repairs."""
+
+
+@dataclass
+class TolerantJSONResult:
+    """Parsed value and the names of the repairs needed to obtain it."""
+
+    value: Any
+    repairs: List[str] = field(default_factory=list)
+
+
+def parse_tolerant_json(text: str) -> TolerantJSONResult:
+    """Parse JSON, Python literals and common LLM quirks in one scan.
+
+    Valid JSON is handed to `json.loads` directly. Anything else is parsed by
+    a single scan that accepts single-quoted strings, Python `True`/`False`/
+    `None`, unquoted keys, trailing and missing commas, comments, raw control
+    characters in strings and truncated input (unterminated strings and
+    missing closing brackets).
+
+    Args:
+        text: The text to parse.
+
+    Returns:
+        TolerantJSONResult with the parsed value and the repairs applied.
+
+    Raises:
+        TolerantJSONParseError: If the text cannot be parsed.
+    """
+    try:
+        return TolerantJSONResult(value=json.loads(text))
+    except (json.JSONDecodeError, TypeError):
+        pass
+    if not isinstance(text, str):
+        raise TolerantJSONParseError("Input must be a string")
+    return _TolerantParser(text).parse()
+
+
+class _TolerantParser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+        self.repairs: List[str] = []
+
+    def parse(self) -> TolerantJSONResult:
+        self._skip_whitespace()
+        if self._at_end():
+            raise TolerantJSONParseError("Empty input")
+        value = self._parse_value()
+        self._skip_whitespace()
+        if not self._at_end():
+            raise self._error("Unexpected trailing content")
+        return TolerantJSONResult(value=value, repairs=self.repairs)
+
+    def _repair(self, name: str) -> None:
+        if name not in self.repairs:
+            self.repairs.append(name)
+
+    def _error(self, message: str) -> TolerantJSONParseError:
+        return TolerantJSONParseError(f"{message} at position {self.pos}")
+
+    def _at_end(self) -> bool:
+        return self.pos >= len(self.text)
+
+    def _skip_whitespace(self) -> None:
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char in _WHITESPACE:
+                self.pos += 1
+            elif text.startswith("//", self.pos) or char == "#":
+                end = text.find("\n", self.pos)
+                self.pos = len(text) if end == -1 else end + 1
+                self._repair("comments")
+            elif text.startswith("/*", self.pos):
+                end = text.find("*/", self.pos + 2)
+                self.pos = len(text) if end == -1 else end + 2
+                self._repair("comments")
+            else:
+                return
+
+    def _parse_value(self) -> Any:
+        char = self.text[self.pos]
+        if char in _CLOSERS:
+            return self._parse_container(char)
+        if char in "\"'":
+            return self._parse_string()
+        number = _NUMBER_RE.match(self.text, self.pos)
+        if number:
+            return self._parse_number(number.group())
+        identifier = _IDENTIFIER_RE.match(self.text, self.pos)
+        if identifier and identifier.group() in _LITERALS:
+            self.pos = identifier.end()
+            value, repair = _LITERALS[identifier.group()]
+            if repair:
+                self._repair(repair)
+            return value
+        if self.text.startswith("-Infinity", self.pos):
+            self.pos += len("-Infinity")
+            self._repair("non_finite_numbers")
+            return float("-inf")
+        raise self._error(f"Unexpected character {char!r}")
+
+    def _parse_number(self, token: str) -> Any:
+        self.pos += len(token)
+        unsigned = token.lstrip("+-")
+        if unsigned[:2] in ("0x", "0X"):
+            self._repair("hex_numbers")
+            value = int(unsigned, 16)
+            return -value if token.startswith("-") else value
+        if token.startswith("+") or unsigned.startswith(".") or unsigned.endswith("."):
+            self._repair("lenient_numbers")
+        if any(marker in token for marker in ".eE"):
+            return float(token)
+        return int(token)
+
+    def _parse_key(self) -> Any:
+        char = self.text[self.pos]
+        if char in "\"'":
+            return self._parse_string()
+        identifier = _IDENTIFIER_RE.match(self.text, self.pos)
+        if identifier:
+            self.pos = identifier.end()
+            self._repair("unquoted_keys")
+            return identifier.group()
+        number = _NUMBER_RE.match(self.text, self.pos)
+        if number:
+            return self._parse_number(number.group())
+        raise self._error(f"Unexpected character {char!r} in object key")
+
+    def _parse_container(self, opener: str) -> Any:
+        closer = _CLOSERS[opener]
+        is_object = opener == "{"
+        items: Any = {} if is_object else []
+        self.pos += 1
+        expecting_item = True
+
+        while True:
+            self._skip_whitespace()
+            if self._at_end():
+                self._repair("missing_closers")
+                break
+            char = self.text[self.pos]
+            if char == closer:
+                self.pos += 1
+                if expecting_item and items:
+                    self._repair("trailing_commas")
+                break
+            if char == ",":
+                if expecting_item:
+                    raise self._error("Unexpected ','")
+                self.pos += 1
+                expecting_item = True
+                continue
+            if not expecting_item:
+                self._repair("missing_commas")
+
+            if is_object:
+                key = self._parse_key()
+                self._skip_whitespace()
+                if not self._at_end():
+                    if self.text[self.pos] != ":":
+                        raise self._error("Expected ':' after object key")
+                    self.pos += 1
+                    self._skip_whitespace()
+                if self._at_end():
+                    # Truncated before the value: drop the dangling key
+                    self._repair("missing_closers")
+                    break
+                items[key] = self._parse_value()
+            else:
+                items.append(self._parse_value())
+            expecting_item = False
+
+        if opener == "(":
+            self._repair("python_literals")
+            return tuple(items)
+        return items
+
+    def _parse_string(self) -> str:
+        text = self.text
+        quote = text[self.pos]
+        if quote == "'":
+            self._repair("single_quotes")
+        self.pos += 1
+        chunks: List[str] = []
+        start = self.pos
+
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == quote:
+                chunks.append(text[start : self.pos])
+                self.pos += 1
+                return "".join(chunks)
+            if char == "\\":
+                chunks.append(text[start : self.pos])
+                chunks.append(self._parse_escape())
+                start = self.pos
+                continue
+            if char in "\n\r\t":
+                self._repair("control_characters")
+            self.pos += 1
+
+        chunks.append(text[start:])
+        self._repair("unterminated_string")
+        return "".join(chunks)
+
+    def _parse_escape(self) -> str:
+        text = self.text
+        self.pos += 1
+        if self._at_end():
+            return "\\"
+        char = text[self.pos]
+        self.pos += 1
+        if char in _ESCAPES:
+            return _ESCAPES[char]
+        if char == "u" and re.fullmatch(
+            r"[0-9a-fA-F]{4}", text[self.pos : self.pos + 4]
+        ):
+            code = int(text[self.pos : self.pos + 4], 16)
+            self.pos += 4
+            if 0xD800 <= code < 0xDC00 and re.fullmatch(
+                r"\\u[dD][c-fC-F][0-9a-fA-F]{2}", text[self.pos : self.pos + 6]
+            ):
+                low = int(text[self.pos + 2 : self.pos + 6], 16)
+                self.pos += 6
+                code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+            return chr(code)
+        if char == "x" and re.fullmatch(
+            r"[0-9a-fA-F]{2}", text[self.pos : self.pos + 2]
+        ):
+            self.pos += 2
+            self._repair("python_literals")
+            return chr(int(text[self.pos - 2 : self.pos], 16))
+        self._repair("invalid_escapes")
+        return "\\" + char
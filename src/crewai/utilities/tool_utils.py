@@ -1,12 +1,56 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from crewai.agents.parser import AgentAction
 from crewai.security import Fingerprint
 from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_index import ToolIndex
 from crewai.tools.tool_types import ToolResult
 from crewai.tools.tool_usage import ToolUsage, ToolUsageErrorException
 from crewai.utilities.i18n import I18N
 
+T = TypeVar("T")
+
+_tool_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "crewai_tool_loop", default=None
+)
+
+
+async def run_with_async_tools(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking kickoff in a thread, executing its tools on the calling loop.
+
+    Agent loops are synchronous, so async kickoffs run them in a thread.
+    While `func` runs, `execute_tool_and_check_finality` hands tool calls
+    back to the calling event loop through `aexecute_tool_and_check_finality`:
+    coroutine tools are awaited there and blocking tools run on the shared
+    tool execution pool.
+
+    Args:
+        func: The blocking function to run, e.g. a kickoff.
+        *args: Arguments passed to `func`.
+
+    Returns:
+        What `func` returned.
+    """
+    token = _tool_loop.set(asyncio.get_running_loop())
+    try:
+        return await asyncio.to_thread(func, *args)
+    finally:
+        _tool_loop.reset(token)
+
+
+def _calling_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The loop of an async kickoff to run tools on, unless running on it."""
+    loop = _tool_loop.get()
+    if loop is None or not loop.is_running():
+        return None
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    return None if running is loop else loop
+
 
 def execute_tool_and_check_finality(
     agent_action: AgentAction,
@@ -19,9 +63,16 @@ def execute_tool_and_check_finality(
     agent: Optional[Any] = None,
     function_calling_llm: Optional[Any] = None,
     fingerprint_context: Optional[Dict[str, str]] = None,
+    tools_description: Optional[str] = None,
+    tools_names: Optional[str] = None,
+    tool_index: Optional[ToolIndex] = None,
+    default_tool_timeout: Optional[float] = None,
 ) -> ToolResult:
     """Execute a tool and check if the result should be treated as a final answer.
 
+    Inside `run_with_async_tools`, the tool is executed on the calling event
+    loop with `aexecute_tool_and_check_finality`.
+
     Args:
         agent_action: The action containing the tool to execute
         tools: List of available tools
@@ -32,59 +83,182 @@ def execute_tool_and_check_finality(
         task: Optional task for tool execution
         agent: Optional agent instance for tool execution
         function_calling_llm: Optional LLM for function calling
+        tools_description: Optional pre-rendered description of the tools
+        tools_names: Optional pre-rendered names of the tools
+        tool_index: Optional prebuilt name index over the tools
+        default_tool_timeout: Optional timeout in seconds for tools without their own
 
     Returns:
         ToolResult containing the execution result and whether it should be treated as a final answer
     """
-    try:
-        tool_name_to_tool_map = {tool.name: tool for tool in tools}
-
-        if agent_key and agent_role and agent:
-            fingerprint_context = fingerprint_context or {}
-            if agent:
-                if hasattr(agent, "set_fingerprint") and callable(
-                    agent.set_fingerprint
-                ):
-                    if isinstance(fingerprint_context, dict):
-                        try:
-                            fingerprint_obj = Fingerprint.from_dict(fingerprint_context)
-                            agent.set_fingerprint(fingerprint_obj)
-                        except Exception as e:
-                            raise ValueError(f"Failed to set fingerprint: {e}")
-
-        # Create tool usage instance
-        tool_usage = ToolUsage(
-            tools_handler=tools_handler,
-            tools=tools,
-            function_calling_llm=function_calling_llm,
-            task=task,
-            agent=agent,
-            action=agent_action,
-        )
-
-        # Parse tool calling
-        tool_calling = tool_usage.parse_tool_calling(agent_action.text)
-
-        if isinstance(tool_calling, ToolUsageErrorException):
-            return ToolResult(tool_calling.message, False)
-
-        # Check if tool name matches
-        if tool_calling.tool_name.casefold().strip() in [
-            name.casefold().strip() for name in tool_name_to_tool_map
-        ] or tool_calling.tool_name.casefold().replace("_", " ") in [
-            name.casefold().strip() for name in tool_name_to_tool_map
-        ]:
-            tool_result = tool_usage.use(tool_calling, agent_action.text)
-            tool = tool_name_to_tool_map.get(tool_calling.tool_name)
-            if tool:
-                return ToolResult(tool_result, tool.result_as_answer)
-
-        # Handle invalid tool name
-        tool_result = i18n.errors("wrong_tool_name").format(
-            tool=tool_calling.tool_name,
-            tools=", ".join([tool.name.casefold() for tool in tools]),
-        )
-        return ToolResult(tool_result, False)
-
-    except Exception as e:
-        raise e
+    loop = _calling_loop()
+    if loop is not None:
+        return asyncio.run_coroutine_threadsafe(
+            _aexecute_on_calling_loop(
+                agent_action=agent_action,
+                tools=tools,
+                i18n=i18n,
+                agent_key=agent_key,
+                agent_role=agent_role,
+                tools_handler=tools_handler,
+                task=task,
+                agent=agent,
+                function_calling_llm=function_calling_llm,
+                fingerprint_context=fingerprint_context,
+                tools_description=tools_description,
+                tools_names=tools_names,
+                tool_index=tool_index,
+                default_tool_timeout=default_tool_timeout,
+            ),
+            loop,
+        ).result()
+
+    tool_index = tool_index if tool_index is not None else ToolIndex(tools)
+    tool_usage = _create_tool_usage(
+        agent_action=agent_action,
+        tools=tools,
+        agent_key=agent_key,
+        agent_role=agent_role,
+        tools_handler=tools_handler,
+        task=task,
+        agent=agent,
+        function_calling_llm=function_calling_llm,
+        fingerprint_context=fingerprint_context,
+        tools_description=tools_description,
+        tools_names=tools_names,
+        tool_index=tool_index,
+        default_tool_timeout=default_tool_timeout,
+    )
+
+    # Parse tool calling
+    tool_calling = tool_usage.parse_tool_calling(agent_action.text)
+
+    if isinstance(tool_calling, ToolUsageErrorException):
+        return ToolResult(tool_calling.message, False)
+
+    # Check if tool name matches
+    tool = tool_index.get(tool_calling.tool_name)
+    if tool:
+        tool_result = tool_usage.use(tool_calling, agent_action.text)
+        return ToolResult(tool_result, tool.result_as_answer)
+
+    return _wrong_tool_name_result(tool_calling, tools, i18n)
+
+
+async def aexecute_tool_and_check_finality(
+    agent_action: AgentAction,
+    tools: List[CrewStructuredTool],
+    i18n: I18N,
+    agent_key: Optional[str] = None,
+    agent_role: Optional[str] = None,
+    tools_handler: Optional[Any] = None,
+    task: Optional[Any] = None,
+    agent: Optional[Any] = None,
+    function_calling_llm: Optional[Any] = None,
+    fingerprint_context: Optional[Dict[str, str]] = None,
+    tools_description: Optional[str] = None,
+    tools_names: Optional[str] = None,
+    tool_index: Optional[ToolIndex] = None,
+    default_tool_timeout: Optional[float] = None,
+) -> ToolResult:
+    """Async counterpart of `execute_tool_and_check_finality`.
+
+    Coroutine tools are awaited directly and blocking tools run on the shared
+    tool execution pool, subject to each tool's concurrency limit. Parsing the
+    tool calling may need the function calling LLM, so it runs in a thread.
+
+    Args:
+        Same as `execute_tool_and_check_finality`.
+
+    Returns:
+        ToolResult containing the execution result and whether it should be treated as a final answer
+    """
+    tool_index = tool_index if tool_index is not None else ToolIndex(tools)
+    tool_usage = _create_tool_usage(
+        agent_action=agent_action,
+        tools=tools,
+        agent_key=agent_key,
+        agent_role=agent_role,
+        tools_handler=tools_handler,
+        task=task,
+        agent=agent,
+        function_calling_llm=function_calling_llm,
+        fingerprint_context=fingerprint_context,
+        tools_description=tools_description,
+        tools_names=tools_names,
+        tool_index=tool_index,
+        default_tool_timeout=default_tool_timeout,
+    )
+
+    tool_calling = await asyncio.to_thread(
+        tool_usage.parse_tool_calling, agent_action.text
+    )
+
+    if isinstance(tool_calling, ToolUsageErrorException):
+        return ToolResult(tool_calling.message, False)
+
+    tool = tool_index.get(tool_calling.tool_name)
+    if tool:
+        tool_result = await tool_usage.ause(tool_calling, agent_action.text)
+        return ToolResult(tool_result, tool.result_as_answer)
+
+    return _wrong_tool_name_result(tool_calling, tools, i18n)
+
+
+async def _aexecute_on_calling_loop(**kwargs: Any) -> ToolResult:
+    # Agents started by the tool, e.g. on delegation, run their tools
+    # synchronously instead of waiting on this loop
+    _tool_loop.set(None)
+    return await aexecute_tool_and_check_finality(**kwargs)
+
+
+def _create_tool_usage(
+    agent_action: AgentAction,
+    tools: List[CrewStructuredTool],
+    agent_key: Optional[str],
+    agent_role: Optional[str],
+    tools_handler: Optional[Any],
+    task: Optional[Any],
+    agent: Optional[Any],
+    function_calling_llm: Optional[Any],
+    fingerprint_context: Optional[Dict[str, str]],
+    tools_description: Optional[str],
+    tools_names: Optional[str],
+    tool_index: ToolIndex,
+    default_tool_timeout: Optional[float],
+) -> ToolUsage:
+    if agent_key and agent_role and agent:
+        fingerprint_context = fingerprint_context or {}
+        if agent:
+            if hasattr(agent, "set_fingerprint") and callable(agent.set_fingerprint):
+                if isinstance(fingerprint_context, dict):
+                    try:
+                        fingerprint_obj = Fingerprint.from_dict(fingerprint_context)
+                        agent.set_fingerprint(fingerprint_obj)
+                    except Exception as e:
+                        raise ValueError(f"Failed to set fingerprint: {e}")
+
+    # Create tool usage instance
+    return ToolUsage(
+        tools_handler=tools_handler,
+        tools=tools,
+        function_calling_llm=function_calling_llm,
+        task=task,
+        agent=agent,
+        action=agent_action,
+        tools_description=tools_description,
+        tools_names=tools_names,
+        tool_index=tool_index,
+        default_tool_timeout=default_tool_timeout,
+    )
+
+
+def _wrong_tool_name_result(
+    tool_calling: Any, tools: List[CrewStructuredTool], i18n: I18N
+) -> ToolResult:
+    # Handle invalid tool name
+    tool_result = i18n.errors("wrong_tool_name").format(
+        tool=tool_calling.tool_name,
+        tools=", ".join([tool.name.casefold() for tool in tools]),
+    )
+    return ToolResult(tool_result, False)
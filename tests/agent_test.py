@@ -235,10 +235,9 @@ def test_cache_hitting():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert cache_handler.size == 2
+    assert cache_handler.read("multiplier", {"first_number": 2, "second_number": 6}) == 12
+    assert cache_handler.read("multiplier", {"first_number": 3, "second_number": 3}) == 9
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -248,11 +247,8 @@ def test_cache_hitting():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert cache_handler.size == 3
+    assert cache_handler.read("multiplier", {"first_number": 12, "second_number": 3}) == 36
     received_events = []
 
     @crewai_event_bus.on(ToolUsageFinishedEvent)
@@ -1044,6 +1040,45 @@ def test_using_system_prompt():
     assert agent.agent_executor.prompt.get("system")
 
 
+def test_agent_executor_reuses_cached_artifacts():
+    @tool
+    def get_final_answer() -> float:
+        """Get the final answer but don't give it yet, just re-use this
+        tool non-stop."""
+        return 42
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[get_final_answer],
+    )
+
+    agent.create_agent_executor()
+    first_executor = agent.agent_executor
+    first_executor.messages.append({"role": "user", "content": "hi"})
+    first_executor.iterations = 3
+
+    agent.create_agent_executor()
+    second_executor = agent.agent_executor
+
+    assert second_executor is not first_executor
+    assert second_executor.tools is first_executor.tools
+    assert second_executor.prompt is first_executor.prompt
+    assert second_executor.tools_description is first_executor.tools_description
+    assert second_executor.messages == []
+    assert second_executor.iterations == 0
+
+    @tool
+    def get_other_answer() -> float:
+        """Get another answer."""
+        return 24
+
+    agent.create_agent_executor(tools=[get_other_answer])
+    assert agent.agent_executor.tools is not first_executor.tools
+    assert agent.agent_executor.tools_names == "get_other_answer"
+
+
 def test_system_and_prompt_template():
     agent = Agent(
         role="{topic} specialist",
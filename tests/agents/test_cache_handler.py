@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from crewai.agents.cache import CacheHandler, SQLiteCacheHandler
+from crewai.tools import BaseTool
+from crewai.utilities.sqlite_pool import get_sqlite_pool
+
+
+def test_keys_are_canonicalized():
+    cache = CacheHandler()
+    cache.add(tool="search", input={"a": 1, "b": [1, 2]}, output="result")
+
+    assert cache.read(tool="search", input={"b": [1, 2], "a": 1}) == "result"
+    assert cache.read(tool="search", input='{"b": [1, 2],  "a": 1}') == "result"
+    assert cache.read(tool="search", input="{'a': 1, 'b': [1, 2]}") == "result"
+    assert cache.read(tool="other", input={"a": 1, "b": [1, 2]}) is None
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = CacheHandler(max_size=2)
+    cache.add(tool="t", input={"n": 1}, output=1)
+    cache.add(tool="t", input={"n": 2}, output=2)
+    assert cache.read(tool="t", input={"n": 1}) == 1
+
+    cache.add(tool="t", input={"n": 3}, output=3)
+
+    assert cache.size == 2
+    assert cache.read(tool="t", input={"n": 2}) is None
+    assert cache.read(tool="t", input={"n": 1}) == 1
+    assert cache.stats.evictions == 1
+
+
+def test_entries_expire_after_ttl():
+    cache = CacheHandler(default_ttl=10)
+    with patch("crewai.agents.cache.cache_handler.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        cache.add(tool="t", input={}, output="default")
+        cache.add(tool="t", input={"short": True}, output="short", ttl=1)
+        cache.add(tool="t", input={"skip": True}, output="skip", ttl=0)
+
+        monotonic.return_value = 105.0
+        assert cache.read(tool="t", input={}) == "default"
+        assert cache.read(tool="t", input={"short": True}) is None
+        assert cache.read(tool="t", input={"skip": True}) is None
+
+        monotonic.return_value = 111.0
+        assert cache.read(tool="t", input={}) is None
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 3, 2)
+    assert stats.hit_ratio == 0.25
+
+
+def test_concurrent_access():
+    cache = CacheHandler(max_size=50)
+
+    def worker(n):
+        cache.add(tool="t", input={"n": n}, output=n)
+        return cache.read(tool="t", input={"n": n})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(500)))
+
+    stats = cache.stats
+    assert cache.size == 50
+    assert stats.evictions == 450
+    assert stats.hits + stats.misses == 500
+
+
+def test_structured_tool_keeps_cache_settings():
+    class TimeTool(BaseTool):
+        name: str = "Time"
+        description: str = "Returns the time."
+        cache_ttl: float = 30
+
+        def _run(self) -> str:
+            return "now"
+
+    tool = TimeTool(cache_function=lambda _args, result: result != "now")
+    structured = tool.to_structured_tool()
+
+    assert structured.cache_ttl == 30
+    assert structured.cache_function({}, "now") is False
+
+
+def test_sqlite_cache_persists_across_handlers(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    SQLiteCacheHandler(db_path=db_path).add(
+        tool="search", input={"q": "crewai", "n": 3}, output={"hits": ["a", "b"]}
+    )
+
+    cache = SQLiteCacheHandler(db_path=db_path)
+    assert cache.read(tool="search", input={"n": 3, "q": "crewai"}) == {
+        "hits": ["a", "b"]
+    }
+    assert SQLiteCacheHandler(db_path=db_path, namespace="other").read(
+        tool="search", input={"n": 3, "q": "crewai"}
+    ) is None
+
+
+def test_sqlite_cache_ttl_and_eviction(tmp_path):
+    cache = SQLiteCacheHandler(db_path=str(tmp_path / "tool_cache.db"), max_size=2)
+    with patch("crewai.agents.cache.sqlite_cache_handler.time.time") as now:
+        now.return_value = 100.0
+        cache.add(tool="t", input={"n": 1}, output=1, ttl=5)
+        now.return_value = 101.0
+        cache.add(tool="t", input={"n": 2}, output=object())
+        now.return_value = 102.0
+        assert cache.read(tool="t", input={"n": 1}) == 1
+        now.return_value = 103.0
+        cache.add(tool="t", input={"n": 3}, output=3)
+
+        assert cache.read(tool="t", input={"n": 2}) is None
+        now.return_value = 106.0
+        assert cache.read(tool="t", input={"n": 1}) is None
+
+    stats = cache.stats
+    assert (stats.hits, stats.evictions, stats.expirations) == (1, 1, 1)
+    assert cache.size == 1
+
+
+def test_sqlite_cache_reads_do_not_write(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    cache = SQLiteCacheHandler(db_path=db_path, max_size=2)
+    cache.add(tool="t", input={"n": 1}, output=1)
+    cache.add(tool="t", input={"n": 2}, output=2)
+    conn = cache._connect()
+    changes = conn.total_changes
+
+    assert cache.read(tool="t", input={"n": 1}) == 1
+    assert conn.total_changes == changes
+
+    # The deferred access keeps the result read last when evicting
+    cache.add(tool="t", input={"n": 3}, output=3)
+    assert cache.read(tool="t", input={"n": 1}) == 1
+    assert cache.read(tool="t", input={"n": 2}) is None
+
+
+def test_sqlite_cache_uses_the_shared_pool(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    cache = SQLiteCacheHandler(db_path=db_path)
+
+    assert cache._connect() is get_sqlite_pool(db_path).connection()
+
+
+def test_crew_copies_share_the_configured_cache_handler(tmp_path):
+    from crewai import Agent, Crew, Task
+
+    cache = SQLiteCacheHandler(db_path=str(tmp_path / "tool_cache.db"))
+    agent = Agent(role="role", goal="goal", backstory="backstory")
+    task = Task(description="description", expected_output="output", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], cache_handler=cache)
+
+    assert crew._cache_handler is cache
+    assert crew.copy()._cache_handler is cache
+    assert isinstance(Crew(agents=[agent], tasks=[task])._cache_handler, CacheHandler)
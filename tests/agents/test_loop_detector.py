@@ -0,0 +1,137 @@
+from unittest.mock import patch
+
+import pytest
+
+from crewai import Agent, Task
+from crewai.agents.loop_detector import AgentLoopDetectedException, LoopDetector
+from crewai.agents.parser import AgentAction, AgentFinish
+from crewai.utilities.events import AgentLoopDetectedEvent, crewai_event_bus
+
+
+def _action(tool, tool_input, thought="Let me look this up"):
+    return AgentAction(thought=thought, tool=tool, tool_input=tool_input, text="")
+
+
+def test_detects_back_to_back_cycles():
+    detector = LoopDetector()
+    steps = [
+        _action("search", '{"q": "a"}'),
+        _action("read", '{"url": "x"}'),
+        _action("Search", "{'q': 'a'}"),
+    ]
+    assert [detector.record(step, tokens=10) for step in steps] == [None] * 3
+
+    detection = detector.record(_action("read", '{"url": "x"}'), tokens=10)
+
+    assert detection.kind == "cycle"
+    assert detection.period == 2
+    assert detection.repeated_steps == 2
+    assert detection.wasted_tokens == 20
+    assert detector.wasted_tokens == 20
+
+
+def test_repeated_call_is_a_cycle_of_one():
+    detector = LoopDetector()
+    detector.record(_action("search", '{"q": "a"}'), tokens=5)
+
+    detection = detector.record(_action("search", '{"q":"a"}'), tokens=7)
+
+    assert (detection.kind, detection.period, detection.wasted_tokens) == (
+        "cycle",
+        1,
+        7,
+    )
+
+
+def test_progressing_agent_is_not_flagged():
+    detector = LoopDetector()
+    for query in ["weather in paris", "weather in rome", "weather in oslo"]:
+        assert detector.record(_action("search", {"q": query})) is None
+    assert detector.record(_action("summarize", {"q": "weather in paris"})) is None
+    assert detector.detections == []
+
+
+def test_detects_near_duplicate_queries():
+    detector = LoopDetector()
+    thought = "I still need the population of the capital city of France"
+    detector.record(_action("search", {"q": "population of the capital of France"}, thought))
+    detector.record(_action("read", {"url": "https://example.com"}, "Read the page"))
+
+    detection = detector.record(
+        _action("search", {"q": "population of the capital of France?"}, thought + ".")
+    )
+
+    assert detection.kind == "near_duplicate"
+    assert detection.period == 2
+
+
+def _executor(loop_intervention):
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        loop_intervention=loop_intervention,
+    )
+    task = Task(description="test", expected_output="test", agent=agent)
+    agent.create_agent_executor(task=task)
+    return agent.agent_executor
+
+
+def test_executor_nudges_the_agent():
+    executor = _executor("nudge")
+    action = _action("search", '{"q": "a"}')
+    received = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(AgentLoopDetectedEvent)
+        def handler(source, event):
+            received.append(event)
+
+        assert executor._check_for_loop(action, 10) is action
+        assert executor._check_for_loop(action, 10) is action
+
+    assert executor.messages[-1] == {
+        "role": "user",
+        "content": executor._i18n.errors("loop_detected"),
+    }
+    assert len(received) == 1
+    assert received[0].intervention == "nudge"
+    assert received[0].total_wasted_tokens == 10
+
+
+def test_executor_forces_a_final_answer():
+    executor = _executor("force_final_answer")
+    action = _action("search", '{"q": "a"}')
+    executor._check_for_loop(action, 0)
+
+    with crewai_event_bus.scoped_handlers(), patch.object(
+        executor.llm, "call", return_value="Final Answer: done"
+    ):
+        result = executor._check_for_loop(action, 0)
+
+    assert isinstance(result, AgentFinish)
+    assert result.output == "done"
+
+
+def test_executor_aborts_when_configured():
+    executor = _executor("abort")
+    action = _action("search", '{"q": "a"}')
+    executor._check_for_loop(action, 0)
+
+    with pytest.raises(AgentLoopDetectedException):
+        executor._check_for_loop(action, 0)
+
+
+def test_loop_detection_can_be_disabled():
+    executor = _executor(None)
+    action = _action("search", '{"q": "a"}')
+
+    for _ in range(3):
+        assert executor._check_for_loop(action, 0) is action
+
+
+def test_loop_detection_is_opt_in():
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+
+    assert agent.loop_intervention is None
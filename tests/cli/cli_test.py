@@ -12,6 +12,7 @@ from crewai.cli.cli import (
     deploy_remove,
     deply_status,
     flow_add_crew,
+    memory_compact,
     reset_memories,
     signup,
     test,
@@ -55,6 +56,39 @@ def test_train_invalid_string_iterations(train_crew, runner):
     )
 
 
+@mock.patch("crewai.cli.compact_memories_command.get_crew")
+def test_compact_all_memories(mock_get_crew, runner):
+    from crewai.memory.retention import CompactionStats
+
+    mock_crew = mock.Mock()
+    mock_crew.compact_memories.return_value = {
+        "short": CompactionStats(duplicates=2, evicted=1, remaining=5),
+        "long": None,
+    }
+    mock_get_crew.return_value = mock_crew
+    result = runner.invoke(memory_compact)
+
+    mock_crew.compact_memories.assert_called_once_with("all")
+    assert result.output == (
+        "Short memory compacted: removed 2 duplicates, merged 0, expired 0, "
+        "evicted 1; 5 entries left.\n"
+        "Long memory does not support compaction.\n"
+    )
+
+
+@mock.patch("crewai.cli.compact_memories_command.get_crew")
+def test_compact_selected_memories(mock_get_crew, runner):
+    mock_crew = mock.Mock()
+    mock_crew.compact_memories.return_value = {}
+    mock_get_crew.return_value = mock_crew
+    runner.invoke(memory_compact, ["-l", "-e"])
+
+    assert mock_crew.compact_memories.call_args_list == [
+        mock.call("long"),
+        mock.call("entity"),
+    ]
+
+
 @mock.patch("crewai.cli.reset_memories_command.get_crew")
 def test_reset_all_memories(mock_get_crew, runner):
     mock_crew = mock.Mock()
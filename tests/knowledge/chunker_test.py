@@ -0,0 +1,85 @@
+import pytest
+
+from crewai.knowledge.chunker.base_chunker import CharacterChunker
+from crewai.knowledge.chunker.recursive_chunker import RecursiveChunker, token_counter
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+
+TEXT = (
+    "Brandon is a software engineer. He lives in San Francisco.\n\n"
+    "He enjoys hiking! His dog is named Max.\n"
+    "Brandon's favorite movie is Inception. He likes tacos."
+)
+
+
+def test_chunks_end_at_sentence_boundaries():
+    chunks = RecursiveChunker(chunk_size=70, chunk_overlap=0).chunk_text(TEXT)
+
+    assert chunks == [
+        "Brandon is a software engineer. He lives in San Francisco.",
+        "He enjoys hiking! His dog is named Max.",
+        "Brandon's favorite movie is Inception. He likes tacos.",
+    ]
+
+
+def test_chunks_overlap_with_whole_sentences():
+    chunks = RecursiveChunker(chunk_size=40, chunk_overlap=25).chunk_text(
+        "One sentence here. Two sentence here. Three sentence here."
+    )
+
+    assert chunks == [
+        "One sentence here. Two sentence here.",
+        "Two sentence here. Three sentence here.",
+    ]
+
+
+def test_long_words_are_cut_to_fit():
+    chunks = RecursiveChunker(chunk_size=10, chunk_overlap=0).chunk_text("x" * 25)
+
+    assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_streaming_keeps_chunks_within_size_and_covers_the_text(monkeypatch):
+    monkeypatch.setattr(
+        "crewai.knowledge.chunker.recursive_chunker.KNOWLEDGE_CHUNKER_WINDOW", 100
+    )
+    chunker = RecursiveChunker(chunk_size=60, chunk_overlap=0)
+    text = " ".join(f"Sentence number {i} is here." for i in range(50))
+    segments = [text[i : i + 13] for i in range(0, len(text), 13)]
+
+    chunks = list(chunker.chunk(segments))
+
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert all(chunk.endswith(".") for chunk in chunks)
+    assert " ".join(chunks) == text
+
+
+def test_token_chunker_measures_tokens():
+    count = token_counter("text-embedding-3-small")
+    chunker = RecursiveChunker.for_tokens(
+        chunk_size=20, chunk_overlap=0, model="text-embedding-3-small"
+    )
+
+    chunks = chunker.chunk_text(" ".join(["Knowledge is power."] * 30))
+
+    assert len(chunks) > 1
+    assert all(count(chunk) <= 20 for chunk in chunks)
+
+
+def test_character_chunker_streams_fixed_offsets():
+    chunker = CharacterChunker(chunk_size=4, chunk_overlap=1)
+
+    assert list(chunker.chunk(["abcde", "fgh"])) == ["abcd", "defg", "gh"]
+
+
+def test_invalid_overlap_is_rejected():
+    with pytest.raises(ValueError):
+        RecursiveChunker(chunk_size=10, chunk_overlap=10)
+
+
+def test_sources_use_their_chunker():
+    source = StringKnowledgeSource(
+        content=TEXT, chunker=RecursiveChunker(chunk_size=70, chunk_overlap=0)
+    )
+
+    assert len(source._chunk_text(TEXT)) == 3
+    assert StringKnowledgeSource(content=TEXT)._chunk_text(TEXT) == [TEXT]
@@ -0,0 +1,246 @@
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.storage.keyword_index import KeywordIndex, match_expression
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+
+class FlakyEmbedder:
+    """Embeds a text as [len(text)], failing the first call for `flaky` texts."""
+
+    def __init__(self, flaky=None):
+        self.flaky = flaky
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.calls.append(list(texts))
+            attempts = sum(call == list(texts) for call in self.calls)
+        if self.flaky in texts and attempts == 1:
+            raise ConnectionError("rate limited")
+        return [[float(len(text))] for text in texts]
+
+
+def _storage(embedder, **kwargs):
+    with patch.object(KnowledgeStorage, "_set_embedder_config"):
+        storage = KnowledgeStorage(collection_name="test", **kwargs)
+    storage.embedder = embedder
+    storage.collection = MagicMock()
+    return storage
+
+
+def _upserted(storage):
+    upserted = {}
+    for call in storage.collection.upsert.call_args_list:
+        for id_, document, embedding in zip(
+            call.kwargs["ids"], call.kwargs["documents"], call.kwargs["embeddings"]
+        ):
+            upserted[id_] = (document, embedding)
+    return upserted
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_save_embeds_in_batches_and_inserts_embeddings(concurrency):
+    embedder = FlakyEmbedder()
+    storage = _storage(
+        embedder, embedding_batch_size=4, embedding_concurrency=concurrency
+    )
+    documents = ["x" * n for n in range(1, 11)]
+
+    storage.save(documents, [{"n": n} for n in range(1, 11)])
+
+    assert sorted(len(call) for call in embedder.calls) == [2, 4, 4]
+    assert storage.collection.upsert.call_count == 3
+    assert sorted(_upserted(storage).values()) == [
+        (document, [float(len(document))]) for document in documents
+    ]
+    for call in storage.collection.upsert.call_args_list:
+        assert [m["n"] for m in call.kwargs["metadatas"]] == [
+            len(d) for d in call.kwargs["documents"]
+        ]
+
+
+def test_only_the_failed_batch_is_retried():
+    embedder = FlakyEmbedder(flaky="xxxxx")
+    storage = _storage(embedder, embedding_batch_size=2, embedding_concurrency=2)
+    documents = ["x" * n for n in range(1, 7)]
+
+    with patch(
+        "crewai.knowledge.storage.knowledge_storage.KNOWLEDGE_EMBEDDING_RETRY_DELAY",
+        0,
+    ):
+        storage.save(documents)
+
+    assert len(embedder.calls) == 4
+    assert embedder.calls.count(["xxxxx", "xxxxxx"]) == 2
+    assert len(_upserted(storage)) == 6
+
+
+def test_save_raises_when_retries_are_exhausted():
+    embedder = MagicMock(side_effect=ConnectionError("down"))
+    storage = _storage(embedder, embedding_max_retries=2)
+
+    with (
+        patch(
+            "crewai.knowledge.storage.knowledge_storage.KNOWLEDGE_EMBEDDING_RETRY_DELAY",
+            0,
+        ),
+        pytest.raises(ConnectionError),
+    ):
+        storage.save(["some knowledge"])
+
+    assert embedder.call_count == 3
+    storage.collection.upsert.assert_not_called()
+
+
+def test_save_skips_embedding_when_there_is_nothing_to_save():
+    embedder = FlakyEmbedder()
+    storage = _storage(embedder)
+
+    storage.save([])
+
+    assert embedder.calls == []
+    storage.collection.upsert.assert_not_called()
+
+
+class LengthEmbedder(EmbeddingFunction):
+    """Embeds a text as its length, so vector search only matches lengths."""
+
+    def __init__(self):
+        pass
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [[float(len(text))] for text in input]
+
+
+def _chroma_storage(collection_name=None):
+    with patch.object(KnowledgeStorage, "_set_embedder_config"):
+        storage = KnowledgeStorage(collection_name=collection_name or uuid.uuid4().hex)
+    storage.embedder = LengthEmbedder()
+    return storage
+
+
+CATALOG = [
+    "Returns are accepted within thirty days of delivery.",
+    "The AX-9921 pump ships with a spare gasket.",
+    "ax_tool",
+    "Orders above fifty dollars ship for free.",
+]
+
+
+def test_match_expression_quotes_every_term():
+    assert match_expression('ERR-4021 "get_user_id"') == (
+        '"ERR-4021" OR """get_user_id"""'
+    )
+    assert match_expression("   ") is None
+
+
+def test_keyword_index_ranks_matches_per_collection(tmp_path):
+    index = KeywordIndex(str(tmp_path / "keywords.db"))
+    index.add("a", ["1", "2", "3"], ["error code E42", "E42 E42 again", "nothing"])
+    index.add("a", ["1"], ["ignored, already indexed"])
+    index.add("b", ["4"], ["E42 elsewhere"])
+
+    assert index.search("a", "E42", 10) == ["2", "1"]
+    assert index.search("a", "missing", 10) == []
+    assert index.count("a") == 3
+
+    index.clear("a")
+
+    assert index.count("a") == 0
+    assert index.search("b", "e42", 10) == ["4"]
+
+
+def test_hybrid_search_finds_exact_identifiers():
+    storage = _chroma_storage()
+    storage.save(CATALOG)
+
+    vector = storage.search(["AX-9921"], limit=1, score_threshold=0)
+    hybrid = storage.search(["AX-9921"], limit=1, mode="hybrid")
+
+    assert vector[0]["context"] == "ax_tool"
+    assert hybrid[0]["context"] == CATALOG[1]
+    assert hybrid[0]["score"] > 0
+
+
+def test_hybrid_search_applies_the_metadata_filter_to_keyword_matches():
+    storage = _chroma_storage()
+    storage.save(CATALOG, [{"section": "faq"}, {"section": "parts"}] * 2)
+
+    results = storage.search(
+        ["AX-9921"], limit=4, filter={"section": "faq"}, mode="hybrid"
+    )
+
+    assert CATALOG[1] not in [r["context"] for r in results]
+    assert {r["metadata"]["section"] for r in results} == {"faq"}
+
+
+def test_hybrid_search_indexes_chunks_saved_before_the_keyword_index():
+    name = uuid.uuid4().hex
+    _chroma_storage(name).save(CATALOG)
+    storage = _chroma_storage(name)
+    storage._ensure_initialized()
+    storage.keyword_index.clear(storage._collection_key())
+
+    results = storage.search(["AX-9921"], limit=1, mode="hybrid")
+
+    assert results[0]["context"] == CATALOG[1]
+    assert storage.keyword_index.count(storage._collection_key()) == len(CATALOG)
+
+
+def test_search_rejects_unknown_modes():
+    with pytest.raises(ValueError, match="Unknown search mode"):
+        _storage(FlakyEmbedder()).search(["query"], mode="keyword")
+
+
+def test_knowledge_query_passes_the_mode_to_the_storage():
+    storage = MagicMock(spec=KnowledgeStorage)
+    knowledge = Knowledge(collection_name="test", sources=[], storage=storage)
+
+    knowledge.query(["AX-9921"], mode="hybrid")
+
+    storage.search.assert_called_once_with(["AX-9921"], 3, mode="hybrid")
+
+
+def test_search_uses_precomputed_query_embeddings():
+    storage = _chroma_storage()
+    storage.save(CATALOG)
+
+    results = storage.search(
+        ["a query as long as a sentence"],
+        limit=1,
+        score_threshold=0,
+        query_embeddings=[[7.0]],
+    )
+
+    assert results[0]["context"] == "ax_tool"
+
+
+def test_knowledge_query_filters_on_chunk_metadata():
+    storage = _chroma_storage()
+    storage.save(
+        CATALOG,
+        [
+            {"source_type": "faq", "page": 1},
+            {"source_type": "parts", "page": 2},
+            {"source_type": "parts", "page": 3},
+            {"source_type": "faq", "page": 4},
+        ],
+    )
+    knowledge = Knowledge(collection_name="test", sources=[], storage=storage)
+
+    parts = knowledge.query(["pump"], limit=4, where={"source_type": "parts"})
+    late_faq = knowledge.query(
+        ["pump"],
+        limit=4,
+        where={"$and": [{"source_type": "faq"}, {"page": {"$gt": 1}}]},
+    )
+
+    assert {r["context"] for r in parts} == {CATALOG[1], CATALOG[2]}
+    assert [r["context"] for r in late_faq] == [CATALOG[3]]
@@ -1,18 +1,24 @@
 """Test Knowledge creation and querying functionality."""
 
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import List, Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from crewai.knowledge.chunker.base_chunker import CharacterChunker
 from crewai.knowledge.source.crew_docling_source import CrewDoclingSource
 from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
 from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
+from crewai.knowledge.source.file_loader import load_files
 from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
 from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.knowledge_events import KnowledgeFileLoadedEvent
 
 
 @pytest.fixture(autouse=True)
@@ -601,3 +607,182 @@ def test_file_path_validation():
         match="file_path/file_paths must be a Path, str, or a list of these types",
     ):
         PDFKnowledgeSource()
+
+
+def test_streamed_chunks_match_whole_text_chunks(tmpdir):
+    file_path = Path(tmpdir.join("facts.txt"))
+    file_path.write_text("x")
+    source = TextFileKnowledgeSource(
+        file_paths=[file_path], chunker=CharacterChunker(10, 3)
+    )
+    text = "".join(f"Fact number {i}. " for i in range(20))
+    segments = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+    assert list(source._chunk_segments(segments)) == source._chunk_text(text)
+
+
+def test_text_files_are_streamed_into_storage(tmpdir):
+    file_paths = []
+    for i in range(3):
+        file_path = Path(tmpdir.join(f"file_{i}.txt"))
+        file_path.write_text(f"Brandon fact {i}. " * 100)
+        file_paths.append(file_path)
+    source = TextFileKnowledgeSource(
+        file_paths=file_paths, chunk_size=500, chunk_overlap=50
+    )
+    source.storage = MagicMock()
+    events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(KnowledgeFileLoadedEvent)
+        def on_loaded(_, event):
+            events.append(event)
+
+        with patch(
+            "crewai.knowledge.source.base_file_knowledge_source.KNOWLEDGE_SAVE_BATCH_SIZE",
+            5,
+        ):
+            source.add()
+
+    assert source.content == {} and source.chunks == []
+    saved = [
+        chunk for call in source.storage.save.call_args_list for chunk in call.args[0]
+    ]
+    expected = [
+        chunk for path in file_paths for chunk in source._chunk_text(path.read_text())
+    ]
+    assert saved == expected
+    assert all(len(call.args[0]) <= 5 for call in source.storage.save.call_args_list)
+    assert [(event.files_loaded, event.total_files) for event in events] == [
+        (1, 3),
+        (2, 3),
+        (3, 3),
+    ]
+
+
+def test_files_are_parsed_in_a_process_pool_in_order(tmpdir):
+    file_paths = []
+    for i in range(3):
+        file_path = Path(tmpdir.join(f"file_{i}.txt"))
+        file_path.write_text(f"content {i}")
+        file_paths.append(file_path)
+
+    loaded = load_files(
+        file_paths, TextFileKnowledgeSource.read_segments, workers=2, max_pending=1
+    )
+
+    assert [(path, list(segments)) for path, segments in loaded] == [
+        (path, [f"content {i}"]) for i, path in enumerate(file_paths)
+    ]
+
+
+def test_files_are_read_serially_when_the_process_pool_breaks(tmpdir):
+    file_paths = []
+    for i in range(3):
+        file_path = Path(tmpdir.join(f"file_{i}.txt"))
+        file_path.write_text(f"content {i}")
+        file_paths.append(file_path)
+    broken = Future()
+    broken.set_exception(BrokenProcessPool())
+
+    with patch("crewai.knowledge.source.file_loader.ProcessPoolExecutor") as mock_pool:
+        mock_pool.return_value.__enter__.return_value.submit.return_value = broken
+        loaded = load_files(
+            file_paths, TextFileKnowledgeSource.read_segments, workers=2
+        )
+
+        assert [(path, list(segments)) for path, segments in loaded] == [
+            (path, [f"content {i}"]) for i, path in enumerate(file_paths)
+        ]
+
+
+def test_pdf_pages_are_streamed():
+    pdf_path = Path(__file__).parent / "crewai_quickstart.pdf"
+    source = PDFKnowledgeSource(file_paths=[pdf_path])
+
+    pages = list(PDFKnowledgeSource.read_segments(pdf_path))
+
+    assert source.loader_workers == 1
+    assert source.content == {}
+    assert len(pages) > 1
+    assert source.load_content() == {pdf_path: "".join(pages)}
+
+
+def _saved(storage):
+    """The chunks saved to a mocked storage, each with its metadata."""
+    saved = []
+    for call in storage.save.call_args_list:
+        chunks, metadata = call.args
+        if isinstance(metadata, dict):
+            metadata = [metadata] * len(chunks)
+        saved.extend(zip(chunks, metadata))
+    return saved
+
+
+def test_chunks_are_saved_with_source_metadata():
+    source = StringKnowledgeSource(
+        content="Brandon's favorite color is red.", metadata={"team": "sales"}
+    )
+    source.storage = MagicMock()
+
+    source.add()
+
+    [(chunk, metadata)] = _saved(source.storage)
+    assert chunk == "Brandon's favorite color is red."
+    assert metadata["source_type"] == "StringKnowledgeSource"
+    assert metadata["team"] == "sales"
+    assert metadata["saved_at"] > 0
+
+
+def test_csv_chunks_record_the_row_they_start_in(tmpdir):
+    csv_path = Path(tmpdir.join("people.csv"))
+    csv_path.write_text(
+        "".join(f"person {i},{20 + i},city {i}\n" for i in range(1, 41))
+    )
+    source = CSVKnowledgeSource(
+        file_paths=[csv_path], chunker=CharacterChunker(100, 20)
+    )
+    source.storage = MagicMock()
+
+    source.add()
+
+    rows = list(CSVKnowledgeSource.read_segments(csv_path))
+    saved = _saved(source.storage)
+    assert len(saved) > 5
+    for chunk, metadata in saved:
+        assert metadata["source_path"] == str(csv_path)
+        start = sum(len(row) for row in rows[: metadata["row"] - 1])
+        end = start + len(rows[metadata["row"] - 1])
+        assert start <= "".join(rows).index(chunk) < end
+
+
+def test_pdf_chunks_record_their_page():
+    pdf_path = Path(__file__).parent / "crewai_quickstart.pdf"
+    source = PDFKnowledgeSource(
+        file_paths=[pdf_path], loader_workers=1, chunk_size=300, chunk_overlap=30
+    )
+    source.storage = MagicMock()
+
+    source.add()
+
+    pages = [metadata["page"] for _, metadata in _saved(source.storage)]
+    page_count = len(list(PDFKnowledgeSource.read_segments(pdf_path)))
+    assert pages == sorted(pages)
+    assert pages[0] == 1 and pages[-1] == page_count
+
+
+def test_json_chunks_are_saved_per_file(tmpdir):
+    paths = []
+    for name in ("a", "b"):
+        path = Path(tmpdir.join(f"{name}.json"))
+        path.write_text(f'{{"name": "{name}"}}')
+        paths.append(path)
+    source = JSONKnowledgeSource(file_paths=paths)
+    source.storage = MagicMock()
+
+    source.add()
+
+    assert [
+        (chunk, metadata["source_path"]) for chunk, metadata in _saved(source.storage)
+    ] == [("name: a", str(paths[0])), ("name: b", str(paths[1]))]
@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock, patch
+
+from crewai import Agent, Crew, Task
+from crewai.agents.crew_agent_executor import CrewAgentExecutor
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.retrieval import KnowledgeRetriever
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+
+def _knowledge(contexts, embedder=None):
+    storage = MagicMock(spec=KnowledgeStorage)
+    storage.embedder = embedder or MagicMock(return_value=[[0.5]])
+    storage.search.return_value = [{"context": c} for c in contexts]
+    return Knowledge(collection_name="test", sources=[], storage=storage)
+
+
+def test_retrieve_embeds_once_and_merges_without_duplicates():
+    embedder = MagicMock(return_value=[[0.5]], namespace="shared")
+    first = _knowledge(["a", "b"], embedder)
+    second = _knowledge(["b", "c"], MagicMock(namespace="shared"))
+
+    results = KnowledgeRetriever().retrieve("query", [first, None, second, first])
+
+    assert [r["context"] for r in results] == ["a", "b", "c"]
+    embedder.assert_called_once_with(["query"])
+    second.storage.embedder.assert_not_called()
+    for knowledge in (first, second):
+        knowledge.storage.search.assert_called_once_with(
+            ["query"], 3, query_embeddings=[[0.5]]
+        )
+
+
+def test_retrieve_embeds_once_per_embedder():
+    first, second = _knowledge(["a"]), _knowledge(["b"])
+
+    KnowledgeRetriever().retrieve("query", [first, second])
+
+    first.storage.embedder.assert_called_once_with(["query"])
+    second.storage.embedder.assert_called_once_with(["query"])
+
+
+def test_retrieve_memoizes_until_cleared():
+    knowledge = _knowledge(["a"])
+    retriever = KnowledgeRetriever()
+
+    retriever.retrieve("query", [knowledge])
+    retriever.retrieve("query", [knowledge])
+    assert knowledge.storage.search.call_count == 1
+
+    retriever.retrieve("other query", [knowledge])
+    retriever.clear()
+    retriever.retrieve("query", [knowledge])
+    assert knowledge.storage.search.call_count == 3
+
+
+def test_custom_storages_are_searched_by_text():
+    class CustomStorage(BaseKnowledgeStorage):
+        def search(self, query, limit=3, filter=None, score_threshold=0.35):
+            return [{"context": f"{query[0]} found"}]
+
+        def save(self, documents, metadata):
+            pass
+
+        def reset(self):
+            pass
+
+    knowledge = Knowledge(collection_name="test", sources=[], storage=CustomStorage())
+
+    assert KnowledgeRetriever().retrieve("query", [knowledge]) == [
+        {"context": "query found"}
+    ]
+
+
+def test_retried_task_reuses_agent_and_crew_knowledge():
+    agent_knowledge, crew_knowledge = _knowledge(["agent fact"]), _knowledge(["fact"])
+    agent = Agent(
+        role="Researcher",
+        goal="Answer questions",
+        backstory="Knows things",
+        llm="gpt-4o-mini",
+        knowledge=agent_knowledge,
+    )
+    task = Task(description="Find facts", expected_output="Facts", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], knowledge=crew_knowledge)
+    agent.crew = crew
+
+    with patch.object(
+        CrewAgentExecutor,
+        "invoke",
+        side_effect=[ValueError("try again"), {"output": "done"}],
+    ) as invoke:
+        assert agent.execute_task(task) == "done"
+
+    prompt = invoke.call_args.args[0]["input"]
+    assert "Additional Information: agent fact\nfact" in prompt
+    agent_knowledge.storage.search.assert_called_once()
+    crew_knowledge.storage.search.assert_called_once()
@@ -0,0 +1,86 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+from crewai.memory.storage.rag_storage import RAGStorage
+
+
+def _memory(results, storage=None):
+    memory = MagicMock()
+    memory.search.return_value = results
+    memory.storage = storage
+    return memory
+
+
+def _task(description="Research AI"):
+    task = MagicMock()
+    task.description = description
+    return task
+
+
+def _contextual_memory(memory_config=None, stm=None, ltm=None, em=None, exm=None):
+    return ContextualMemory(memory_config, stm, ltm, em, None, exm)
+
+
+def test_memories_are_searched_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(*args, **kwargs):
+        barrier.wait()
+        return [{"context": "found"}]
+
+    stm = _memory([])
+    stm.search.side_effect = search
+    em = _memory([])
+    em.search.side_effect = search
+
+    context = _contextual_memory(stm=stm, em=em).build_context_for_task(_task(), "")
+
+    assert context == "Recent Insights:\n- found\nEntities:\n- found"
+
+
+def test_rag_memories_share_one_query_embedding():
+    with patch.object(RAGStorage, "_initialize_app"):
+        stm_storage = RAGStorage(type="short_term")
+        em_storage = RAGStorage(type="entities")
+    stm_storage.collection = em_storage.collection = MagicMock()
+    stm_storage.embedder_config = MagicMock(return_value=[[1.0, 0.0]])
+    em_storage.embedder_config = MagicMock(return_value=[[1.0, 0.0]])
+    stm = _memory([{"context": "insight"}], stm_storage)
+    em = _memory([{"context": "entity"}], em_storage)
+
+    _contextual_memory(stm=stm, em=em).build_context_for_task(_task(), "")
+
+    assert (
+        stm_storage.embedder_config.call_count + em_storage.embedder_config.call_count
+        == 1
+    )
+    assert stm.search.call_args.kwargs["query_embedding"] == [1.0, 0.0]
+    assert em.search.call_args.kwargs["query_embedding"] == [1.0, 0.0]
+
+
+def test_context_is_trimmed_to_the_token_budget():
+    long_text = "x" * 400  # about 100 tokens
+    stm = _memory([{"context": f"stm {i} {long_text}"} for i in range(3)])
+    em = _memory([{"context": f"em {i} {long_text}"} for i in range(3)])
+    ltm = MagicMock()
+    ltm.search.return_value = [{"metadata": {"suggestions": ["be concise"]}}]
+
+    context = _contextual_memory(
+        {"context_token_budget": 250}, stm=stm, ltm=ltm, em=em
+    ).build_context_for_task(_task(), "")
+
+    # The best result of every memory is kept before any second best
+    assert "be concise" in context
+    assert "stm 0" in context and "em 0" in context
+    assert "stm 1" not in context and "em 1" not in context
+
+
+def test_no_token_budget_keeps_every_result():
+    stm = _memory([{"context": "x" * 4000} for _ in range(3)])
+
+    context = _contextual_memory(
+        {"context_token_budget": None}, stm=stm
+    ).build_context_for_task(_task(), "")
+
+    assert context.count("- ") == 3
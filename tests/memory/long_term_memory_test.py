@@ -1,7 +1,14 @@
+import time
+from types import SimpleNamespace
+
 import pytest
 
+from crewai import Agent, Crew, Task
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.retention import RetentionPolicy, retention_policy
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.utilities.constants import LONG_TERM_MEMORY_MAX_ITEMS
 
 
 @pytest.fixture
@@ -27,3 +34,135 @@ def test_save_and_search(long_term_memory):
     assert find["metadata"]["quality"] == 0.5
     assert find["metadata"]["task"] == "test_task"
     assert find["metadata"]["expected_output"] == "test_output"
+
+
+def _save(memory, task, datetime="1700000000.0", quality=5, suggestions=None):
+    memory.save(
+        LongTermMemoryItem(
+            agent="test_agent",
+            task=task,
+            expected_output="test_output",
+            datetime=datetime,
+            quality=quality,
+            metadata={"quality": quality, "suggestions": suggestions or []},
+        )
+    )
+
+
+def test_search_finds_similar_tasks(long_term_memory):
+    _save(long_term_memory, "Research the latest news about solar panels")
+    _save(long_term_memory, "Write a poem on the ocean")
+
+    results = long_term_memory.search("Research the latest news about wind turbines")
+
+    assert len(results) == 1
+    assert "relevance" in results[0]
+
+
+def test_search_ranks_by_relevance_then_recency(long_term_memory):
+    _save(long_term_memory, "Summarize quarterly revenue report", "1600000000.0", 1)
+    _save(long_term_memory, "Summarize quarterly revenue report", "1700000000.0", 2)
+    _save(long_term_memory, "Summarize meeting notes", "1710000000.0", 3)
+
+    results = long_term_memory.search("Summarize the quarterly revenue report", 3)
+
+    assert [result["score"] for result in results] == [2, 1, 3]
+
+
+def test_search_with_only_common_terms_returns_the_latest(
+    long_term_memory, monkeypatch
+):
+    monkeypatch.setattr(
+        "crewai.memory.storage.ltm_sqlite_storage.LTM_COMMON_TERM_ROWS", 2
+    )
+    for index in range(3):
+        _save(long_term_memory, f"Research topic {index}", f"170000000{index}.0", index)
+
+    results = long_term_memory.search("Research topic", 2)
+
+    assert [result["score"] for result in results] == [2, 1]
+
+
+def test_search_without_matches_returns_none(long_term_memory):
+    _save(long_term_memory, "Write a poem about the ocean")
+
+    assert long_term_memory.search("Compile quarterly figures") is None
+
+
+def test_search_ranks_by_embedding_when_configured(tmp_path, monkeypatch):
+    vectors = {"plan a trip to paris": [1.0, 0.0], "plan a trip to rome": [0.0, 1.0]}
+    monkeypatch.setattr(
+        "crewai.memory.long_term.long_term_memory.EmbeddingConfigurator.configure_embedder",
+        lambda self, config: (
+            lambda texts: [vectors.get(text.casefold(), [0.9, 0.1]) for text in texts]
+        ),
+    )
+    memory = LongTermMemory(
+        path=str(tmp_path / "ltm.db"), embedder_config={"provider": "test"}
+    )
+    _save(memory, "Plan a trip to Rome", quality=1)
+    _save(memory, "Plan a trip to Paris", quality=2)
+
+    results = memory.search("Plan a trip to France", 2)
+
+    assert [result["score"] for result in results] == [2, 1]
+
+
+def test_saving_the_same_memory_replaces_it(tmp_path):
+    storage = LTMSQLiteStorage(str(tmp_path / "ltm.db"))
+    storage.save("task", {"quality": 5}, "1700000000.0", 5)
+    storage.save("task", {"quality": 5}, "1700000100.0", 5)
+
+    assert storage.load("task", 5) == [
+        {"metadata": {"quality": 5}, "datetime": "1700000100.0", "score": 5}
+    ]
+
+
+def test_prune_keeps_the_newest_entries(tmp_path):
+    storage = LTMSQLiteStorage(
+        str(tmp_path / "ltm.db"), retention=RetentionPolicy(max_items=2, ttl=60)
+    )
+    storage.save("old", {"n": 0}, "1000.0", 1)
+    for index in range(3):
+        storage.save("task", {"n": index}, str(time.time()), index)
+
+    assert storage.prune() == (1, 1)
+    assert [row["score"] for row in storage.load("task", 5)] == [2, 1]
+
+
+def test_compact_removes_legacy_duplicates(tmp_path):
+    storage = LTMSQLiteStorage(
+        str(tmp_path / "ltm.db"), retention=RetentionPolicy(dedup=False)
+    )
+    for _ in range(3):
+        storage.save("task", {"quality": 5}, "1700000000.0", 5)
+    storage.save("other task", {"quality": 5}, "1700000000.0", 5)
+
+    stats = storage.compact()
+
+    assert (stats.duplicates, stats.remaining) == (2, 2)
+    assert len(storage.load("task", 5)) == 1
+
+
+def test_crew_memory_config_overrides_retention():
+    crew = SimpleNamespace(memory_config={"retention": {"long_term": {"ttl": 60}}})
+
+    memory = LongTermMemory(crew=crew)
+
+    assert memory.storage.retention.ttl == 60
+    assert memory.storage.retention.max_items == LONG_TERM_MEMORY_MAX_ITEMS
+    with pytest.raises(ValueError):
+        retention_policy(
+            SimpleNamespace(memory_config={"retention": {"long_term": {"size": 1}}}),
+            "long_term",
+        )
+
+
+def test_crew_long_term_memory_uses_the_crew_embedder():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Facts", agent=agent)
+    embedder = {"provider": "openai", "config": {"model": "text-embedding-3-small"}}
+
+    crew = Crew(agents=[agent], tasks=[task], memory=True, embedder=embedder)
+
+    assert crew._long_term_memory.embedder_config == embedder
@@ -0,0 +1,164 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai import Agent, Crew, Task
+from crewai.memory.memory_pipeline import MemoryPipeline
+from crewai.utilities.converter import ConverterError
+
+
+def test_flush_waits_for_submitted_jobs():
+    pipeline = MemoryPipeline()
+    results = []
+
+    for value in range(5):
+        pipeline.submit(lambda value=value: (time.sleep(0.01), results.append(value)))
+
+    assert pipeline.flush(timeout=5)
+    assert sorted(results) == list(range(5))
+    assert pipeline.pending == 0
+    assert pipeline.stats.completed == 5
+    pipeline.shutdown()
+
+
+def test_failures_are_counted_and_do_not_stop_the_workers():
+    pipeline = MemoryPipeline(workers=1)
+
+    def fail():
+        raise ValueError("storage unavailable")
+
+    pipeline.submit(fail, name="failing write")
+    pipeline.submit(lambda: None)
+
+    assert pipeline.flush(timeout=5)
+    stats = pipeline.stats
+    assert (stats.submitted, stats.completed, stats.failed) == (2, 1, 1)
+    assert isinstance(pipeline.last_error, ValueError)
+    pipeline.shutdown()
+
+
+def test_submit_blocks_when_the_queue_is_full():
+    pipeline = MemoryPipeline(max_pending=1, workers=1)
+    release = threading.Event()
+
+    pipeline.submit(release.wait)  # occupies the worker
+    time.sleep(0.05)
+    pipeline.submit(lambda: None)  # fills the queue
+
+    submitter = threading.Thread(target=pipeline.submit, args=(lambda: None,))
+    submitter.start()
+    submitter.join(timeout=0.2)
+    assert submitter.is_alive()
+
+    release.set()
+    submitter.join(timeout=5)
+    assert pipeline.flush(timeout=5)
+    assert pipeline.stats.backpressure_waits == 1
+    assert pipeline.stats.max_pending == 3
+    pipeline.shutdown()
+
+
+def test_flush_times_out_while_jobs_are_running():
+    pipeline = MemoryPipeline()
+    release = threading.Event()
+    pipeline.submit(release.wait)
+
+    assert pipeline.flush(timeout=0.05) is False
+
+    release.set()
+    assert pipeline.flush(timeout=5)
+    pipeline.shutdown()
+
+
+@pytest.fixture
+def crew_with_memory():
+    def _crew(memory_write_mode):
+        agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+        task = Task(description="Research", expected_output="Facts", agent=agent)
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            memory_write_mode=memory_write_mode,
+        )
+        crew._long_term_memory = MagicMock()
+        crew._entity_memory = MagicMock()
+        agent.crew = crew
+        agent.create_agent_executor(task=task)
+        return crew, agent.agent_executor
+
+    return _crew
+
+
+@pytest.mark.parametrize("memory_write_mode", ["sync", "background"])
+def test_long_term_memory_evaluation_modes(crew_with_memory, memory_write_mode):
+    crew, executor = crew_with_memory(memory_write_mode)
+    evaluated = threading.Event()
+
+    def evaluate(task, output):
+        evaluated.set()
+        return ConverterError("no evaluation")
+
+    with patch(
+        "crewai.agents.agent_builder.base_agent_executor_mixin.TaskEvaluator"
+    ) as evaluator:
+        evaluator.return_value.evaluate.side_effect = evaluate
+        executor._create_long_term_memory(MagicMock(text="answer"))
+        assert crew.flush_memory(timeout=5)
+
+    assert evaluated.is_set()
+    if memory_write_mode == "sync":
+        assert crew.memory_pipeline is None
+    else:
+        assert crew.memory_pipeline.stats.completed == 1
+
+
+def _memory_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("crewai-memory")]
+
+
+@pytest.mark.parametrize("memory_write_mode", ["background", "async"])
+def test_kickoffs_do_not_leave_memory_workers_behind(memory_write_mode):
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Facts", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], memory_write_mode=memory_write_mode)
+    written = []
+
+    def execute_task(self, task, context=None, tools=None):
+        self.crew.memory_pipeline.submit(lambda: written.append(task.description))
+        return "Facts"
+
+    threads_before = len(_memory_threads())
+    with patch.object(Agent, "execute_task", execute_task):
+        for _ in range(3):
+            crew.kickoff()
+        crew.kickoff_for_each([{}, {}, {}])
+
+    deadline = time.monotonic() + 5
+    while len(_memory_threads()) > threads_before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(_memory_threads()) == threads_before
+    assert len(written) == 6
+
+
+def test_failed_kickoffs_drain_the_memory_pipeline():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Facts", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], memory_write_mode="async")
+    written = []
+
+    def execute_task(self, task, context=None, tools=None):
+        self.crew.memory_pipeline.submit(
+            lambda: (time.sleep(0.1), written.append(task.description))
+        )
+        raise RuntimeError("task failed")
+
+    threads_before = len(_memory_threads())
+    with patch.object(Agent, "execute_task", execute_task):
+        with pytest.raises(RuntimeError, match="task failed"):
+            crew.kickoff()
+
+    assert written == ["Research"]
+    assert crew.memory_pipeline.pending == 0
+    assert len(_memory_threads()) == threads_before
@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from crewai.memory.short_term.short_term_memory import ShortTermMemory
+from crewai.memory.storage.numpy_storage import NumpyCollection, NumpyStorage
+from crewai.memory.storage.rag_storage import RAGStorage, create_rag_storage
+
+
+def _embed(texts):
+    return [[float(len(text)), 1.0] for text in texts]
+
+
+def _storage(**kwargs):
+    storage = NumpyStorage(type="short_term", **kwargs)
+    with patch.object(NumpyStorage, "_set_embedder_config"):
+        storage._ensure_initialized()
+    storage.embedder_config = storage.collection.embedding_function = _embed
+    return storage
+
+
+@pytest.fixture
+def collection():
+    collection = NumpyCollection(_embed, initial_capacity=2)
+    collection.upsert(
+        ids=["a", "b", "c"],
+        documents=["x", "xxxx", "xxxxxxxx"],
+        metadatas=[{"n": 1}, {"n": 2}, {"n": 3}],
+    )
+    return collection
+
+
+def test_query_returns_the_nearest_entries(collection):
+    response = collection.query(query_texts="xxx", n_results=2)
+
+    assert response["ids"] == [["b", "a"]]
+    assert response["documents"] == [["xxxx", "x"]]
+    assert response["distances"][0] == pytest.approx([1.0, 4.0])
+
+
+def test_query_filters_on_metadata(collection):
+    response = collection.query(
+        query_embeddings=[[4.0, 1.0]], n_results=2, where={"n": {"$gte": 2}}
+    )
+
+    assert response["ids"] == [["b", "c"]]
+
+
+def test_cosine_distance():
+    collection = NumpyCollection(space="cosine")
+    collection.upsert(
+        ids=["same", "orthogonal"],
+        documents=["", ""],
+        embeddings=[[2.0, 0.0], [0.0, 3.0]],
+    )
+
+    response = collection.query(query_embeddings=[[1.0, 0.0]], n_results=2)
+
+    assert response["distances"][0] == pytest.approx([0.0, 1.0])
+
+
+def test_upsert_replaces_and_delete_keeps_rows_dense(collection):
+    collection.upsert(ids=["a"], documents=["xxxxxxxxxxxx"], metadatas=[{"n": 4}])
+    collection.delete(ids=["b", "missing"])
+
+    stored = collection.get(include=["documents", "metadatas", "embeddings"])
+    assert collection.count() == 2
+    assert sorted(zip(stored["ids"], stored["documents"])) == [
+        ("a", "xxxxxxxxxxxx"),
+        ("c", "xxxxxxxx"),
+    ]
+    assert collection.query(query_texts="xxxxxxxx", n_results=1)["ids"] == [["c"]]
+    assert collection.get(where={"n": {"$lt": 4}})["ids"] == ["c"]
+
+
+def test_collection_round_trips_through_disk(collection, tmp_path):
+    collection.save(str(tmp_path))
+
+    loaded = NumpyCollection(_embed)
+    loaded.load(str(tmp_path))
+
+    assert loaded.get() == collection.get()
+    np.testing.assert_array_equal(
+        loaded.get(include=["embeddings"])["embeddings"],
+        collection.get(include=["embeddings"])["embeddings"],
+    )
+
+
+def test_storage_saves_and_searches_in_process(tmp_path):
+    storage = _storage(path=str(tmp_path / "stm"))
+    storage.save("first insight", {"agent": "a"})
+    storage.save("second", {"agent": "b"})
+
+    results = storage.search("seconds", limit=1, score_threshold=0)
+
+    assert [result["context"] for result in results] == ["second"]
+    storage.flush()
+    assert storage.collection.count() == 2
+    assert not (tmp_path / "stm").exists()
+
+
+def test_persistent_storage_reloads(tmp_path):
+    storage = _storage(path=str(tmp_path), persist=True)
+    storage.save("remembered", {})
+    storage.flush()
+
+    reloaded = _storage(path=str(tmp_path), persist=True)
+    assert reloaded.collection.get()["documents"] == ["remembered"]
+    storage.reset()
+    assert _storage(path=str(tmp_path), persist=True).collection.count() == 0
+
+
+def test_vector_store_is_selected_per_memory_type():
+    crew = SimpleNamespace(
+        agents=[],
+        memory_config={"vector_store": {"short_term": "numpy"}},
+    )
+
+    assert isinstance(ShortTermMemory(crew=crew).storage, NumpyStorage)
+    assert type(create_rag_storage("entities", crew=crew)) is RAGStorage
+    with pytest.raises(ValueError):
+        create_rag_storage(
+            "short_term",
+            crew=SimpleNamespace(
+                agents=[], memory_config={"vector_store": {"short_term": "faiss"}}
+            ),
+        )
@@ -0,0 +1,228 @@
+import threading
+from copy import deepcopy
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from crewai.memory.retention import SAVED_AT_KEY, RetentionPolicy, content_id
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.storage.write_buffer import WriteBehindBuffer
+
+
+def test_write_buffer_flushes_full_batches():
+    batches = []
+    buffer = WriteBehindBuffer(batches.append, batch_size=2, flush_interval=None)
+
+    buffer.add("a", {})
+    assert batches == []
+    buffer.add("b", {})
+
+    assert [[entry.document for entry in batch] for batch in batches] == [["a", "b"]]
+    assert buffer.pending() == []
+
+
+def test_write_buffer_flushes_after_the_interval():
+    flushed = threading.Event()
+    buffer = WriteBehindBuffer(
+        lambda batch: flushed.set(), batch_size=10, flush_interval=0.05
+    )
+
+    buffer.add("a", {})
+
+    assert flushed.wait(timeout=5)
+    assert buffer.pending() == []
+
+
+def test_write_buffer_drops_failed_batches():
+    def write(batch):
+        raise RuntimeError("collection unavailable")
+
+    buffer = WriteBehindBuffer(write, batch_size=10, flush_interval=None)
+    buffer.add("a", {})
+    buffer.add("b", {})
+    buffer.flush()
+
+    assert buffer.failed_writes == 2
+    assert buffer.pending() == []
+
+
+def test_write_buffers_only_hook_into_exit_while_entries_are_pending():
+    hooks = set()
+    with patch("crewai.memory.storage.write_buffer.atexit") as mock_atexit:
+        mock_atexit.register.side_effect = hooks.add
+        mock_atexit.unregister.side_effect = hooks.discard
+        for _ in range(100):
+            buffer = WriteBehindBuffer(lambda batch: None, flush_interval=None)
+            assert not hooks
+            buffer.add("a", {})
+            buffer.add("b", {})
+            assert len(hooks) == 1
+            buffer.flush()
+            assert not hooks
+            buffer.add("c", {})
+            buffer.clear()
+            assert not hooks
+
+    assert mock_atexit.register.call_count == 200
+
+
+def _embed(texts):
+    return [[float(len(text)), 0.0] for text in texts]
+
+
+@pytest.fixture
+def storage():
+    with patch.object(RAGStorage, "_initialize_app"):
+        storage = RAGStorage(type="short_term", write_batch_size=3)
+    storage.app = MagicMock()
+    storage.collection = MagicMock(metadata=None)
+    storage.collection.query.return_value = {
+        "ids": [["stored"]],
+        "metadatas": [[{"agent": "writer"}]],
+        "documents": [["xxxxxxxxxx"]],
+        "distances": [[4.0]],
+    }
+    storage.collection.count.return_value = 0
+    storage.embedder_config = MagicMock(side_effect=_embed)
+    return storage
+
+
+def test_saves_are_written_in_one_batch(storage):
+    for text in ["one", "two", "three"]:
+        storage.save(text, {"agent": "writer"})
+
+    storage.collection.upsert.assert_called_once()
+    kwargs = storage.collection.upsert.call_args.kwargs
+    assert kwargs["documents"] == ["one", "two", "three"]
+    assert kwargs["embeddings"] == [[3.0, 0.0], [3.0, 0.0], [5.0, 0.0]]
+    storage.embedder_config.assert_called_once_with(["one", "two", "three"])
+
+
+def test_search_sees_pending_writes(storage):
+    storage.save("abcd", {"agent": "writer"})
+
+    results = storage.search("abcdefg", limit=2, score_threshold=0)
+
+    storage.collection.upsert.assert_not_called()
+    assert [result["context"] for result in results] == ["xxxxxxxxxx", "abcd"]
+    assert results[1]["score"] == 9.0
+    assert storage.collection.query.call_args.kwargs["query_embeddings"] == [
+        [7.0, 0.0]
+    ]
+
+    # Embeddings computed for the search are reused when writing
+    storage.embedder_config.reset_mock()
+    storage.flush()
+    storage.embedder_config.assert_not_called()
+    assert storage.collection.upsert.call_args.kwargs["documents"] == ["abcd"]
+
+
+def test_reset_drops_pending_writes(storage):
+    collection = storage.collection
+    storage.save("abcd", {})
+    with patch("crewai.memory.storage.rag_storage.shutil.rmtree"):
+        storage.reset()
+    storage.flush()
+
+    collection.upsert.assert_not_called()
+
+
+def test_identical_saves_are_stored_once(storage):
+    storage.save("same insight", {"agent": "a"})
+    storage.save("same insight", {"agent": "b"})
+    storage.flush()
+
+    kwargs = storage.collection.upsert.call_args.kwargs
+    assert kwargs["documents"] == ["same insight"]
+    assert kwargs["metadatas"][0]["agent"] == "b"
+    assert kwargs["ids"] == [content_id("same insight")]
+
+
+def test_dedup_can_be_disabled(storage):
+    storage.retention = RetentionPolicy(dedup=False)
+    storage.save("same insight", {})
+    storage.save("same insight", {})
+    storage.flush()
+
+    assert len(set(storage.collection.upsert.call_args.kwargs["ids"])) == 2
+
+
+def test_oldest_entries_are_evicted_past_max_items(storage):
+    storage.retention = RetentionPolicy(max_items=10)
+    storage.collection.count.return_value = 11
+    storage.collection.get.return_value = {
+        "ids": ["legacy", *(f"entry-{n}" for n in range(10))],
+        "metadatas": [{}, *({SAVED_AT_KEY: float(n)} for n in range(10))],
+    }
+    storage.save("entry", {})
+    storage.flush()
+
+    storage.collection.delete.assert_called_once_with(ids=["legacy", "entry-0"])
+
+
+def test_entries_are_not_scanned_within_max_items(storage):
+    storage.retention = RetentionPolicy(max_items=10)
+    storage.collection.count.return_value = 10
+    storage.save("entry", {})
+    storage.flush()
+
+    storage.collection.get.assert_not_called()
+    storage.collection.delete.assert_not_called()
+
+
+def test_expired_entries_are_dropped_and_hidden(storage):
+    storage.retention = RetentionPolicy(ttl=60)
+    storage.collection.get.return_value = {"ids": ["stale"]}
+    storage.collection.query.return_value["metadatas"] = [[{SAVED_AT_KEY: 1.0}]]
+    storage.save("entry", {})
+    storage.flush()
+
+    storage.collection.delete.assert_called_once_with(ids=["stale"])
+    assert storage.search("query", score_threshold=0) == []
+
+
+def test_compact_removes_duplicates_and_near_duplicates(storage):
+    storage.collection.get.return_value = {
+        "ids": ["a", "b", "c", "d"],
+        "documents": ["Ada(person): engineer", "Ada(person): engineer", "x", "y"],
+        "metadatas": [
+            {SAVED_AT_KEY: 1.0},
+            {SAVED_AT_KEY: 2.0},
+            {SAVED_AT_KEY: 3.0},
+            {SAVED_AT_KEY: 4.0},
+        ],
+        "embeddings": [[1.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.01, 1.0]],
+    }
+    storage.collection.count.return_value = 2
+    with patch.object(RAGStorage, "_vacuum") as vacuum:
+        stats = storage.compact(merge_distance=0.05)
+
+    storage.collection.delete.assert_called_once_with(ids=["a", "c"])
+    assert (stats.duplicates, stats.merged, stats.remaining) == (1, 1, 2)
+    vacuum.assert_called_once()
+
+
+def test_collection_is_opened_on_first_use():
+    with patch("crewai.memory.storage.rag_storage.get_chroma_client") as client:
+        storage = RAGStorage(type="short_term")
+        client.assert_not_called()
+
+        storage.search("query")
+
+    client.assert_called_once()
+    assert storage.collection is not None
+
+
+def test_storages_and_copies_share_one_client(tmp_path):
+    path = str(tmp_path / "short_term")
+    first = RAGStorage(type="short_term", path=path)
+    second = RAGStorage(type="short_term", path=path)
+    first.flush()
+    second.flush()
+    copy = deepcopy(first)
+
+    for storage in (first, second, copy):
+        storage._ensure_initialized()
+
+    assert first.app is second.app is copy.app
+    assert copy._write_buffer is not first._write_buffer
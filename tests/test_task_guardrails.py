@@ -1,9 +1,10 @@
 """Tests for task guardrails functionality."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from crewai.llm import LLM
 from crewai.task import Task
 from crewai.tasks.task_output import TaskOutput
 
@@ -127,3 +128,85 @@ def test_guardrail_error_in_context():
 
     assert "Task failed guardrail validation" in str(exc_info.value)
     assert "Expected JSON, got string" in str(exc_info.value)
+
+
+def _uppercase_guardrail(result: TaskOutput):
+    if result.raw.isupper():
+        return (True, result.raw)
+    return (False, "Output must be uppercase")
+
+
+def _repairing_agent(execute_results, repair_result):
+    agent = Mock()
+    agent.role = "test_agent"
+    agent.crew = None
+    agent.execute_task.side_effect = execute_results
+    agent.llm = Mock(spec=LLM)
+    if isinstance(repair_result, Exception):
+        agent.llm.call.side_effect = repair_result
+    else:
+        agent.llm.call.return_value = repair_result
+    return agent
+
+
+def test_guardrail_repair_fixes_output_without_re_execution():
+    """Test that a successful repair avoids re-running the agent."""
+    agent = _repairing_agent(["bad result"], "GOOD RESULT")
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_uppercase_guardrail,
+        guardrail_repair=True,
+    )
+
+    result = task.execute_sync(agent=agent)
+
+    assert result.raw == "GOOD RESULT"
+    assert agent.execute_task.call_count == 1
+    assert task.retry_count == 0
+    repair_prompt = agent.llm.call.call_args[0][0][-1]["content"]
+    assert "Output must be uppercase" in repair_prompt
+    assert "bad result" in repair_prompt
+
+
+@pytest.mark.parametrize(
+    "repair_result", ["still bad", RuntimeError("LLM unavailable")]
+)
+def test_guardrail_repair_escalates_to_re_execution(repair_result):
+    """Test that a failed repair falls back to re-executing the task."""
+    agent = _repairing_agent(["bad result", "GOOD RESULT"], repair_result)
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_uppercase_guardrail,
+        guardrail_repair=True,
+    )
+
+    result = task.execute_sync(agent=agent)
+
+    assert result.raw == "GOOD RESULT"
+    assert agent.execute_task.call_count == 2
+    assert task.retry_count == 1
+
+
+def test_guardrail_repair_that_cannot_be_converted_re_executes():
+    """Test that a repair failing output conversion falls back to re-executing."""
+    agent = _repairing_agent(["bad result", "GOOD RESULT"], "UNPARSEABLE")
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        guardrail=_uppercase_guardrail,
+        guardrail_repair=True,
+    )
+    export_output = Task._export_output
+
+    def fail_on_repair(self, result):
+        if result == "UNPARSEABLE":
+            raise ValueError("not valid JSON")
+        return export_output(self, result)
+
+    with patch.object(Task, "_export_output", fail_on_repair):
+        result = task.execute_sync(agent=agent)
+
+    assert result.raw == "GOOD RESULT"
+    assert agent.execute_task.call_count == 2
@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crewai.agents.parser import AgentAction
+from crewai.tools import tool
+from crewai.tools.structured_tool import CrewStructuredTool
+from crewai.tools.tool_execution_pool import (
+    ToolExecutionPool,
+    ToolTimeoutError,
+    run_with_timeout,
+)
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.i18n import I18N
+from crewai.utilities.tool_utils import (
+    aexecute_tool_and_check_finality,
+    execute_tool_and_check_finality,
+    run_with_async_tools,
+)
+
+
+@pytest.mark.asyncio
+async def test_blocking_tools_run_on_the_pool_threads():
+    def whoami() -> str:
+        """Return the current thread name."""
+        return threading.current_thread().name
+
+    pool = ToolExecutionPool(max_workers=2)
+    result = await pool.run(CrewStructuredTool.from_function(whoami), {})
+
+    assert result.startswith("crewai-tool")
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_coroutine_tools_are_awaited_on_the_loop():
+    async def whoami() -> str:
+        """Return the current thread name."""
+        return threading.current_thread().name
+
+    pool = ToolExecutionPool(max_workers=2)
+    result = await pool.run(CrewStructuredTool.from_function(whoami), {})
+
+    assert result == threading.current_thread().name
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_per_tool_concurrency_limit():
+    running = 0
+    peak = 0
+
+    def slow(n: int) -> int:
+        """Sleep for a bit."""
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        time.sleep(0.05)
+        running -= 1
+        return n
+
+    structured = CrewStructuredTool.from_function(slow)
+    structured.max_concurrency = 2
+    pool = ToolExecutionPool(max_workers=8)
+
+    results = await asyncio.gather(*(pool.run(structured, {"n": n}) for n in range(6)))
+
+    assert results == list(range(6))
+    assert peak == 2
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_aexecute_tool_and_check_finality_awaits_async_tools():
+    @tool("Fetch page")
+    async def fetch_page(url: str) -> str:
+        """Fetch a page."""
+        await asyncio.sleep(0)
+        return f"content of {url}"
+
+    action = AgentAction(
+        thought="I need the page",
+        tool="Fetch page",
+        tool_input='{"url": "https://crewai.com"}',
+        text='Action: Fetch page\nAction Input: {"url": "https://crewai.com"}',
+    )
+
+    with crewai_event_bus.scoped_handlers():
+        result = await aexecute_tool_and_check_finality(
+            agent_action=action,
+            tools=[fetch_page.to_structured_tool()],
+            i18n=I18N(),
+        )
+
+    assert result.result == "content of https://crewai.com"
+    assert result.result_as_answer is False
+
+
+@pytest.mark.asyncio
+async def test_async_kickoffs_run_tools_on_the_calling_loop():
+    loop = asyncio.get_running_loop()
+
+    @tool("Fetch page")
+    async def fetch_page(url: str) -> str:
+        """Fetch a page."""
+        assert asyncio.get_running_loop() is loop
+        return f"content of {url}"
+
+    action = AgentAction(
+        thought="I need the page",
+        tool="Fetch page",
+        tool_input='{"url": "https://crewai.com"}',
+        text='Action: Fetch page\nAction Input: {"url": "https://crewai.com"}',
+    )
+
+    def kickoff():
+        assert threading.current_thread() is not threading.main_thread()
+        return execute_tool_and_check_finality(
+            agent_action=action,
+            tools=[fetch_page.to_structured_tool()],
+            i18n=I18N(),
+        )
+
+    with crewai_event_bus.scoped_handlers():
+        result = await run_with_async_tools(kickoff)
+
+    assert result.result == "content of https://crewai.com"
+
+
+def test_run_with_timeout():
+    assert run_with_timeout(lambda: "done", 1, "quick") == "done"
+    assert run_with_timeout(lambda: "inline", None, "quick") == "inline"
+
+    with pytest.raises(ToolTimeoutError, match="'slow' timed out after 0.05"):
+        run_with_timeout(lambda: time.sleep(2), 0.05, "slow")
+
+    def fail():
+        raise TimeoutError("from the tool")
+
+    with pytest.raises(TimeoutError, match="from the tool") as excinfo:
+        run_with_timeout(fail, 1, "failing")
+    assert not isinstance(excinfo.value, ToolTimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_pool_cancels_coroutine_tools_on_timeout():
+    cancelled = asyncio.Event()
+
+    async def hang() -> str:
+        """Never finishes."""
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "too late"
+
+    pool = ToolExecutionPool(max_workers=1)
+    with pytest.raises(ToolTimeoutError):
+        await pool.run(CrewStructuredTool.from_function(hang), {}, timeout=0.05)
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hung_blocking_tools_do_not_take_pool_workers():
+    release = threading.Event()
+
+    def hang() -> str:
+        """Blocks until released."""
+        release.wait(5)
+        return "late"
+
+    def quick() -> str:
+        """Returns at once."""
+        return "quick"
+
+    hung = CrewStructuredTool.from_function(hang)
+    hung.max_concurrency = 2
+    pool = ToolExecutionPool(max_workers=1)
+
+    for _ in range(2):
+        with pytest.raises(ToolTimeoutError):
+            await pool.run(hung, {}, timeout=0.05)
+
+    # The pool worker is still free for other tools
+    assert await pool.run(CrewStructuredTool.from_function(quick), {}) == "quick"
+    # Both slots of the hung tool stay taken until its calls return
+    assert pool._semaphore(hung).locked()
+    release.set()
+    await asyncio.sleep(0.1)
+    assert not pool._semaphore(hung).locked()
+    assert await pool.run(hung, {}, timeout=1) == "late"
+    pool.shutdown()
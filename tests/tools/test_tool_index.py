@@ -0,0 +1,56 @@
+from crewai.tools import tool
+from crewai.tools.tool_index import ToolIndex
+
+
+@tool("Search the internet")
+def search_tool(query: str) -> str:
+    """Search the internet for a query."""
+    return query
+
+
+@tool("Read website content")
+def read_tool(url: str) -> str:
+    """Read the content of a website."""
+    return url
+
+
+@tool("Add")
+def add_tool(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def _index():
+    return ToolIndex(
+        [t.to_structured_tool() for t in (search_tool, read_tool, add_tool)]
+    )
+
+
+def test_exact_and_casefolded_lookup():
+    index = _index()
+
+    assert index.get("Search the internet").name == "Search the internet"
+    assert index.get("  search THE internet ").name == "Search the internet"
+    assert index.get("read_website_content").name == "Read website content"
+    assert index.get("Search the web") is None
+
+
+def test_fuzzy_lookup():
+    index = _index()
+
+    assert index.find("Search the internt").name == "Search the internet"
+    assert index.find("Read website contents").name == "Read website content"
+    assert index.find("add").name == "Add"
+    assert index.find("Delete all files") is None
+    assert index.find("") is None
+
+
+def test_by_name_keeps_first_tool_with_duplicated_name():
+    first = search_tool.to_structured_tool()
+    second = search_tool.to_structured_tool()
+    index = ToolIndex([first, second])
+
+    assert index.by_name["Search the internet"] is first
+    assert index.find("search the internet") is first
+    assert len(index) == 2
+    assert "Search the internet" in index
@@ -9,11 +9,14 @@ from pydantic import BaseModel, Field
 
 from crewai import Agent, Task
 from crewai.tools import BaseTool
+from crewai.tools.tool_calling import ToolCalling
 from crewai.tools.tool_usage import ToolUsage
 from crewai.utilities.events import crewai_event_bus
 from crewai.utilities.events.tool_usage_events import (
+    ToolInputRepairedEvent,
     ToolSelectionErrorEvent,
     ToolUsageFinishedEvent,
+    ToolUsageTimeoutEvent,
     ToolValidateInputErrorEvent,
 )
 
@@ -726,3 +729,105 @@ def test_tool_usage_finished_event_with_cached_result():
     assert isinstance(event.started_at, datetime.datetime)
     assert isinstance(event.finished_at, datetime.datetime)
     assert event.type == "tool_usage_finished"
+
+
+def test_validate_tool_input_truncated_input():
+    tool_usage = ToolUsage(
+        tools_handler=MagicMock(),
+        tools=[],
+        task=MagicMock(),
+        function_calling_llm=None,
+        agent=MagicMock(),
+        action=MagicMock(),
+    )
+
+    tool_input = "{'query': 'crewai', 'filters': ['docs', 'blog'"
+    expected_arguments = {"query": "crewai", "filters": ["docs", "blog"]}
+
+    arguments = tool_usage._validate_tool_input(tool_input)
+    assert arguments == expected_arguments
+
+
+def test_validate_tool_input_emits_repair_event():
+    mock_agent = MagicMock()
+    mock_agent.key = "test_agent_key"
+    mock_agent.role = "test_agent_role"
+    mock_agent.i18n = MagicMock()
+    mock_agent.verbose = False
+
+    mock_action = MagicMock()
+    mock_action.tool = "test_tool"
+    mock_action.tool_input = "{'key': 'value', number: 42,}"
+
+    tool_usage = ToolUsage(
+        tools_handler=MagicMock(),
+        tools=[],
+        task=MagicMock(),
+        function_calling_llm=None,
+        agent=mock_agent,
+        action=mock_action,
+    )
+
+    received_events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(ToolInputRepairedEvent)
+        def event_handler(source, event):
+            received_events.append(event)
+
+        arguments = tool_usage._validate_tool_input(mock_action.tool_input)
+        assert arguments == {"key": "value", "number": 42}
+
+        tool_usage._validate_tool_input('{"key": "value"}')
+
+    assert len(received_events) == 1
+    assert received_events[0].tool_name == "test_tool"
+    assert received_events[0].repairs == [
+        "single_quotes",
+        "unquoted_keys",
+        "trailing_commas",
+    ]
+
+
+def test_tool_timeout_returns_observation_and_emits_event():
+    class SlowTool(BaseTool):
+        name: str = "Slow Tool"
+        description: str = "A tool that hangs"
+        timeout: float = 0.1
+
+        def _run(self, query: str) -> str:
+            time.sleep(5)
+            return "too late"
+
+    structured_tool = SlowTool().to_structured_tool()
+    mock_task = MagicMock()
+    mock_task.delegations = 0
+    tool_usage = ToolUsage(
+        tools_handler=None,
+        tools=[structured_tool],
+        task=mock_task,
+        function_calling_llm=None,
+        agent=None,
+        action=MagicMock(),
+        default_tool_timeout=30,
+    )
+    calling = ToolCalling(tool_name="Slow Tool", arguments={"query": "x"})
+
+    received_events = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(ToolUsageTimeoutEvent)
+        def event_handler(source, event):
+            received_events.append(event)
+
+        started = time.monotonic()
+        result = tool_usage.use(calling, "Action: Slow Tool")
+
+    assert time.monotonic() - started < 2
+    assert "did not finish within 0.1 seconds" in result
+    assert len(received_events) == 1
+    assert received_events[0].tool_name == "Slow Tool"
+    assert received_events[0].timeout == 0.1
+    mock_task.increment_tools_errors.assert_called_once()
@@ -6,7 +6,9 @@ import pytest
 from crewai.utilities.chromadb import (
     MAX_COLLECTION_LENGTH,
     MIN_COLLECTION_LENGTH,
+    get_chroma_client,
     is_ipv4_pattern,
+    release_chroma_client,
     sanitize_collection_name,
 )
 
@@ -79,3 +81,12 @@ class TestChromadbUtils(unittest.TestCase):
             self.assertLessEqual(len(sanitized), MAX_COLLECTION_LENGTH)
             self.assertTrue(sanitized[0].isalnum())
             self.assertTrue(sanitized[-1].isalnum())
+
+
+def test_chroma_clients_are_shared_per_path(tmp_path):
+    path = str(tmp_path / "knowledge")
+    client = get_chroma_client(path)
+
+    assert get_chroma_client(str(tmp_path / "." / "knowledge")) is client
+    release_chroma_client(path)
+    assert get_chroma_client(path) is not client
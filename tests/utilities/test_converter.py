@@ -13,9 +13,12 @@ from crewai.utilities.converter import (
     convert_to_model,
     convert_with_instructions,
     create_converter,
+    extract_model_locally,
     generate_model_description,
     get_conversion_instructions,
+    get_conversion_stats,
     handle_partial_json,
+    reset_conversion_stats,
     validate_model,
 )
 from crewai.utilities.pydantic_schema_parser import PydanticSchemaParser
@@ -609,3 +612,103 @@ def test_generate_model_description_union_field():
     description = generate_model_description(UnionModel)
     expected_description = '{\n  "field": int | str | None\n}'
     assert description == expected_description
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        'Here you go:\n```json\n{"name": "Fenced", "age": 30}\n```',
+        'Draft {"name": "x"} final {"name": "Fenced", "age": 30, "note": "{}"} done',
+        '{"name": "Fenced", "age": "30"',
+        "{'name': 'Fenced', 'age': 30,}",
+        '[{"name": "Fenced", "age": 30}]',
+        '{"SimpleModel": {"name": "Fenced", "age": 30}}',
+    ],
+)
+def test_extract_model_locally(text):
+    output = extract_model_locally(text, SimpleModel)
+    assert output == SimpleModel(name="Fenced", age=30)
+
+
+def test_extract_model_locally_returns_none_without_valid_instance():
+    assert extract_model_locally("Name: Alice, Age: 30", SimpleModel) is None
+    assert extract_model_locally('{"name": "Alice", "age": "old"}', SimpleModel) is None
+
+
+def test_handle_partial_json_skips_the_llm_for_truncated_output(mock_agent):
+    reset_conversion_stats()
+    with patch("crewai.utilities.converter.convert_with_instructions") as mock_convert:
+        output = handle_partial_json(
+            'Answer: {"name": "Trunc", "age": 41', SimpleModel, True, mock_agent
+        )
+
+    mock_convert.assert_not_called()
+    assert output == {"name": "Trunc", "age": 41}
+    assert get_conversion_stats().local == 1
+
+
+def test_conversion_stats_track_local_and_llm_conversions():
+    reset_conversion_stats()
+    convert_to_model('{"name": "John", "age": 30}', SimpleModel, None, None)
+
+    llm = Mock(spec=LLM)
+    llm.supports_function_calling.return_value = False
+    llm.call.return_value = '{"name": "Alice", "age": 30}'
+    Converter(
+        llm=llm, text="Name: Alice, Age: 30", model=SimpleModel, instructions=""
+    ).to_pydantic()
+
+    stats = get_conversion_stats()
+    assert (stats.local, stats.llm) == (1, 1)
+    assert stats.local_ratio == 0.5
+
+
+def test_converter_skips_the_llm_when_text_is_already_valid():
+    llm = Mock(spec=LLM)
+    converter = Converter(
+        llm=llm,
+        text='```json\n{"name": "Local", "age": 3}\n```',
+        model=SimpleModel,
+        instructions="",
+    )
+
+    assert converter.to_pydantic() == SimpleModel(name="Local", age=3)
+    llm.call.assert_not_called()
+
+
+def test_schema_descriptions_are_cached_per_model():
+    class CachedModel(BaseModel):
+        name: str
+
+    assert generate_model_description(CachedModel) is generate_model_description(
+        CachedModel
+    )
+    parser = PydanticSchemaParser(model=CachedModel)
+    with patch.object(
+        PydanticSchemaParser, "_get_model_schema", return_value="changed"
+    ) as mock_schema:
+        first = parser.get_schema()
+        second = PydanticSchemaParser(model=CachedModel).get_schema()
+    assert first == second
+    assert mock_schema.call_count == 1
+
+
+def test_handle_partial_json_extracts_locally_once_before_the_llm(mock_agent):
+    llm = Mock(spec=LLM)
+    llm.supports_function_calling.return_value = False
+    llm.call.return_value = '{"name": "Alice", "age": 30}'
+    mock_agent.get_output_converter.side_effect = lambda **kwargs: Converter(**kwargs)
+    mock_agent.llm = llm
+
+    with patch(
+        "crewai.utilities.converter.extract_model_locally",
+        wraps=extract_model_locally,
+    ) as mock_extract:
+        output = handle_partial_json(
+            "Name: Alice, Age: 30", SimpleModel, False, mock_agent
+        )
+
+    assert output == SimpleModel(name="Alice", age=30)
+    texts = [call.args[0] for call in mock_extract.call_args_list]
+    assert texts.count("Name: Alice, Age: 30") == 1
+    llm.call.assert_called_once()
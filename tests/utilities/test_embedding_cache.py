@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities.embedding_cache import (
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    EmbeddingDiskStore,
+    config_digest,
+)
+from crewai.utilities.embedding_configurator import EmbeddingConfigurator
+
+
+class CountingEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [np.array([len(text), 1.0, 0.5], dtype=np.float32) for text in input]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbeddingFunction()
+
+
+def test_only_misses_reach_the_provider(embedder):
+    cache = EmbeddingCache(mode="memory")
+    cached = CachedEmbeddingFunction(embedder, {"provider": "test"}, cache=cache)
+
+    first = cached(["a", "bb"])
+    second = cached(["bb", "ccc", "ccc"])
+
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+    np.testing.assert_array_equal(first[1], second[0])
+    assert [vector[0] for vector in second] == [2.0, 3.0, 3.0]
+    stats = cache.stats
+    assert (stats.memory_hits, stats.disk_hits, stats.misses) == (1, 0, 3)
+    assert stats.hit_ratio == pytest.approx(0.25)
+
+
+def test_configs_do_not_share_embeddings(embedder):
+    cache = EmbeddingCache(mode="memory")
+    CachedEmbeddingFunction(embedder, {"model": "a"}, cache=cache)(["text"])
+    CachedEmbeddingFunction(embedder, {"model": "b"}, cache=cache)(["text"])
+
+    assert embedder.calls == [["text"], ["text"]]
+
+
+def test_lru_evicts_oldest_entries(embedder):
+    cache = EmbeddingCache(mode="memory", max_entries=2)
+    cached = CachedEmbeddingFunction(embedder, None, cache=cache)
+
+    cached(["a", "b", "c"])
+    cached(["a"])
+
+    assert embedder.calls == [["a", "b", "c"], ["a"]]
+
+
+def test_disk_store_survives_a_new_process(embedder):
+    CachedEmbeddingFunction(embedder, None, cache=EmbeddingCache(mode="disk"))(
+        ["persisted", "also persisted"]
+    )
+
+    fresh = EmbeddingCache(mode="disk")
+    result = CachedEmbeddingFunction(embedder, None, cache=fresh)(["persisted"])
+
+    assert embedder.calls == [["persisted", "also persisted"]]
+    assert result[0][0] == 9.0
+    assert fresh.stats.disk_hits == 1
+
+
+def test_disk_store_appends_rows(tmp_path):
+    store = EmbeddingDiskStore(str(tmp_path), dtype="float16")
+    store.put_many("ns", {"a": np.array([1.0, 2.0]), "b": np.array([3.0, 4.0])})
+    store.put_many("ns", {"b": np.array([9.0, 9.0]), "c": np.array([5.0, 6.0])})
+
+    found = store.get_many("ns", ["a", "b", "c", "missing"])
+
+    assert set(found) == {"a", "b", "c"}
+    np.testing.assert_array_equal(found["b"], [3.0, 4.0])
+    np.testing.assert_array_equal(found["c"], [5.0, 6.0])
+    assert found["c"].dtype == np.float32
+    assert (tmp_path / "ns.float16").stat().st_size == 3 * 2 * 2
+
+
+def test_disk_errors_fall_back_to_the_provider(embedder):
+    cache = EmbeddingCache(mode="disk")
+    cached = CachedEmbeddingFunction(embedder, None, cache=cache)
+    with patch.object(EmbeddingDiskStore, "get_many", side_effect=OSError("boom")):
+        result = cached(["text"])
+
+    assert embedder.calls == [["text"]]
+    assert result[0][0] == 4.0
+
+
+def test_custom_embedders_are_not_persisted():
+    _, stable = config_digest({"provider": "custom", "config": {"fn": object()}})
+    assert not stable
+    assert config_digest({"provider": "openai"})[1]
+
+
+def test_wrapper_delegates_chroma_metadata():
+    embedder = EmbeddingConfigurator().configure_embedder(
+        {"provider": "openai", "config": {"api_key": "fake"}}
+    )
+
+    assert isinstance(embedder, CachedEmbeddingFunction)
+    assert embedder.name() == "openai"
+    assert embedder.get_config() == embedder.embedding_function.get_config()
+    assert embedder.supported_spaces() == embedder.embedding_function.supported_spaces()
+
+
+def test_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("CREWAI_EMBEDDING_CACHE", "off")
+    with patch("crewai.utilities.embedding_cache._default_cache", None):
+        embedder = EmbeddingConfigurator().configure_embedder(
+            {"provider": "openai", "config": {"api_key": "fake"}}
+        )
+
+    assert not isinstance(embedder, CachedEmbeddingFunction)
@@ -0,0 +1,163 @@
+import sqlite3
+import threading
+
+import pytest
+
+from crewai.memory.storage.kickoff_task_outputs_storage import (
+    KickoffTaskOutputsSQLiteStorage,
+)
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.utilities.sqlite_pool import SQLiteConnectionPool, get_sqlite_pool
+
+
+def _indexes(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return {
+            row[1] for row in conn.execute(f"PRAGMA index_list({table})").fetchall()
+        }
+
+
+def test_connections_are_reused_per_thread(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "test.db"))
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert pool.connection() is pool.connection()
+    assert other[0] is not pool.connection()
+    assert pool.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert pool.connection().execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_connections_of_exited_threads_are_closed(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "test.db"))
+    opened = []
+
+    def connect():
+        opened.append(pool.connection())
+
+    threads = [threading.Thread(target=connect) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for _ in range(10):
+        thread = threading.Thread(target=connect)
+        thread.start()
+        thread.join()
+
+    assert len(pool._connections) == 2
+    for conn in opened[:-1]:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert pool.connection().execute("SELECT 1").fetchone() == (1,)
+
+
+def test_migrations_run_once_and_in_order(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    migrations = [
+        "CREATE TABLE items (name TEXT); INSERT INTO items VALUES ('first');",
+        """
+        CREATE TRIGGER items_copy AFTER INSERT ON items BEGIN
+            INSERT INTO items_log VALUES (new.name);
+        END;
+        CREATE TABLE items_log (name TEXT);
+        """,
+    ]
+    SQLiteConnectionPool(db_path, migrations[:1])
+    pool = SQLiteConnectionPool(db_path, migrations)
+    SQLiteConnectionPool(db_path, migrations)
+
+    with pool.transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('second')")
+
+    conn = pool.connection()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+    assert conn.execute("SELECT name FROM items_log").fetchall() == [("second",)]
+
+
+def test_failed_transaction_rolls_back(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "test.db"), ["CREATE TABLE t (x)"])
+    try:
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert pool.connection().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_storages_on_the_same_file_share_a_pool(tmp_path):
+    db_path = str(tmp_path / "ltm.db")
+    first, second = LTMSQLiteStorage(db_path), LTMSQLiteStorage(db_path)
+
+    assert first.pool is second.pool is get_sqlite_pool(db_path)
+
+
+def test_ltm_storage_is_indexed_on_task_description(tmp_path):
+    db_path = str(tmp_path / "ltm.db")
+    storage = LTMSQLiteStorage(db_path)
+    for score in (3, 1, 2):
+        storage.save("task", {"score": score}, "2025-01-01", score)
+
+    assert "idx_long_term_memories_task" in _indexes(db_path, "long_term_memories")
+    assert [row["score"] for row in storage.load("task", 2)] == [1, 2]
+    plan = (
+        storage.pool.connection()
+        .execute(
+            "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+            "WHERE task_description = ? ORDER BY datetime DESC, score ASC",
+            ("task",),
+        )
+        .fetchall()
+    )
+    assert "USING INDEX idx_long_term_memories_task" in plan[0][3]
+
+
+def test_legacy_ltm_database_is_upgraded(tmp_path):
+    db_path = str(tmp_path / "ltm.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE long_term_memories (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "task_description TEXT, metadata TEXT, datetime TEXT, score REAL)"
+        )
+        conn.execute(
+            "INSERT INTO long_term_memories (task_description, metadata, datetime, score) "
+            "VALUES ('task', '{}', '2024-01-01', 1)"
+        )
+
+    storage = LTMSQLiteStorage(db_path)
+
+    assert storage.load("task", 1) == [
+        {"metadata": {}, "datetime": "2024-01-01", "score": 1}
+    ]
+    assert "idx_long_term_memories_task" in _indexes(db_path, "long_term_memories")
+
+
+def test_columns_added_before_versioning_are_kept(tmp_path):
+    db_path = str(tmp_path / "ltm.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE long_term_memories (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "task_description TEXT, metadata TEXT, datetime TEXT, score REAL, "
+            "embedding BLOB, content_hash TEXT)"
+        )
+
+    storage = LTMSQLiteStorage(db_path)
+    storage.save("task", {}, "2024-01-01", 1)
+
+    assert storage.load("task", 1) == [
+        {"metadata": {}, "datetime": "2024-01-01", "score": 1}
+    ]
+
+
+def test_kickoff_outputs_are_indexed_on_task_index(tmp_path):
+    db_path = str(tmp_path / "outputs.db")
+    KickoffTaskOutputsSQLiteStorage(db_path)
+
+    assert "idx_latest_kickoff_task_outputs_task_index" in _indexes(
+        db_path, "latest_kickoff_task_outputs"
+    )
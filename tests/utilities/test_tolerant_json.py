@@ -0,0 +1,57 @@
+import pytest
+
+from crewai.utilities.tolerant_json import (
+    TolerantJSONParseError,
+    parse_tolerant_json,
+)
+
+
+def test_valid_json_needs_no_repairs():
+    result = parse_tolerant_json('{"a": [1, 2.5, true, null], "b": "x"}')
+
+    assert result.value == {"a": [1, 2.5, True, None], "b": "x"}
+    assert result.repairs == []
+
+
+@pytest.mark.parametrize(
+    "text, expected, repair",
+    [
+        ("{'a': 'b'}", {"a": "b"}, "single_quotes"),
+        ('{"a": True, "b": None}', {"a": True, "b": None}, "python_literals"),
+        ('{"a": (1, 2)}', {"a": (1, 2)}, "python_literals"),
+        ("{a: 1, b_c: 2}", {"a": 1, "b_c": 2}, "unquoted_keys"),
+        ('{"a": [1, 2,],}', {"a": [1, 2]}, "trailing_commas"),
+        ('{"a": 1 "b": 2}', {"a": 1, "b": 2}, "missing_commas"),
+        ('{"a": [1, 2', {"a": [1, 2]}, "missing_closers"),
+        ('{"a": "unfinished', {"a": "unfinished"}, "unterminated_string"),
+        ('{"a": 1, // note\n "b": 2 /* x */}', {"a": 1, "b": 2}, "comments"),
+        ('{"a": "line\nbreak"}', {"a": "line\nbreak"}, "control_characters"),
+        ('{"a": 0x1F}', {"a": 31}, "hex_numbers"),
+        ('{"a": .5, "b": +1}', {"a": 0.5, "b": 1}, "lenient_numbers"),
+        ('{"a": "\\d"}', {"a": "\\d"}, "invalid_escapes"),
+    ],
+)
+def test_repairs(text, expected, repair):
+    result = parse_tolerant_json(text)
+
+    assert result.value == expected
+    assert repair in result.repairs
+
+
+def test_truncated_object_drops_dangling_key():
+    result = parse_tolerant_json('{"a": 1, "b":')
+
+    assert result.value == {"a": 1}
+    assert "missing_closers" in result.repairs
+
+
+def test_unicode_escapes_in_repaired_input():
+    result = parse_tolerant_json("{'a': '\\u00e9\\ud83d\\ude00'}")
+
+    assert result.value == {"a": "é\U0001f600"}
+
+
+@pytest.mark.parametrize("text", ["", "   ", "{} extra", "[1,, 2]", "{'a' 1}"])
+def test_unparseable_input_raises(text):
+    with pytest.raises(TolerantJSONParseError):
+        parse_tolerant_json(text)